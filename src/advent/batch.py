@@ -0,0 +1,144 @@
+"""Run many days and parts at once across a pool of processes."""
+from multiprocessing import Pool
+import time
+import traceback
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from advent.registry import registry, SolverKey
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore
+
+
+class JobResult(NamedTuple):
+    """The outcome of solving one day and part."""
+
+    day: int
+    part: int
+    result: Any
+    seconds: float
+    peak_rss_kb: Optional[int]
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the solver finished without raising.
+
+        Returns
+        -------
+        bool
+            True if there was no error
+        """
+        return self.error is None
+
+
+def _peak_rss_kb() -> Optional[int]:
+    """Get the peak resident set size of the current process.
+
+    This is the high water mark over the whole life of the process, so it's
+    only the peak of a job if the process runs nothing else.
+
+    Returns
+    -------
+    Optional[int]
+        Peak RSS in kilobytes, or None if the platform can't report it
+    """
+    if resource is None:  # pragma: no cover
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run_job(day: int, part: int) -> JobResult:
+    """Solve a single day and part, timing it and catching any error.
+
+    Parameters
+    ----------
+    day: int
+        Challenge day
+    part: int
+        Challenge part
+
+    Returns
+    -------
+    JobResult
+        The answer along with wall time and the worker's peak RSS
+    """
+    start: float = time.perf_counter()
+    try:
+        result: Any = registry.solve(day, part)
+        error: Optional[str] = None
+    except Exception:
+        result = None
+        error = traceback.format_exc(limit=1).strip().splitlines()[-1]
+    seconds: float = time.perf_counter() - start
+    return JobResult(day, part, result, seconds, _peak_rss_kb(), error)
+
+
+def available_jobs(days: Iterable[int], parts: Iterable[int]) -> Iterator[SolverKey]:
+    """Yield the (day, part) pairs that have a solver that runs on its own.
+
+    Solvers that need their puzzle input passed as arguments, like day 25's,
+    are left out since there's nothing to call them with.
+
+    Parameters
+    ----------
+    days: Iterable[int]
+        Days to consider
+    parts: Iterable[int]
+        Parts to consider for each day
+
+    Yields
+    ------
+    SolverKey
+        Each (day, part) pair with a solver that takes no arguments
+    """
+    part_list: Tuple[int, ...] = tuple(parts)
+    for day in days:
+        for part in part_list:
+            if (day, part) in registry and registry.runs_alone(day, part):
+                yield day, part
+
+
+def _run_key(key: SolverKey) -> JobResult:
+    """Solve a (day, part) pair, for pools that pass a single argument.
+
+    Parameters
+    ----------
+    key: SolverKey
+        The (day, part) pair to solve
+
+    Returns
+    -------
+    JobResult
+        The answer along with wall time and peak RSS
+    """
+    return run_job(*key)
+
+
+def run_all(
+    jobs: Iterable[SolverKey], max_workers: Optional[int] = None
+) -> Iterator[JobResult]:
+    """Solve a set of days and parts in parallel.
+
+    Every job gets a fresh worker process, so its peak RSS is its own rather
+    than the worst of every job the worker ran before. The jobs are listed
+    before the pool starts, since finding them can import day modules, and a
+    worker forked partway through an import deadlocks.
+
+    Parameters
+    ----------
+    jobs: Iterable[SolverKey]
+        The (day, part) pairs to solve
+    max_workers: int, optional
+        Number of worker processes, defaults to the number of CPUs
+
+    Yields
+    ------
+    JobResult
+        Results in the order the jobs finish
+    """
+    job_list: List[SolverKey] = list(jobs)
+    with Pool(max_workers, maxtasksperchild=1) as pool:
+        yield from pool.imap_unordered(_run_key, job_list)
@@ -0,0 +1,252 @@
+"""Benchmark the solvers and check them against a saved baseline.
+
+Every file based solver is timed against its day's ``example.txt`` and
+``input.txt``, and solvers with their puzzle input built into their arguments
+are timed on that default input. Results are keyed like
+``day07/part2/input.txt`` or ``day15/part1/default`` so they can be written to
+a JSON baseline and compared on later runs.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import statistics
+import time
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Tuple, Union
+
+from advent.registry import registry
+
+DAYS: range = range(1, 26)
+FILENAMES: Tuple[str, ...] = ("example.txt", "input.txt")
+# Stands in for the filename of solvers run with their default arguments
+DEFAULT_INPUT: str = "default"
+
+# Cases that don't make sense to time
+SKIP: FrozenSet[Tuple[int, int, str]] = frozenset(
+    {
+        # The example uses a preamble of 5 instead of 25
+        (9, 1, "example.txt"),
+        (9, 2, "example.txt"),
+        # The part 1 example has too many floating bits to solve part 2
+        (14, 2, "example.txt"),
+    }
+)
+
+
+class BenchCase(NamedTuple):
+    """A solver and the input file to time it on, or DEFAULT_INPUT."""
+
+    day: int
+    part: int
+    filename: str
+
+    @property
+    def key(self) -> str:
+        """Identify the case in a baseline.
+
+        Returns
+        -------
+        str
+            e.g. day07/part2/input.txt
+        """
+        return f"day{self.day:02}/part{self.part}/{self.filename}"
+
+
+class Timing(NamedTuple):
+    """Summary of repeated timings of a case, all in seconds."""
+
+    median: float
+    stdev: float
+    minimum: float
+    maximum: float
+    runs: int
+
+    @staticmethod
+    def from_samples(samples: List[float]) -> Timing:
+        """Summarise a list of timings.
+
+        Parameters
+        ----------
+        samples: List[float]
+            Wall time of each run in seconds
+
+        Returns
+        -------
+        Timing
+            The summary statistics of the runs
+        """
+        return Timing(
+            median=statistics.median(samples),
+            stdev=statistics.pstdev(samples),
+            minimum=min(samples),
+            maximum=max(samples),
+            runs=len(samples),
+        )
+
+
+class Regression(NamedTuple):
+    """A case that got slower than its baseline allows."""
+
+    key: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """How many times slower the current median is.
+
+        Returns
+        -------
+        float
+            current / baseline
+        """
+        return self.current / self.baseline
+
+
+def discover_cases(
+    days: Iterable[int] = DAYS,
+    parts: Iterable[int] = (1, 2),
+    filenames: Iterable[str] = FILENAMES,
+) -> Iterator[BenchCase]:
+    """Find every solver and input file pair to benchmark.
+
+    Parameters
+    ----------
+    days: Iterable[int]
+        Days to look at
+    parts: Iterable[int]
+        Parts to look at for each day
+    filenames: Iterable[str]
+        Input files to look for in each day's folder
+
+    Yields
+    ------
+    BenchCase
+        Each case where both the solver and the input file exist, then one for
+        each solver that doesn't read a file but can run with no arguments
+    """
+    here: Path = Path(__file__).resolve().parent
+    part_list: Tuple[int, ...] = tuple(parts)
+    file_list: Tuple[str, ...] = tuple(filenames)
+    for day in days:
+        solvers: List[int] = [part for part in part_list if (day, part) in registry]
+        for filename in file_list:
+            if not (here / f"day{day:02}" / filename).exists():
+                continue
+            for part in solvers:
+                if (day, part, filename) in SKIP or not registry.reads_input(day, part):
+                    continue
+                yield BenchCase(day, part, filename)
+        for part in solvers:
+            if not registry.reads_input(day, part) and registry.runs_alone(day, part):
+                yield BenchCase(day, part, DEFAULT_INPUT)
+
+
+def time_case(case: BenchCase, repeat: int = 5) -> Timing:
+    """Time a solver on an input file, or its default input, several times.
+
+    Parameters
+    ----------
+    case: BenchCase
+        The solver and input to time
+    repeat: int
+        How many times to run it
+
+    Returns
+    -------
+    Timing
+        Summary of the run times
+    """
+    samples: List[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        if case.filename == DEFAULT_INPUT:
+            registry.solve(case.day, case.part)
+        else:
+            registry.solve(case.day, case.part, case.filename)
+        samples.append(time.perf_counter() - start)
+    return Timing.from_samples(samples)
+
+
+def run_benchmarks(cases: Iterable[BenchCase], repeat: int = 5) -> Dict[str, Timing]:
+    """Time a set of cases.
+
+    Parameters
+    ----------
+    cases: Iterable[BenchCase]
+        The cases to time
+    repeat: int
+        How many times to run each case
+
+    Returns
+    -------
+    Dict[str, Timing]
+        Timings keyed by case
+    """
+    return {case.key: time_case(case, repeat) for case in cases}
+
+
+def save_baseline(timings: Dict[str, Timing], path: Union[str, Path]) -> None:
+    """Write timings to a JSON baseline file.
+
+    Parameters
+    ----------
+    timings: Dict[str, Timing]
+        Timings keyed by case
+    path: str or Path
+        Where to write the baseline
+    """
+    with open(path, "w") as f:
+        json.dump(
+            {key: timing._asdict() for key, timing in timings.items()},
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+def load_baseline(path: Union[str, Path]) -> Dict[str, Timing]:
+    """Read timings from a JSON baseline file.
+
+    Parameters
+    ----------
+    path: str or Path
+        The baseline to read
+
+    Returns
+    -------
+    Dict[str, Timing]
+        Timings keyed by case
+    """
+    with open(path, "r") as f:
+        return {key: Timing(**timing) for key, timing in json.load(f).items()}
+
+
+def find_regressions(
+    baseline: Dict[str, Timing], current: Dict[str, Timing], threshold: float = 0.2
+) -> List[Regression]:
+    """Compare timings to a baseline and flag the ones that slowed down.
+
+    Cases missing from either side are ignored.
+
+    Parameters
+    ----------
+    baseline: Dict[str, Timing]
+        The reference timings
+    current: Dict[str, Timing]
+        The timings to check
+    threshold: float
+        Allowed slowdown of the median as a fraction, 0.2 means 20% slower
+
+    Returns
+    -------
+    List[Regression]
+        Every case slower than its baseline by more than the threshold
+    """
+    regressions: List[Regression] = []
+    for key in sorted(baseline.keys() & current.keys()):
+        old: float = baseline[key].median
+        new: float = current[key].median
+        if new > old * (1 + threshold):
+            regressions.append(Regression(key, old, new))
+    return regressions
@@ -2,8 +2,15 @@
 
 https://www.pluralsight.com/tech-blog/python-cli-utilities-with-poetry-and-typer/
 """
+from pathlib import Path
+from typing import Dict, List, Optional
+
 import typer
 
+from advent import bench, profiling, synth
+from advent.batch import available_jobs, run_all as run_jobs
+from advent.registry import registry, Solver
+
 app = typer.Typer()
 
 
@@ -11,18 +18,120 @@ app = typer.Typer()
 def run_day(
     day: int = typer.Argument(..., help="Challenge day", min=0, max=25),
     part: int = typer.Argument(..., help="Challenge part", min=1, max=2),
+    profile: bool = typer.Option(
+        False, "--profile", help="Run under cProfile and report the hot spots"
+    ),
+    trace_allocs: bool = typer.Option(
+        False, "--trace-allocs", help="Run under tracemalloc and report allocations"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, help="Write the raw pstats data or tracemalloc snapshot here"
+    ),
+    top: int = typer.Option(25, help="Number of lines in the profile report"),
 ) -> None:
     """Call part 1 or 2 of a day's challenge."""
     module = f"day{day:02}"
     partfunc = f"part{part}"
+    if profile and trace_allocs:
+        typer.echo("Use only one of --profile and --trace-allocs")
+        raise typer.Exit(code=1)
     try:
-        exec(f"from .{module}.main import {partfunc}")
+        solver: Solver = registry.get(day, part)
     except ImportError:
         typer.echo(f"Couldn't import {partfunc} from {module}.main")
         raise typer.Exit(code=1)
     typer.echo(f"Day: {module} Part: {partfunc}")
-    result = eval(f"{partfunc}()")
+    scope = f"advent.{module}"
+    if profile:
+        result, report = profiling.profile(solver, scope, output, top)
+    elif trace_allocs:
+        result, report = profiling.trace_allocations(solver, scope, output, top)
+    else:
+        result, report = solver(), None
     typer.echo(result)
+    if report is not None:
+        typer.echo(report)
+
+
+@app.command()
+def run_all(
+    days: Optional[List[int]] = typer.Option(
+        None, "--day", "-d", help="Challenge day, can be repeated, defaults to all"
+    ),
+    parts: Optional[List[int]] = typer.Option(
+        None, "--part", "-p", help="Challenge part, can be repeated, defaults to both"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, help="Number of worker processes, defaults to the number of CPUs"
+    ),
+) -> None:
+    """Solve many days and parts in parallel, reporting each as it finishes."""
+    failed: bool = False
+    jobs = available_jobs(days or range(1, 26), parts or (1, 2))
+    for job in run_jobs(jobs, max_workers=workers):
+        stats = f"{job.seconds:.3f}s, peak RSS {job.peak_rss_kb} KB"
+        if job.ok:
+            typer.echo(f"Day: day{job.day:02} Part: part{job.part} ({stats})")
+            typer.echo(job.result)
+        else:
+            failed = True
+            typer.echo(f"Day: day{job.day:02} Part: part{job.part} failed ({stats})")
+            typer.echo(job.error)
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@app.command(name="bench")
+def run_bench(
+    baseline: Path = typer.Option(
+        Path("bench_baseline.json"), help="JSON baseline to compare against"
+    ),
+    save: bool = typer.Option(False, help="Overwrite the baseline with this run"),
+    threshold: float = typer.Option(
+        0.2, help="Allowed slowdown of the median, 0.2 means 20% slower"
+    ),
+    repeat: int = typer.Option(5, help="Number of timed runs per case", min=1),
+    days: Optional[List[int]] = typer.Option(
+        None, "--day", "-d", help="Challenge day, can be repeated, defaults to all"
+    ),
+) -> None:
+    """Time every solver on its example and input files."""
+    timings: Dict[str, bench.Timing] = {}
+    for case in bench.discover_cases(days or bench.DAYS):
+        timing = bench.time_case(case, repeat)
+        timings[case.key] = timing
+        typer.echo(
+            f"{case.key}: median {timing.median:.4f}s, stdev {timing.stdev:.4f}s"
+        )
+    if save:
+        bench.save_baseline(timings, baseline)
+        typer.echo(f"Saved baseline to {baseline}")
+        return
+    if not baseline.exists():
+        typer.echo(f"No baseline at {baseline}, run with --save to create one")
+        return
+    regressions = bench.find_regressions(
+        bench.load_baseline(baseline), timings, threshold
+    )
+    for regression in regressions:
+        typer.echo(
+            f"SLOWER {regression.key}: {regression.baseline:.4f}s -> "
+            f"{regression.current:.4f}s ({regression.ratio:.2f}x)"
+        )
+    if regressions:
+        raise typer.Exit(code=1)
+
+
+@app.command(name="synth")
+def run_synth(
+    day: int = typer.Argument(..., help="Challenge day", min=0, max=25),
+    size: int = typer.Argument(..., help="How big an input to make", min=1),
+    output: Path = typer.Argument(..., help="File to write the input to"),
+    seed: int = typer.Option(0, help="Random seed"),
+) -> None:
+    """Write a synthetic puzzle input for a day."""
+    synth.write_input(day, output, size, seed)
+    typer.echo(f"Wrote day{day:02} input of size {size} to {output}")
 
 
 def main() -> None:
@@ -1,9 +1,14 @@
 """Day 01 of the advent of code challenge."""
+from array import array
+from itertools import combinations
+from math import prod
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+from advent.io import read_ints
 
-def read_inputs(filename: str) -> List[int]:
+
+def read_inputs(filename: str) -> array:
     """Read in a text file of inputs.
 
     Parameters
@@ -13,80 +18,224 @@ def read_inputs(filename: str) -> List[int]:
 
     Returns
     -------
-    [int]
+    array
         All the inputs
     """
     here: Path = Path(__file__).resolve().parent
     in_path: Path = here / filename
-    with open(in_path, "r") as f:
-        return [int(line) for line in f.readlines()]
+    return read_ints(in_path)
+
+
+def _find_single(values: Sequence[int], target: int) -> Optional[Tuple[int, ...]]:
+    """Find an entry equal to the target.
+
+    Parameters
+    ----------
+    values: Sequence[int]
+        The expense report
+    target: int
+        What the entries should add up to
+
+    Returns
+    -------
+    Optional[Tuple[int, ...]]
+        The entries, or None if no combination adds up to the target
+    """
+    return (target,) if target in values else None
+
+
+def _find_pair(values: Sequence[int], target: int) -> Optional[Tuple[int, ...]]:
+    """Find two entries adding to the target in one pass with a hash set.
+
+    Parameters
+    ----------
+    values: Sequence[int]
+        The expense report
+    target: int
+        What the entries should add up to
+
+    Returns
+    -------
+    Optional[Tuple[int, ...]]
+        The entries, or None if no combination adds up to the target
+    """
+    seen: Set[int] = set()
+    for value in values:
+        if target - value in seen:
+            return target - value, value
+        seen.add(value)
+    return None
+
+
+def _find_trio(values: Sequence[int], target: int) -> Optional[Tuple[int, ...]]:
+    """Find three entries adding to the target with two pointers on a sort.
+
+    Parameters
+    ----------
+    values: Sequence[int]
+        The expense report
+    target: int
+        What the entries should add up to
 
+    Returns
+    -------
+    Optional[Tuple[int, ...]]
+        The entries, or None if no combination adds up to the target
+    """
+    sorted_values: List[int] = sorted(values)
+    n: int = len(sorted_values)
+    for low_index in range(n - 2):
+        low: int = sorted_values[low_index]
+        if low_index and low == sorted_values[low_index - 1]:
+            # Already tried everything starting with this value
+            continue
+        mid_index: int = low_index + 1
+        high_index: int = n - 1
+        while mid_index < high_index:
+            total: int = low + sorted_values[mid_index] + sorted_values[high_index]
+            if total == target:
+                return low, sorted_values[mid_index], sorted_values[high_index]
+            elif total < target:
+                mid_index += 1
+            else:
+                high_index -= 1
+    return None
 
-def part1(filename: str = "input.txt") -> int:
+
+def _meet_in_the_middle(
+    values: Sequence[int], target: int, k: int
+) -> Optional[Tuple[int, ...]]:
+    """Find k entries adding to the target by matching sums of two halves.
+
+    Every combination of entries is split so the left half's indices are all
+    below the right half's. Walking the first index of the right half upwards
+    and adding left halves as they become available means any left half in the
+    lookup is disjoint from the right half being checked, and each half only
+    needs k/2 entries.
+
+    Parameters
+    ----------
+    values: Sequence[int]
+        The expense report
+    target: int
+        What the entries should add up to
+    k: int
+        How many entries to add up
+
+    Returns
+    -------
+    Optional[Tuple[int, ...]]
+        The entries, or None if no combination adds up to the target
+    """
+    left_size: int = k // 2
+    right_size: int = k - left_size
+    n: int = len(values)
+    left_sums: Dict[int, Tuple[int, ...]] = dict()
+    for first in range(left_size, n - right_size + 1):
+        last: int = first - 1
+        for rest in combinations(range(last), left_size - 1):
+            left: Tuple[int, ...] = rest + (last,)
+            left_sums.setdefault(sum(values[i] for i in left), left)
+        for rest in combinations(range(first + 1, n), right_size - 1):
+            right: Tuple[int, ...] = (first,) + rest
+            wanted: int = target - sum(values[i] for i in right)
+            if wanted in left_sums:
+                return tuple(values[i] for i in left_sums[wanted] + right)
+    return None
+
+
+def find_k_sum(
+    values: Sequence[int], target: int = 2020, k: int = 2
+) -> Optional[Tuple[int, ...]]:
+    """Find k entries that add up to a target.
+
+    Each entry is used at most once, though equal values in different entries
+    can both be used. Pairs take one pass over a hash set, trios a sort and
+    two pointers for O(n^2), and anything bigger meets in the middle for
+    O(n^ceil(k/2)) time.
+
+    Parameters
+    ----------
+    values: Sequence[int]
+        The expense report, a list or a buffer from read_inputs
+    target: int
+        What the entries should add up to
+    k: int
+        How many entries to add up
+
+    Returns
+    -------
+    Optional[Tuple[int, ...]]
+        The k entries, or None if no combination adds up to the target
+
+    Raises
+    ------
+    ValueError
+        If k is less than 1
+    """
+    if k < 1:
+        raise ValueError(f"Need at least one entry to add up, got k={k}")
+    if k == 1:
+        return _find_single(values, target)
+    if k == 2:
+        return _find_pair(values, target)
+    if k == 3:
+        return _find_trio(values, target)
+    return _meet_in_the_middle(values, target, k)
+
+
+def k_sum_product(values: Sequence[int], target: int = 2020, k: int = 2) -> int:
+    """Multiply together the k entries that add up to a target.
+
+    Parameters
+    ----------
+    values: Sequence[int]
+        The expense report, a list or a buffer from read_inputs
+    target: int
+        What the entries should add up to
+    k: int
+        How many entries to add up
+
+    Returns
+    -------
+    int
+        The product of the entries, or -1 if there aren't any that add up
+    """
+    found: Optional[Tuple[int, ...]] = find_k_sum(values, target, k)
+    return -1 if found is None else prod(found)
+
+
+def part1(filename: str = "input.txt", target: int = 2020) -> int:
     """Solve part 1 of the challenge.
 
     Parameters
     ----------
     filename: str
         The name of the file, should be in the same folder as this module
+    target: int
+        What the pair should add up to
 
     Returns
     -------
     int
-        The product of the pair of numbers that add to 2020
+        The product of the pair of numbers that add to the target
     """
-    sorted_inputs: List[int] = sorted(read_inputs(filename))
-    low_index: int = 0
-    high_index: int = len(sorted_inputs) - 1
-    while low_index < high_index:
-        low: int = sorted_inputs[low_index]
-        high: int = sorted_inputs[high_index]
-        lh_sum: int = low + high
-        if lh_sum == 2020:
-            return low * high
-        elif lh_sum < 2020:
-            low_index += 1
-        else:
-            high_index -= 1
-    return -1
-
-
-def part2(filename: str = "input.txt") -> int:
+    return k_sum_product(read_inputs(filename), target, 2)
+
+
+def part2(filename: str = "input.txt", target: int = 2020) -> int:
     """Solve part 2 of the challenge.
 
     Parameters
     ----------
     filename: str
         The name of the file, should be in the same folder as this module
+    target: int
+        What the trio should add up to
 
     Returns
     -------
     int
-        The product of the trio of numbers that add to 2020
+        The product of the trio of numbers that add to the target
     """
-    sorted_inputs: List[int] = sorted(read_inputs(filename))
-    low_index: int = 0
-    mid_index: int = 1
-    high_index: int = len(sorted_inputs) - 1
-    while low_index < high_index:
-        mid_index = (high_index - low_index) // 2
-        low: int = sorted_inputs[low_index]
-        mid: int = sorted_inputs[mid_index]
-        high: int = sorted_inputs[high_index]
-        if low + mid + high == 2020:
-            return low * mid * high
-        elif low + mid + high < 2020:
-            while mid_index < high_index:
-                mid_index += 1
-                mid = sorted_inputs[mid_index]
-                if low + mid + high == 2020:
-                    return low * mid * high
-            low_index += 1
-        else:
-            while mid_index > low_index:
-                mid_index -= 1
-                mid = sorted_inputs[mid_index]
-                if low + mid + high == 2020:
-                    return low * mid * high
-            high_index -= 1
-    return -1
+    return k_sum_product(read_inputs(filename), target, 3)
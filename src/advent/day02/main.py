@@ -1,12 +1,49 @@
 """Day 02 of the advent of code challenge."""
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import re
-from typing import List, NamedTuple, Optional
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from advent.io import CHUNK_SIZE, parse_ints, read_chunks, read_lines
 
 Password = NamedTuple(
     "Password", [("lower", int), ("upper", int), ("character", str), ("password", str)]
 )
 
+LINE_RE: re.Pattern = re.compile(r"(\d*)-(\d*) (\w): (\w*)")
+# Bytes that \w matches in LINE_RE, for checking policy characters in bulk
+WORD_BYTES: np.ndarray = np.array(
+    [bool(re.fullmatch(rb"\w", bytes([byte]))) for byte in range(256)]
+)
+
+
+class PasswordBatch(NamedTuple):
+    """Many passwords and their rules stored column by column.
+
+    Passwords are stored back to back in one byte array, with where each one
+    starts and how long it is, so one long password doesn't make every row as
+    wide as it. Both policies can still be checked for every row at once.
+    """
+
+    lower: np.ndarray
+    upper: np.ndarray
+    character: np.ndarray
+    password: np.ndarray
+    start: np.ndarray
+    length: np.ndarray
+
+    def __len__(self) -> int:
+        """Count the passwords in the batch.
+
+        Returns
+        -------
+        int
+            The number of rows
+        """
+        return len(self.lower)
+
 
 def parse_line(line: str) -> Password:
     """Read a line from a text file and turn it into a Password tuple.
@@ -21,8 +58,7 @@ def parse_line(line: str) -> Password:
     Password:
         A named tuple of the input
     """
-    rgx: re.Pattern = re.compile(r"(\d*)-(\d*) (\w): (\w*)")
-    match: Optional[re.Match] = rgx.match(line)
+    match: Optional[re.Match] = LINE_RE.match(line)
     if match is None:
         raise ValueError("line could not be parsed")
     lower: str
@@ -87,8 +123,178 @@ def read_inputs(filename: str) -> List[Password]:
     """
     here: Path = Path(__file__).resolve().parent
     in_path: Path = here / filename
-    with open(in_path, "r") as f:
-        return [parse_line(line) for line in f.readlines()]
+    return [parse_line(line) for line in read_lines(in_path)]
+
+
+def parse_batch(text: bytes) -> PasswordBatch:
+    """Parse a block of lines into columns.
+
+    Rather than matching each line, the whole block is split on whitespace
+    once and each column is sliced out of the tokens and converted in bulk.
+
+    Parameters
+    ----------
+    text: bytes
+        Whole lines from an input file
+
+    Returns
+    -------
+    PasswordBatch
+        The parsed passwords and rules
+
+    Raises
+    ------
+    ValueError
+        If the lines aren't all in the "1-3 a: abcde" format
+    """
+    tokens: List[bytes] = text.split()
+    rows: int = len(tokens) // 3
+    if len(tokens) % 3:
+        raise ValueError("lines could not be parsed")
+    ranges: np.ndarray = parse_ints(
+        np.frombuffer(b" ".join(tokens[0::3]).replace(b"-", b" "), dtype=np.uint8)
+    )
+    # Each policy character token has to be exactly one word character and a colon
+    if any(len(token) != 2 for token in tokens[1::3]):
+        raise ValueError("lines could not be parsed")
+    characters: np.ndarray = np.frombuffer(b"".join(tokens[1::3]), dtype=np.uint8)
+    if (
+        len(ranges) != 2 * rows
+        or not WORD_BYTES[characters[0::2]].all()
+        or (characters[1::2] != ord(":")).any()
+    ):
+        raise ValueError("lines could not be parsed")
+    passwords: List[bytes] = tokens[2::3]
+    length: np.ndarray = np.fromiter(map(len, passwords), dtype=np.int64, count=rows)
+    return PasswordBatch(
+        lower=ranges[0::2],
+        upper=ranges[1::2],
+        character=characters[0::2],
+        password=np.frombuffer(b"".join(passwords), dtype=np.uint8),
+        start=np.cumsum(length) - length,
+        length=length,
+    )
+
+
+def validate_batch(batch: PasswordBatch) -> np.ndarray:
+    """Check every password in a batch against the part 1 policy.
+
+    Parameters
+    ----------
+    batch: PasswordBatch
+        The passwords and their rules
+
+    Returns
+    -------
+    np.ndarray
+        Whether each password is valid
+    """
+    found: np.ndarray = batch.password == np.repeat(batch.character, batch.length)
+    # Matches up to the start of each password, so each count is a difference
+    running: np.ndarray = np.concatenate(([0], np.cumsum(found)))
+    counts: np.ndarray = running[batch.start + batch.length] - running[batch.start]
+    return (batch.lower <= counts) & (counts <= batch.upper)
+
+
+def updated_validate_batch(batch: PasswordBatch) -> np.ndarray:
+    """Check every password in a batch against the part 2 policy.
+
+    Positions past the end of a password never match.
+
+    Parameters
+    ----------
+    batch: PasswordBatch
+        The passwords and their rules
+
+    Returns
+    -------
+    np.ndarray
+        Whether each password is valid
+    """
+    # A byte past the end so positions outside every password have somewhere
+    # to read from
+    padded: np.ndarray = np.append(batch.password, np.uint8(0))
+    end: int = len(batch.password)
+
+    def matches(position: np.ndarray) -> np.ndarray:
+        index: np.ndarray = position - 1
+        inside: np.ndarray = (index >= 0) & (index < batch.length)
+        found: np.ndarray = padded[np.where(inside, batch.start + index, end)]
+        return inside & (found == batch.character)
+
+    return matches(batch.lower) ^ matches(batch.upper)
+
+
+def count_valid_chunk(text: bytes) -> Tuple[int, int]:
+    """Count the passwords in a block of lines valid under each policy.
+
+    Parameters
+    ----------
+    text: bytes
+        Whole lines from an input file
+
+    Returns
+    -------
+    Tuple[int, int]
+        The counts valid under the part 1 and part 2 policies
+    """
+    batch: PasswordBatch = parse_batch(text)
+    return (
+        int(np.count_nonzero(validate_batch(batch))),
+        int(np.count_nonzero(updated_validate_batch(batch))),
+    )
+
+
+def count_valid(
+    filename: str = "input.txt",
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Tuple[int, int]:
+    """Count valid passwords under both policies in one pass over a file.
+
+    Parameters
+    ----------
+    filename: str
+        The name of the file in this directory to load
+    workers: int, optional
+        Check chunks in this many worker processes, by default all chunks are
+        checked in this process
+    chunk_size: int
+        Roughly how many bytes of the file to check at a time
+
+    Returns
+    -------
+    Tuple[int, int]
+        The counts valid under the part 1 and part 2 policies
+    """
+    in_path: Path = Path(__file__).resolve().parent / filename
+    chunks: Iterator[bytes] = read_chunks(in_path, chunk_size)
+    if workers is None:
+        counts: Iterable[Tuple[int, int]] = map(count_valid_chunk, chunks)
+        return _add_counts(counts)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _add_counts(executor.map(count_valid_chunk, chunks))
+
+
+def _add_counts(counts: Iterable[Tuple[int, int]]) -> Tuple[int, int]:
+    """Add up per chunk counts.
+
+    Parameters
+    ----------
+    counts: Iterable[Tuple[int, int]]
+        The part 1 and part 2 counts of each chunk
+
+    Returns
+    -------
+    Tuple[int, int]
+        The total part 1 and part 2 counts
+    """
+    total1: int = 0
+    total2: int = 0
+    for count1, count2 in counts:
+        total1 += count1
+        total2 += count2
+    return total1, total2
 
 
 def part1(filename: str = "input.txt") -> int:
@@ -104,7 +310,7 @@ def part1(filename: str = "input.txt") -> int:
     int
         The number of valid passwords
     """
-    return sum(validate_password(pwd) for pwd in read_inputs(filename))
+    return count_valid(filename)[0]
 
 
 def part2(filename: str = "input.txt") -> int:
@@ -120,4 +326,4 @@ def part2(filename: str = "input.txt") -> int:
     int
         The number of valid passwords
     """
-    return sum(updated_validate_password(pwd) for pwd in read_inputs(filename))
+    return count_valid(filename)[1]
@@ -1,72 +1,227 @@
 """Day 03 of the advent of code challenge."""
+from collections import defaultdict
+from itertools import islice
 import math
 from pathlib import Path
-from typing import List, Tuple
+from typing import DefaultDict, Iterable, Iterator, List, Sequence, Tuple
 
+import numpy as np
 
-def read_inputs(filename: str) -> List[List[bool]]:
-    """Read in and parse a text file of inputs.
+from advent.io import read_lines
+
+# (down, right) moves per step
+Slope = Tuple[int, int]
+
+# Map trees to 1 and open squares to 0 so a row can be read as binary
+TREE_BITS = str.maketrans("#.", "10")
+
+# Rows held in memory at a time by count_trees
+BLOCK_ROWS: int = 4096
+
+# The slopes checked for part 2
+SLOPES: Tuple[Slope, ...] = ((1, 1), (1, 3), (1, 5), (1, 7), (2, 1))
+
+
+def pack_row(line: str) -> int:
+    """Pack a row of the map into the bits of an int.
 
     Parameters
     ----------
-    filename: str
-        The name of the file in this directory to load
+    line: str
+        A row of ``.`` and ``#``
 
     Returns
     -------
-    List[List[bool]]
-        array of coordinates
+    int
+        The row with bit x set if there's a tree in column x
+    """
+    return int(line.translate(TREE_BITS)[::-1], 2)
+
+
+def read_inputs(filename: str) -> Iterator[Tuple[int, int]]:
+    """Read in and parse a text file of inputs a row at a time.
+
+    Parameters
+    ----------
+    filename: str
+        The name of the file in this directory to load
+
+    Yields
+    ------
+    Tuple[int, int]
+        Each row packed by pack_row and its width, skipping blank lines
     """
     here: Path = Path(__file__).resolve().parent
     in_path: Path = here / filename
-    with open(in_path, "r") as f:
-        return [[char == "#" for char in line] for line in f]
+    for line in read_lines(in_path):
+        if line:
+            yield pack_row(line), len(line)
+
+
+def _count_block_wide(
+    block: Sequence[Tuple[int, int]], first_y: int, slopes: Sequence[Slope]
+) -> List[int]:
+    """Count trees hit in a block of rows too wide to fit in 64 bits.
+
+    Parameters
+    ----------
+    block: Sequence[Tuple[int, int]]
+        Packed rows and their widths
+    first_y: int
+        How far down the map the block starts
+    slopes: Sequence[Slope]
+        (down, right) moves to follow from the top left
+
+    Returns
+    -------
+    List[int]
+        The trees hit in the block on each slope
+    """
+    by_down: DefaultDict[int, List[Tuple[int, int]]] = defaultdict(list)
+    for index, (down, right) in enumerate(slopes):
+        by_down[down].append((index, right))
+    trees: List[int] = [0] * len(slopes)
+    for y, (row, width) in enumerate(block, first_y):
+        for down, paths in by_down.items():
+            if y % down:
+                continue
+            step: int = y // down
+            for index, right in paths:
+                trees[index] += (row >> (step * right % width)) & 1
+    return trees
+
+
+def _count_block(
+    block: Sequence[Tuple[int, int]], first_y: int, slopes: Sequence[Slope]
+) -> List[int]:
+    """Count trees hit in a block of rows, checking each slope in bulk.
+
+    Parameters
+    ----------
+    block: Sequence[Tuple[int, int]]
+        Packed rows and their widths
+    first_y: int
+        How far down the map the block starts
+    slopes: Sequence[Slope]
+        (down, right) moves to follow from the top left
+
+    Returns
+    -------
+    List[int]
+        The trees hit in the block on each slope
+    """
+    packed, widths = zip(*block)
+    if max(widths) > 64:
+        return _count_block_wide(block, first_y, slopes)
+    rows: np.ndarray = np.array(packed, dtype=np.uint64)
+    width: np.ndarray = np.array(widths, dtype=np.int64)
+    trees: List[int] = []
+    for down, right in slopes:
+        # Rows in this block that the slope lands on
+        landed: np.ndarray = np.arange(-first_y % down, len(block), down)
+        steps: np.ndarray = (landed + first_y) // down
+        columns: np.ndarray = (steps * right % width[landed]).astype(np.uint64)
+        trees.append(int(((rows[landed] >> columns) & 1).sum()))
+    return trees
+
+
+def count_trees(
+    rows: Iterable[Tuple[int, int]],
+    slopes: Sequence[Slope],
+    block_rows: int = BLOCK_ROWS,
+) -> List[int]:
+    """Count the trees hit on every slope in a single pass over the rows.
+
+    Rows are only looked at once, a block at a time, so they can be streamed
+    from a map that doesn't fit in memory.
+
+    Parameters
+    ----------
+    rows: Iterable[Tuple[int, int]]
+        Packed rows and their widths, like read_inputs yields
+    slopes: Sequence[Slope]
+        (down, right) moves to follow from the top left
+    block_rows: int
+        How many rows to hold at a time
+
+    Returns
+    -------
+    List[int]
+        The trees hit on each slope, in the same order as slopes
+    """
+    trees: List[int] = [0] * len(slopes)
+    row_iter: Iterator[Tuple[int, int]] = iter(rows)
+    first_y: int = 0
+    while True:
+        block: List[Tuple[int, int]] = list(islice(row_iter, block_rows))
+        if not block:
+            return trees
+        for index, hit in enumerate(_count_block(block, first_y, slopes)):
+            trees[index] += hit
+        first_y += len(block)
 
 
 class Sledding:
     """Let's go sledding."""
 
     def __init__(self, filename: str = "input.txt") -> None:
-        self.grid = read_inputs(filename)
+        self.grid: List[Tuple[int, int]] = list(read_inputs(filename))
 
     def traverse(self, down: int = 1, right: int = 3) -> int:
         """Follow the grid.
-        
+
         Parameters
         ----------
         down: int
             How far to move down per step
         right: int
             How far to move to the right per step
-        
+
         Returns
         -------
         int
             The number of trees hit following that path.
         """
-        y: int = 0
-        x: int = 0
-        trees: int = 0
-        while y < len(self.grid):
-            if self.grid[y][x]:
-                trees += 1
-            x = (x + right) % (len(self.grid[y]) - 1)
-            y += down
-        return trees
+        return count_trees(self.grid, [(down, right)])[0]
 
     def part2(self) -> int:
         """Try some other paths.
-        
+
         Returns
         -------
         int
             The product of the trees hit in all slopes.
         """
-        slopes: Tuple[Tuple[int, int], ...] = (
-            (1, 1),
-            (1, 3),
-            (1, 5),
-            (1, 7),
-            (2, 1),
-        )
-        return math.prod(self.traverse(*path) for path in slopes)
+        return math.prod(count_trees(self.grid, SLOPES))
+
+
+def part1(filename: str = "input.txt") -> int:
+    """Solve part 1 of the challenge.
+
+    Parameters
+    ----------
+    filename: str
+        The name of the file in this directory to load
+
+    Returns
+    -------
+    int
+        The number of trees hit on the default slope
+    """
+    return count_trees(read_inputs(filename), [(1, 3)])[0]
+
+
+def part2(filename: str = "input.txt") -> int:
+    """Solve part 2 of the challenge.
+
+    Parameters
+    ----------
+    filename: str
+        The name of the file in this directory to load
+
+    Returns
+    -------
+    int
+        The product of the trees hit in all slopes
+    """
+    return math.prod(count_trees(read_inputs(filename), SLOPES))
@@ -1,46 +1,94 @@
 """Day 04 of the advent of code challenge."""
-from dataclasses import dataclass
+from collections import Counter
+from operator import attrgetter
 from pathlib import Path
 import re
-from typing import Any, Generator, List, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from advent.io import read_records
+
+# Every field a passport can have, in the order they're checked
+FIELDS: Tuple[str, ...] = ("byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid", "cid")
+REQUIRED: Tuple[str, ...] = FIELDS[:-1]
+
+Check = Callable[[str], bool]
 
 
-@dataclass
 class Passport:
-    """Class for the elements of a passport."""
-
-    byr: Union[int, None] = None
-    iyr: Union[int, None] = None
-    eyr: Union[int, None] = None
-    hgt: Union[str, None] = None
-    hcl: Union[str, None] = None
-    ecl: Union[str, None] = None
-    pid: Union[str, None] = None
-    cid: Union[str, None] = None
-
-    def __getitem__(self, item: str) -> Any:
+    """Class for the elements of a passport.
+
+    Fields are kept as the raw strings from the input, or None if missing.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(
+        self,
+        byr: Optional[str] = None,
+        iyr: Optional[str] = None,
+        eyr: Optional[str] = None,
+        hgt: Optional[str] = None,
+        hcl: Optional[str] = None,
+        ecl: Optional[str] = None,
+        pid: Optional[str] = None,
+        cid: Optional[str] = None,
+    ) -> None:
+        self.byr = byr
+        self.iyr = iyr
+        self.eyr = eyr
+        self.hgt = hgt
+        self.hcl = hcl
+        self.ecl = ecl
+        self.pid = pid
+        self.cid = cid
+
+    def __repr__(self) -> str:
+        """Show the fields that are set for easier debugging.
+
+        Returns
+        -------
+        str
+            The passport's fields
+        """
+        fields: str = ", ".join(
+            f"{field}={self[field]!r}" for field in FIELDS if self[field] is not None
+        )
+        return f"Passport({fields})"
+
+    def __getitem__(self, item: str) -> Optional[str]:
         """Use dictionary key style accessors to get passport attributes.
 
         Parameters
         ----------
         item: str
             The attribute to get, e.g. byr
-        
+
         Returns
         -------
-        Any
-            The value of the class attribute
+        Optional[str]
+            The value of the field
         """
         return getattr(self, item)
 
-    def __setitem__(self, item: str, value: Any) -> None:
+    def __setitem__(self, item: str, value: Optional[str]) -> None:
         """Use dictionary key style accessors to set passport attributes.
 
         Parameters
         ----------
         item: str
             The attribute to set, e.g. byr
-        value: Any
+        value: Optional[str]
             The value to set that item to
         """
         setattr(self, item, value)
@@ -53,42 +101,223 @@ class Passport:
         bool
             If the passport has all elements except possibly cid
         """
-        fields: Tuple[str, ...] = ("byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid")
-        return all(self[field] is not None for field in fields)
+        return first_failure(self, NORTH_POLE_RULES) is None
 
-    def is_valid_strict(self) -> bool:  # noqa: C901
+    def is_valid_strict(self) -> bool:
         """Check if the passport is valid using more strict criteria.
 
-        I have to ignore type checking in most of this because I'm handling the
-        condition where an attribute is None in a way mypy can't detect
-
         Returns
         -------
         bool
             If the passport is valid elements for all entries
         """
-        if not self.is_valid_north_pole():
-            return False
-        if not 1920 <= self.byr <= 2002:  # type: ignore
-            return False
-        if not 2010 <= self.iyr <= 2020:  # type: ignore
-            return False
-        if not 2020 <= self.eyr <= 2030:  # type: ignore
-            return False
-        hgt_valid: bool = False
-        if self.hgt.endswith("in"):  # type: ignore
-            hgt_valid = 59 <= int(self.hgt[:-2]) <= 76  # type: ignore
-        elif self.hgt.endswith("cm"):  # type: ignore
-            hgt_valid = 150 <= int(self.hgt[:-2]) <= 193  # type: ignore
-        if not hgt_valid:
-            return False
-        if not bool(re.match(r"#[\da-f]{6}", self.hcl)):  # type: ignore
-            return False
-        if self.ecl not in ("amb", "blu", "brn", "gry", "grn", "hzl", "oth"):  # type: ignore
-            return False
-        if not bool(re.match(r"^\d{9}$", self.pid)):  # type: ignore
+        return first_failure(self, STRICT_RULES) is None
+
+
+def number_between(low: int, high: int) -> Check:
+    """Build a check for a whole number in a range.
+
+    Parameters
+    ----------
+    low: int
+        Smallest valid number
+    high: int
+        Largest valid number
+
+    Returns
+    -------
+    Check
+        Whether a value is all digits and between low and high inclusive
+    """
+    digits: re.Pattern = re.compile(r"\d+")
+
+    def check(value: str) -> bool:
+        return digits.fullmatch(value) is not None and low <= int(value) <= high
+
+    return check
+
+
+def measure_between(ranges: Dict[str, Tuple[int, int]]) -> Check:
+    """Build a check for a number followed by a unit with a range per unit.
+
+    Parameters
+    ----------
+    ranges: Dict[str, Tuple[int, int]]
+        The valid (low, high) range for each unit, e.g. {"cm": (150, 193)}
+
+    Returns
+    -------
+    Check
+        Whether a value has a known unit and is within that unit's range
+    """
+    units: str = "|".join(re.escape(unit) for unit in ranges)
+    pattern: re.Pattern = re.compile(rf"(\d+)({units})")
+
+    def check(value: str) -> bool:
+        match: Optional[re.Match] = pattern.fullmatch(value)
+        if match is None:
             return False
-        return True
+        low, high = ranges[match.group(2)]
+        return low <= int(match.group(1)) <= high
+
+    return check
+
+
+def matches(regex: str) -> Check:
+    """Build a check that the whole value matches a regex.
+
+    Parameters
+    ----------
+    regex: str
+        The pattern to compile
+
+    Returns
+    -------
+    Check
+        Whether a value matches the pattern
+    """
+    pattern: re.Pattern = re.compile(regex)
+    return lambda value: pattern.fullmatch(value) is not None
+
+
+def one_of(*choices: str) -> Check:
+    """Build a check for a value from a fixed set.
+
+    Parameters
+    ----------
+    choices: str
+        The valid values
+
+    Returns
+    -------
+    Check
+        Whether a value is one of the choices
+    """
+    valid: FrozenSet[str] = frozenset(choices)
+    return valid.__contains__
+
+
+def present(value: str) -> bool:
+    """Accept any value, for fields that only have to be there.
+
+    Parameters
+    ----------
+    value: str
+        The field's value
+
+    Returns
+    -------
+    bool
+        Always True
+    """
+    return True
+
+
+# A field name, how to get it off a Passport and how to check its value
+Rule = Tuple[str, Callable[[Passport], Optional[str]], Check]
+
+
+def compile_rules(rules: Sequence[Tuple[str, Check]]) -> Tuple[Rule, ...]:
+    """Turn a table of field checks into rules ready to run on passports.
+
+    Parameters
+    ----------
+    rules: Sequence[Tuple[str, Check]]
+        Field names and the check for each one, in the order to run them
+
+    Returns
+    -------
+    Tuple[Rule, ...]
+        The rules with an attribute getter for each field
+    """
+    return tuple((field, attrgetter(field), check) for field, check in rules)
+
+
+NORTH_POLE_RULES: Tuple[Rule, ...] = compile_rules(
+    [(field, present) for field in REQUIRED]
+)
+STRICT_RULES: Tuple[Rule, ...] = compile_rules(
+    [
+        ("byr", number_between(1920, 2002)),
+        ("iyr", number_between(2010, 2020)),
+        ("eyr", number_between(2020, 2030)),
+        ("hgt", measure_between({"cm": (150, 193), "in": (59, 76)})),
+        ("hcl", matches(r"#[\da-f]{6}")),
+        ("ecl", one_of("amb", "blu", "brn", "gry", "grn", "hzl", "oth")),
+        ("pid", matches(r"\d{9}")),
+    ]
+)
+
+
+def first_failure(passport: Passport, rules: Sequence[Rule]) -> Optional[str]:
+    """Find the first field that's missing or fails its check.
+
+    Parameters
+    ----------
+    passport: Passport
+        The passport to check
+    rules: Sequence[Rule]
+        The compiled rules to check it against
+
+    Returns
+    -------
+    Optional[str]
+        The name of the failed field, or None if the passport is valid
+    """
+    for field, get, check in rules:
+        value: Optional[str] = get(passport)
+        if value is None or not check(value):
+            return field
+    return None
+
+
+class PassportValidator:
+    """I check passports against a set of rules and count what fails."""
+
+    def __init__(self, rules: Sequence[Rule] = STRICT_RULES) -> None:
+        """Create a validator.
+
+        Parameters
+        ----------
+        rules: Sequence[Rule]
+            The compiled rules to check passports against
+        """
+        self.rules: Sequence[Rule] = rules
+        self.failures: Counter = Counter()
+
+    def __call__(self, passport: Passport) -> bool:
+        """Check a passport, counting the field that failed if it's invalid.
+
+        Parameters
+        ----------
+        passport: Passport
+            The passport to check
+
+        Returns
+        -------
+        bool
+            Whether the passport is valid
+        """
+        failed: Optional[str] = first_failure(passport, self.rules)
+        if failed is None:
+            return True
+        self.failures[failed] += 1
+        return False
+
+    def count_valid(self, passports: Iterable[Passport]) -> int:
+        """Count the valid passports.
+
+        Parameters
+        ----------
+        passports: Iterable[Passport]
+            The passports to check
+
+        Returns
+        -------
+        int
+            The number of valid passports
+        """
+        return sum(map(self, passports))
 
 
 def read_inputs(filename: str) -> Generator[Passport, None, None]:
@@ -102,28 +331,15 @@ def read_inputs(filename: str) -> Generator[Passport, None, None]:
     Yields
     ------
     Passport
-        The next fully parsed passport
+        The next fully parsed passport, ignoring any fields it doesn't have
     """
     here: Path = Path(__file__).resolve().parent
     in_path: Path = here / filename
-    numeric_fields: Tuple[str, ...] = ("byr", "iyr", "eyr")
-    passport: Passport = Passport()
-    with open(in_path, "r") as f:
-        for line in f.readlines():
-            if line != "\n":
-                # print(line)
-                fields: List[str] = line.split()
-                for field in fields:
-                    key, val = field.split(":")
-                    if key in numeric_fields:
-                        passport[key] = int(val)
-                    else:
-                        passport[key] = val
-            else:
-                yield passport
-                passport = Passport()
-    # Return the last one
-    yield passport
+    for record in read_records(in_path):
+        pairs: Iterator[List[str]] = (
+            field.split(":", 1) for line in record for field in line.split()
+        )
+        yield Passport(**{key: value for key, value in pairs if key in FIELDS})
 
 
 def part1(filename: str = "input.txt") -> int:
@@ -133,13 +349,13 @@ def part1(filename: str = "input.txt") -> int:
     ----------
     filename: str
         The file to read in
-    
+
     Returns
     -------
     int:
         The number of valid passports
     """
-    return sum(passport.is_valid_north_pole() for passport in read_inputs(filename))
+    return PassportValidator(NORTH_POLE_RULES).count_valid(read_inputs(filename))
 
 
 def part2(filename: str = "input.txt") -> int:
@@ -149,10 +365,10 @@ def part2(filename: str = "input.txt") -> int:
     ----------
     filename: str
         The file to read in
-    
+
     Returns
     -------
     int:
         The number of valid passports
     """
-    return sum(passport.is_valid_strict() for passport in read_inputs(filename))
+    return PassportValidator(STRICT_RULES).count_valid(read_inputs(filename))
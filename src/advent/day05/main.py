@@ -2,7 +2,23 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Generator, NamedTuple, Set, Tuple
+import re
+from typing import Generator, Iterator, List, NamedTuple, Tuple
+
+import numpy as np
+
+from advent.io import read_chunks, read_lines
+
+SEAT_CODE: re.Pattern = re.compile(r"[FB]{7}[LR]{3}")
+SEAT_BITS = str.maketrans("FBLR", "0101")
+SEATS: int = 1 << 10
+FULL_ROW: int = 0xFF
+# A code and its newline
+LINE_WIDTH: int = 11
+PLACE_VALUES: np.ndarray = 1 << np.arange(9, -1, -1, dtype=np.int64)
+# The letter for a 1 and a 0 bit in each column of a code
+HIGH_LETTERS: np.ndarray = np.frombuffer(b"BBBBBBBRRR", dtype=np.uint8)
+LOW_LETTERS: np.ndarray = np.frombuffer(b"FFFFFFFLLL", dtype=np.uint8)
 
 
 class BoardingPass(NamedTuple):
@@ -28,6 +44,9 @@ class BoardingPass(NamedTuple):
     ) -> int:
         """Perform binary partition on a row or column string.
 
+        Each halving step picks one bit of the answer, so the characters read
+        straight off as a binary number.
+
         Parameters
         ----------
         chars: str
@@ -44,23 +63,16 @@ class BoardingPass(NamedTuple):
         int
             The row or column associated with the sequence
         """
-        low_index: int = 0
-        high_index: int = upper_bound
+        if upper_bound + 1 != 1 << len(chars):
+            raise ValueError("high and low don't match, something broke")
         for char in chars:
             if char not in (low_char, high_char):
                 raise ValueError(f"{char} must be {low_char} or {high_char}")
-            mid_index: int = ((high_index - low_index) // 2) + low_index
-            if char == low_char:
-                high_index = mid_index
-            else:
-                low_index = mid_index + 1
-        if high_index != low_index:
-            raise ValueError("high and low don't match, something broke")
-        return low_index
+        return int(chars.translate(str.maketrans(low_char + high_char, "01")), 2)
 
     @staticmethod
     def parse(line: str) -> BoardingPass:
-        """Binary partition a string to get a pass.
+        """Decode a string to get a pass.
 
         Parameters
         ----------
@@ -72,13 +84,134 @@ class BoardingPass(NamedTuple):
         BoardingPass
             Row, column and id of the string
         """
-        if len(line) != 10:
-            raise ValueError("input line must be 10 characters")
-        row_chars: str = line[:7]
-        col_chars: str = line[7:]
-        row_val: int = BoardingPass.binary_partition(row_chars, "F", "B", 127)
-        col_val: int = BoardingPass.binary_partition(col_chars, "L", "R", 7)
-        return BoardingPass(row_val, col_val)
+        seat_id: int = decode_seat_id(line)
+        return BoardingPass(seat_id >> 3, seat_id & 7)
+
+
+def decode_seat_id(code: str) -> int:
+    """Turn a boarding pass code straight into its seat ID.
+
+    The row is the high 7 bits of the ID and the column the low 3, so the
+    whole code is one binary number.
+
+    Parameters
+    ----------
+    code: str
+        input line, e.g. FBFBBFFRLR
+
+    Returns
+    -------
+    int
+        The seat ID
+
+    Raises
+    ------
+    ValueError
+        If the code isn't 7 F or B followed by 3 L or R
+    """
+    if SEAT_CODE.fullmatch(code) is None:
+        raise ValueError(f"{code} is not a valid boarding pass")
+    return int(code.translate(SEAT_BITS), 2)
+
+
+def decode_batch(text: bytes) -> np.ndarray:
+    """Decode every boarding pass in a block of lines at once.
+
+    Parameters
+    ----------
+    text: bytes
+        Whole lines of 10 character codes
+
+    Returns
+    -------
+    np.ndarray
+        The seat IDs in the order they appear
+
+    Raises
+    ------
+    ValueError
+        If a line isn't 7 F or B followed by 3 L or R
+    """
+    if not text.endswith(b"\n"):
+        text += b"\n"
+    if len(text) % LINE_WIDTH:
+        raise ValueError("every line must be a 10 character boarding pass")
+    lines: np.ndarray = np.frombuffer(text, dtype=np.uint8).reshape(-1, LINE_WIDTH)
+    codes: np.ndarray = lines[:, :-1]
+    high: np.ndarray = codes == HIGH_LETTERS
+    low: np.ndarray = codes == LOW_LETTERS
+    if not (high | low).all() or (lines[:, -1] != ord("\n")).any():
+        raise ValueError("every line must be a 10 character boarding pass")
+    return high.astype(np.int64) @ PLACE_VALUES
+
+
+def read_seat_ids(filename: str = "input.txt") -> np.ndarray:
+    """Decode every boarding pass in a file in bulk.
+
+    Parameters
+    ----------
+    filename: str
+        The name of the file in this directory to load
+
+    Returns
+    -------
+    np.ndarray
+        The seat IDs in the order they appear
+    """
+    in_path: Path = Path(__file__).resolve().parent / filename
+    ids: List[np.ndarray] = [decode_batch(chunk) for chunk in read_chunks(in_path)]
+    return np.concatenate(ids) if ids else np.empty(0, dtype=np.int64)
+
+
+def seat_map(seat_ids: np.ndarray) -> bytearray:
+    """Mark taken seats in a bitmap.
+
+    Each byte is a row of the plane and bit n of it is column n.
+
+    Parameters
+    ----------
+    seat_ids: np.ndarray
+        The taken seat IDs
+
+    Returns
+    -------
+    bytearray
+        The bitmap, with a bit set for each taken seat
+    """
+    taken: np.ndarray = np.zeros(SEATS, dtype=bool)
+    taken[seat_ids] = True
+    return bytearray(np.packbits(taken, bitorder="little").tobytes())
+
+
+def empty_seats(bitmap: bytearray) -> Iterator[int]:
+    """Find the empty seats between the first and last taken ones.
+
+    Full rows are skipped a byte at a time.
+
+    Parameters
+    ----------
+    bitmap: bytearray
+        Taken seats as built by seat_map
+
+    Yields
+    ------
+    int
+        The ID of each empty seat
+    """
+    rows: List[int] = [row for row, byte in enumerate(bitmap) if byte]
+    if not rows:
+        return
+    # Lowest set bit of the first taken row and highest of the last one
+    first: int = rows[0] * 8 + (bitmap[rows[0]] & -bitmap[rows[0]]).bit_length() - 1
+    last: int = rows[-1] * 8 + bitmap[rows[-1]].bit_length() - 1
+    for row in range(rows[0], rows[-1] + 1):
+        byte: int = bitmap[row]
+        if byte == FULL_ROW:
+            continue
+        for column in range(8):
+            seat: int = row * 8 + column
+            if first < seat < last and not byte >> column & 1:
+                yield seat
 
 
 def read_inputs(filename: str = "input.txt") -> Generator[BoardingPass, None, None]:
@@ -96,35 +229,41 @@ def read_inputs(filename: str = "input.txt") -> Generator[BoardingPass, None, No
     """
     here: Path = Path(__file__).resolve().parent
     in_path: Path = here / filename
-    with open(in_path, "r") as f:
-        for line in f.readlines():
-            yield BoardingPass.parse(line.rstrip())
+    for line in read_lines(in_path):
+        yield BoardingPass.parse(line.rstrip())
 
 
-def part1() -> int:
+def part1(filename: str = "input.txt") -> int:
     """Return the highest seat ID on the list.
 
+    Parameters
+    ----------
+    filename: str
+        The name of the file in this directory to load
+
     Returns
     -------
     int:
         The highest seat ID
     """
-    return max((board_pass.seat_id for board_pass in read_inputs()))
+    return int(read_seat_ids(filename).max())
 
 
-def part2() -> int:
+def part2(filename: str = "input.txt") -> int:
     """Find your seat ID.
 
+    Parameters
+    ----------
+    filename: str
+        The name of the file in this directory to load
+
     Returns
     -------
     int:
         Your seat ID
     """
-    seat_ids: Set[int] = set(board_pass.seat_id for board_pass in read_inputs())
-    min_id: int = min(seat_ids)
-    max_id: int = max(seat_ids)
     missing_seats: Tuple[int, ...] = tuple(
-        id for id in range(min_id, max_id) if id not in seat_ids
+        empty_seats(seat_map(read_seat_ids(filename)))
     )
     if len(missing_seats) != 1:
         raise ValueError(f"Found {len(missing_seats)} seats, should have exactly 1")
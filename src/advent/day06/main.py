@@ -1,11 +1,60 @@
-"""Day 06 of the advent of code challenge."""
+"""Day 06 of the advent of code challenge.
+
+Each person's answers are a 26 bit mask with bit n set if they answered yes
+to question n, so a group's answers combine with | and &.
+"""
 from __future__ import annotations
 
+from functools import reduce
+from operator import and_, or_
 from pathlib import Path
-from typing import Generator, Set
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from advent.io import read_records
+
+LETTER_BITS: Dict[str, int] = {chr(ord("a") + i): 1 << i for i in range(26)}
+ALL_QUESTIONS: int = (1 << 26) - 1
+
+# int.bit_count only exists from Python 3.10
+popcount: Callable[[int], int] = getattr(
+    int, "bit_count", lambda mask: bin(mask).count("1")
+)
+
 
+def answer_mask(line: str) -> int:
+    """Encode one person's answers as a mask.
 
-def read_inputs(filename: str = "input.txt") -> Generator[Set, None, None]:
+    Parameters
+    ----------
+    line: str
+        The questions they answered yes to, e.g. abc
+
+    Returns
+    -------
+    int
+        The answers with a bit per question
+    """
+    return reduce(or_, map(LETTER_BITS.__getitem__, line), 0)
+
+
+def group_masks(group: List[str]) -> Tuple[int, int]:
+    """Combine a group's answers.
+
+    Parameters
+    ----------
+    group: List[str]
+        Each person's answers
+
+    Returns
+    -------
+    Tuple[int, int]
+        The questions anyone answered yes to and the ones everyone did
+    """
+    masks: List[int] = [answer_mask(line) for line in group]
+    return reduce(or_, masks, 0), reduce(and_, masks, ALL_QUESTIONS)
+
+
+def read_inputs(filename: str = "input.txt") -> Iterator[Tuple[int, int]]:
     """Read in and parse a text file of inputs.
 
     Parameters
@@ -15,18 +64,17 @@ def read_inputs(filename: str = "input.txt") -> Generator[Set, None, None]:
 
     Yields
     ------
-    Set
-        All questions answered "yes" at least once on the questionnaire per group
+    Tuple[int, int]
+        Masks of the questions anyone and everyone in each group answered yes
     """
     here: Path = Path(__file__).resolve().parent
     in_path: Path = here / filename
-    with open(in_path, "r") as f:
-        for line in f.read().split("\n\n"):
-            yield set(char for char in line.replace("\n", ""))
+    for group in read_records(in_path):
+        yield group_masks(group)
 
 
-def part1(filename: str = "input.txt") -> int:
-    """Count the sum of unique answers for all groups.
+def count_answers(filename: str = "input.txt") -> Tuple[int, int]:
+    """Total up both parts in one pass over the file.
 
     Parameters
     ----------
@@ -35,32 +83,32 @@ def part1(filename: str = "input.txt") -> int:
 
     Returns
     -------
-    int:
-        The sum of all unique answers
+    Tuple[int, int]
+        The sum over groups of questions anyone answered yes to, and the sum
+        of questions everyone answered yes to
     """
-    return sum(len(result) for result in read_inputs(filename))
+    anyone_total: int = 0
+    everyone_total: int = 0
+    for anyone, everyone in read_inputs(filename):
+        anyone_total += popcount(anyone)
+        everyone_total += popcount(everyone)
+    return anyone_total, everyone_total
 
 
-def read_inputs2(filename: str = "input.txt") -> Generator[Set, None, None]:
-    """Read in and parse a text file of inputs.
+def part1(filename: str = "input.txt") -> int:
+    """Count the sum of unique answers for all groups.
 
     Parameters
     ----------
     filename: str
         The name of the file in this directory to load
 
-    Yields
-    ------
-    Set
-        All questions answered "yes" at least once on the questionnaire per group
+    Returns
+    -------
+    int:
+        The sum of all unique answers
     """
-    here: Path = Path(__file__).resolve().parent
-    in_path: Path = here / filename
-    with open(in_path, "r") as f:
-        for group in f.read().split("\n\n"):
-            yield set.intersection(
-                *(set(char for char in line) for line in group.split("\n"))
-            )
+    return count_answers(filename)[0]
 
 
 def part2(filename: str = "input.txt") -> int:
@@ -76,4 +124,4 @@ def part2(filename: str = "input.txt") -> int:
     int:
         The sum of all answers everyone in the group answered yes to
     """
-    return sum(len(result) for result in read_inputs2(filename))
+    return count_answers(filename)[1]
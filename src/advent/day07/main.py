@@ -1,94 +1,254 @@
 """Day 07 of the advent of code challenge."""
 from __future__ import annotations
 
+from collections import deque
 from pathlib import Path
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
 
+from advent.io import read_lines
 
-class Bag:
-    """A bag and the rules about its contents."""
+RULE_RE: re.Pattern = re.compile(r"^(\w+) (\w+) bags contain (.*)$")
+CONTAINS_RE: re.Pattern = re.compile(r"(\d+ \w+ \w+) bags?")
+CONTAINED_RE: re.Pattern = re.compile(r"(\d+) (\w+) (\w+)")
 
-    def __init__(self, adjective: str, colour: str) -> None:
-        """Make a bag.
 
-        Parameters
-        ----------
-        adjective: str
-            Modifier on the colour, e.g. shiny
-        colour: str
-            The actual colour, e.g. gold
-        """
-        self.adjective: str = adjective
-        self.colour: str = colour
-        self.directly_contains: List[Tuple[Bag, int]] = list()
+class BagGraph:
+    """The bag rules as a graph.
+
+    Every bag gets an integer ID, an index into the forward adjacency list of
+    the bags it directly contains and the reverse list of the bags that
+    directly contain it. How many bags each bag has to hold is memoized, so
+    bags shared by many others are only counted once.
+    """
 
-    @property
-    def name(self: Bag) -> str:
-        """Concatenation of adjective and colour.
+    def __init__(self) -> None:
+        """Make an empty graph."""
+        self.ids: Dict[str, int] = dict()
+        self.names: List[str] = list()
+        self.contents: List[List[Tuple[int, int]]] = list()
+        self.containers: List[List[int]] = list()
+        self._counts: List[Optional[int]] = list()
+
+    def __len__(self) -> int:
+        """Count the bags.
 
         Returns
         -------
-        str
-            the name in <adjective>_<colour> format
+        int
+            The number of bags in the graph
         """
-        return f"{self.adjective}_{self.colour}"
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        """Check if a bag is in the graph.
 
-    def __repr__(self) -> str:
-        """Concatenation of adjective and colour.
+        Parameters
+        ----------
+        name: object
+            The name of the bag, e.g. shiny_gold
 
         Returns
         -------
-        str
-            the name in <adjective>_<colour> format
+        bool
+            Whether the graph has that bag
         """
-        return self.name
+        return name in self.ids
 
-    def __str__(self) -> str:
-        """Concatenation of adjective and colour.
+    def node(self, name: str) -> int:
+        """Get the ID of a bag, adding it to the graph if it's new.
+
+        Parameters
+        ----------
+        name: str
+            The name of the bag, e.g. shiny_gold
 
         Returns
         -------
-        str
-            the name in <adjective>_<colour> format
+        int
+            The bag's ID
+        """
+        if name not in self.ids:
+            self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.contents.append(list())
+            self.containers.append(list())
+            self._counts.append(None)
+        return self.ids[name]
+
+    def add_contents(self, name: str, contents: Iterable[Tuple[int, str]]) -> None:
+        """Add a rule for what a bag directly contains.
+
+        Parameters
+        ----------
+        name: str
+            The name of the bag the rule is for
+        contents: Iterable[Tuple[int, str]]
+            The count and name of each bag it contains
         """
-        return self.name
+        parent: int = self.node(name)
+        for count, child_name in contents:
+            child: int = self.node(child_name)
+            self.contents[parent].append((child, count))
+            self.containers[child].append(parent)
+        self._invalidate(parent)
+
+    def remove_contents(self, name: str) -> None:
+        """Drop the rule for what a bag contains, leaving it empty.
 
-    def subcontains(self, name: str) -> bool:
-        """Check if the bag contains another bag, directly or indirectly.
+        The bag keeps its ID, since other rules may still refer to it.
 
         Parameters
         ----------
         name: str
-            The name of the bag we're looking for
-        
+            The name of the bag the rule is for
+        """
+        parent: int = self.ids[name]
+        for child, _ in self.contents[parent]:
+            self.containers[child].remove(parent)
+        self.contents[parent] = list()
+        self._invalidate(parent)
+
+    def set_contents(self, name: str, contents: Iterable[Tuple[int, str]]) -> None:
+        """Replace the rule for what a bag directly contains.
+
+        Parameters
+        ----------
+        name: str
+            The name of the bag the rule is for
+        contents: Iterable[Tuple[int, str]]
+            The count and name of each bag it contains
+        """
+        if name in self:
+            self.remove_contents(name)
+        self.add_contents(name, contents)
+
+    def update(self, line: str) -> None:
+        """Apply a rule line, replacing any earlier rule for the same bag.
+
+        Only the counts of the bag and the bags holding it are recalculated on
+        the next query.
+
+        Parameters
+        ----------
+        line: str
+            A rule like "light red bags contain 1 bright white bag."
+        """
+        self.set_contents(*parse_rule(line))
+
+    def _invalidate(self, bag: int) -> None:
+        """Forget the memoized counts of a bag and every bag holding it.
+
+        A count is only ever cached after the counts of everything inside the
+        bag, so once a bag without a cached count is reached none of the bags
+        holding it can have one either.
+
+        Parameters
+        ----------
+        bag: int
+            The ID of the bag whose contents changed
+        """
+        stack: List[int] = [bag]
+        while stack:
+            current: int = stack.pop()
+            if self._counts[current] is None:
+                continue
+            self._counts[current] = None
+            stack.extend(self.containers[current])
+
+    def containers_of(self, name: str) -> Set[str]:
+        """Find every bag that could eventually contain a bag.
+
+        Parameters
+        ----------
+        name: str
+            The name of the bag to look for
+
         Returns
         -------
-        bool:
-            Whether that bag will be somewhere in this bag
+        Set[str]
+            The names of the bags that hold it, directly or indirectly
         """
-        if len(self.directly_contains) == 0:
-            return False
-        elif any(bag.name == name for bag, _ in self.directly_contains):
-            return True
-        else:
-            return any(bag.subcontains(name) for bag, _ in self.directly_contains)
+        start: int = self.ids[name]
+        seen: bytearray = bytearray(len(self))
+        seen[start] = 1
+        found: List[int] = list()
+        queue: Deque[int] = deque([start])
+        while queue:
+            for parent in self.containers[queue.popleft()]:
+                if not seen[parent]:
+                    seen[parent] = 1
+                    found.append(parent)
+                    queue.append(parent)
+        return {self.names[bag] for bag in found}
+
+    def contain_count(self, name: str) -> int:
+        """Find how many bags you have to put in a bag.
 
-    def contain_count(self) -> int:
-        """Find how many bags you have to put in this bag.
+        Parameters
+        ----------
+        name: str
+            The name of the bag
 
         Returns
         -------
-        int:
-            How many bags the weird rules make you put in this bag
+        int
+            How many bags the weird rules make you put in that bag
         """
-        if len(self.directly_contains) == 0:
-            return 0
-        else:
-            return sum(
-                count + (count * bag.contain_count())
-                for bag, count in self.directly_contains
+        root: int = self.ids[name]
+        count: Optional[int] = self._counts[root]
+        if count is None:
+            count = self._fill_counts(root)
+        return count
+
+    def _fill_counts(self, root: int) -> int:
+        """Count the bags inside a bag and everything below it.
+
+        Bags are counted after everything they contain, in topological order,
+        using an explicit stack so deep rules don't hit the recursion limit.
+
+        Parameters
+        ----------
+        root: int
+            The ID of the bag to count
+
+        Returns
+        -------
+        int
+            How many bags go in the root bag
+
+        Raises
+        ------
+        ValueError
+            If a bag ends up having to contain itself
+        """
+        counts: List[Optional[int]] = self._counts
+        # Bags on the path from the root to the bag being looked at
+        on_path: bytearray = bytearray(len(self))
+        stack: List[int] = [root]
+        while stack:
+            bag: int = stack[-1]
+            if counts[bag] is not None:
+                stack.pop()
+                continue
+            if not on_path[bag]:
+                on_path[bag] = 1
+                pending: List[int] = [
+                    child for child, _ in self.contents[bag] if counts[child] is None
+                ]
+                if pending:
+                    for child in pending:
+                        if on_path[child]:
+                            raise ValueError(f"{self.names[child]} contains itself")
+                    stack.extend(pending)
+                    continue
+            counts[bag] = sum(
+                count * (1 + counts[child])  # type: ignore
+                for child, count in self.contents[bag]
             )
+            on_path[bag] = 0
+            stack.pop()
+        return counts[root]  # type: ignore
 
 
 def split_contains_txt(split_contains_txt: str) -> Tuple[int, str, str]:
@@ -104,8 +264,7 @@ def split_contains_txt(split_contains_txt: str) -> Tuple[int, str, str]:
     int, str, str
         The count, adjective, and colour of the bag
     """
-    rgx: re.Pattern = re.compile(r"(\d+) (\w+) (\w+)")
-    match: Optional[re.Match] = rgx.match(split_contains_txt)
+    match: Optional[re.Match] = CONTAINED_RE.match(split_contains_txt)
     if match is None:
         raise ValueError(f"cannot parse contained bags for {split_contains_txt}")
     count_str: str
@@ -130,23 +289,45 @@ def split_line(line: str) -> Tuple[str, str, List[Tuple[int, str, str]]]:
         the adjective and colour of the bag, and a list of the count and colour
         of bags it contains
     """
-    rgx: re.Pattern = re.compile(r"^(\w+) (\w+) bags contain (.*)$")
-    match: Optional[re.Match] = rgx.match(line)
+    match: Optional[re.Match] = RULE_RE.match(line)
     if match is None:
         raise ValueError(f"rule could not be parsed for {line}")
     adjective: str
     colour: str
     contains: str
     adjective, colour, contains = match.groups()
-    contain_rgx: re.Pattern = re.compile(r"(\d+ \w+ \w+) bags?")
-    contains_txt_list: List[str] = contain_rgx.findall(contains)
+    contains_txt_list: List[str] = CONTAINS_RE.findall(contains)
     contains_clean_list: List[Tuple[int, str, str]] = [
         split_contains_txt(contains) for contains in contains_txt_list
     ]
     return adjective, colour, contains_clean_list
 
 
-def read_inputs(filename: str = "input.txt") -> Dict[str, Bag]:
+def parse_rule(line: str) -> Tuple[str, List[Tuple[int, str]]]:
+    """Parse a rule line into graph names.
+
+    Parameters
+    ----------
+    line: str
+        The fully expressed rule for a bag
+
+    Returns
+    -------
+    str, [(int, str)]
+        The name of the bag, e.g. shiny_gold, and the count and name of each
+        bag it contains
+    """
+    adjective: str
+    colour: str
+    contains: List[Tuple[int, str, str]]
+    adjective, colour, contains = split_line(line.strip())
+    return (
+        f"{adjective}_{colour}",
+        [(count, f"{adj}_{col}") for count, adj, col in contains],
+    )
+
+
+def read_inputs(filename: str = "input.txt") -> BagGraph:
     """Read in and parse a text file of inputs.
 
     Parameters
@@ -156,29 +337,15 @@ def read_inputs(filename: str = "input.txt") -> Dict[str, Bag]:
 
     Returns
     -------
-    dict:
-        A dictionary of all bags
+    BagGraph:
+        The graph of all bags
     """
-    bag_dict: Dict[str, Bag] = dict()
+    graph: BagGraph = BagGraph()
     here: Path = Path(__file__).resolve().parent
     in_path: Path = here / filename
-    with open(in_path, "r") as f:
-        for line in f.readlines():
-            adjective: str
-            colour: str
-            contains: List[Tuple[int, str, str]]
-            adjective, colour, contains = split_line(line.strip())
-            name_key: str = f"{adjective}_{colour}"
-            if name_key not in bag_dict:
-                bag_dict[name_key] = Bag(adjective, colour)
-            for contained in contains:
-                contained_key: str = f"{contained[1]}_{contained[2]}"
-                if contained_key not in bag_dict:
-                    bag_dict[contained_key] = Bag(contained[1], contained[2])
-                bag_dict[name_key].directly_contains.append(
-                    (bag_dict[contained_key], contained[0])
-                )
-    return bag_dict
+    for line in read_lines(in_path):
+        graph.add_contents(*parse_rule(line))
+    return graph
 
 
 def part1(filename: str = "input.txt") -> int:
@@ -194,9 +361,7 @@ def part1(filename: str = "input.txt") -> int:
     int:
         The number of bags that contain the shiny gold bag
     """
-    bag_dict = read_inputs(filename)
-    # return bag_dict
-    return sum(bag.subcontains("shiny_gold") for bag in bag_dict.values())
+    return len(read_inputs(filename).containers_of("shiny_gold"))
 
 
 def part2(filename: str = "input.txt") -> int:
@@ -212,6 +377,4 @@ def part2(filename: str = "input.txt") -> int:
     int:
         The number of bags that the shiny gold bag contains
     """
-    bag_dict = read_inputs(filename)
-    shiny_gold: Bag = bag_dict["shiny_gold"]
-    return shiny_gold.contain_count()
+    return read_inputs(filename).contain_count("shiny_gold")
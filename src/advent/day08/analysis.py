@@ -0,0 +1,268 @@
+"""Work out how a Compy program behaves without running it over and over.
+
+Each instruction has exactly one instruction that runs after it, so the
+program is a graph with one edge out of every node. Walking that graph once
+finds every loop and every instruction that leads to termination, which is
+enough to answer questions about the program and repair a corrupted one in
+linear time.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, NamedTuple, Optional
+
+from advent.day08.compy import (
+    ACC,
+    Compy,
+    Instruction,
+    JMP,
+    NOP,
+    OPCODES,
+    Program,
+)
+
+# What a nop or jmp turns into when it's repaired
+FLIPPED: Dict[int, int] = {NOP: JMP, JMP: NOP}
+COMMANDS: Dict[int, str] = {opcode: cmd for cmd, opcode in OPCODES.items()}
+
+# Walk states used while classifying the graph
+UNSEEN: int = 0
+ON_PATH: int = 1
+DONE: int = 2
+
+
+class Repair(NamedTuple):
+    """The fix for a corrupted program."""
+
+    address: int
+    instruction: Instruction
+    accumulator: int
+
+
+def next_index(opcode: int, operand: int, index: int) -> int:
+    """Find the instruction that runs after one with the given opcode.
+
+    Parameters
+    ----------
+    opcode: int
+        The instruction's opcode
+    operand: int
+        The instruction's operand
+    index: int
+        Where the instruction is in the program
+
+    Returns
+    -------
+    int
+        The index of the next instruction, which may be outside the program
+    """
+    return index + operand if opcode == JMP else index + 1
+
+
+class ControlFlowGraph:
+    """The control flow of a compiled program, worked out once up front.
+
+    From any index the program either runs off the end, jumps out of range,
+    or falls into exactly one loop. A single walk over the graph records
+    which of those happens from every index, and how much the accumulator
+    grows on the way, so queries never have to run the program.
+    """
+
+    def __init__(self, program: Program) -> None:
+        """Build the graph and classify every instruction.
+
+        Parameters
+        ----------
+        program: Program
+            The compiled program
+        """
+        self.program: Program = program
+        self.end: int = len(program)
+        # The next index for each instruction, or -1 for a jump out of range
+        self.successors: array = array("q", bytes(8 * self.end))
+        # Accumulator gained from each index up to the first repeat or exit
+        self.gains: array = array("q", bytes(8 * self.end))
+        # 1 for each instruction that's part of a loop
+        self.on_loop: bytearray = bytearray(self.end)
+        # 1 for each index the program runs off the end from, plus the end
+        self.finishes: bytearray = bytearray(self.end + 1)
+        self.finishes[self.end] = 1
+        for index, (opcode, operand) in enumerate(
+            zip(program.opcodes, program.operands)
+        ):
+            target: int = next_index(opcode, operand, index)
+            self.successors[index] = target if 0 <= target <= self.end else -1
+            if opcode == ACC:
+                self.gains[index] = operand
+        self._classify()
+
+    def _classify(self) -> None:
+        """Walk every path once, marking loops and where the program finishes."""
+        end: int = self.end
+        successors: array = self.successors
+        gains: array = self.gains
+        state: bytearray = bytearray(end)
+        for start in range(end):
+            if state[start]:
+                continue
+            path: List[int] = []
+            index: int = start
+            while 0 <= index < end and state[index] == UNSEEN:
+                state[index] = ON_PATH
+                path.append(index)
+                index = successors[index]
+            if 0 <= index < end and state[index] == ON_PATH:
+                # Walked back onto this path, so everything from there loops
+                loop: List[int] = path[path.index(index) :]
+                del path[-len(loop) :]
+                total: int = sum(gains[member] for member in loop)
+                for member in loop:
+                    self.on_loop[member] = 1
+                    gains[member] = total
+                    state[member] = DONE
+            # Everything else on the path inherits from its successor
+            for member in reversed(path):
+                target: int = successors[member]
+                if target == end:
+                    self.finishes[member] = 1
+                elif target >= 0:
+                    gains[member] += gains[target]
+                    self.finishes[member] = self.finishes[target]
+                state[member] = DONE
+
+    def reachable(self, start: int = 0) -> bytearray:
+        """Find every instruction that runs when starting from an index.
+
+        Parameters
+        ----------
+        start: int
+            Where the program starts
+
+        Returns
+        -------
+        bytearray
+            1 for each index that runs, 0 otherwise
+        """
+        visited: bytearray = bytearray(self.end)
+        index: int = start
+        while 0 <= index < self.end and not visited[index]:
+            visited[index] = 1
+            index = self.successors[index]
+        return visited
+
+    def in_loop(self, index: int) -> bool:
+        """Check if an instruction is part of a loop.
+
+        Parameters
+        ----------
+        index: int
+            The instruction to check
+
+        Returns
+        -------
+        bool
+            Whether running from the instruction comes back around to it
+        """
+        return bool(self.on_loop[index])
+
+    def terminates_from(self, index: int = 0) -> bool:
+        """Check if the program finishes when started from an index.
+
+        Parameters
+        ----------
+        index: int
+            Where the program starts
+
+        Returns
+        -------
+        bool
+            Whether the program runs off the end, rather than looping forever
+            or jumping out of range
+        """
+        return bool(self.finishes[index])
+
+    def accumulator_at_first_repeat(self, start: int = 0) -> Optional[int]:
+        """Find the accumulator right before an instruction runs a second time.
+
+        Parameters
+        ----------
+        start: int
+            Where the program starts, with the accumulator at 0
+
+        Returns
+        -------
+        Optional[int]
+            The accumulator when the program is about to repeat, or None if it
+            never repeats because it finishes or jumps out of range
+        """
+        index: int = start
+        # Only the path into the loop is walked, never the loop itself
+        while 0 <= index < self.end and not self.on_loop[index]:
+            index = self.successors[index]
+        if not 0 <= index < self.end:
+            return None
+        return self.gains[start]
+
+
+def find_repair(program: Program) -> int:
+    """Find the one nop or jmp that has to flip for the program to finish.
+
+    The corrupted instruction is on the path the program actually runs, and
+    flipping it has to send the program somewhere it finishes from. Both are
+    checked on a single walk of that path.
+
+    Parameters
+    ----------
+    program: Program
+        The compiled program
+
+    Returns
+    -------
+    int
+        The index of the instruction to flip
+
+    Raises
+    ------
+    ValueError
+        If no single flip makes the program finish
+    """
+    end: int = len(program)
+    finishes: bytearray = ControlFlowGraph(program).finishes
+    visited: bytearray = bytearray(end)
+    index: int = 0
+    while 0 <= index < end and not visited[index]:
+        visited[index] = 1
+        opcode: int = program.opcodes[index]
+        operand: int = program.operands[index]
+        if opcode in FLIPPED:
+            target: int = next_index(FLIPPED[opcode], operand, index)
+            if 0 <= target <= end and finishes[target]:
+                return index
+        index = next_index(opcode, operand, index)
+    raise ValueError("No single nop or jmp flip lets the program finish")
+
+
+def repair(compy: Compy) -> Repair:
+    """Fix a corrupted program and run it to the end.
+
+    Parameters
+    ----------
+    compy: Compy
+        The computer with the corrupted program
+
+    Returns
+    -------
+    Repair
+        Which instruction was replaced, what with, and the accumulator after
+        the fixed program finishes
+    """
+    index: int = find_repair(compy.program)
+    broken: Instruction = compy.instructions[index]
+    fixed: Instruction = Instruction(
+        COMMANDS[FLIPPED[compy.program.opcodes[index]]], broken.num
+    )
+    instructions: List[Instruction] = list(compy.instructions)
+    instructions[index] = fixed
+    fixed_compy: Compy = Compy(instructions)
+    fixed_compy.full_run()
+    return Repair(index, fixed, fixed_compy.accumulator)
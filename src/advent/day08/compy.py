@@ -1,8 +1,26 @@
-"""I'm a computer, stop all the downloading."""
+"""I'm a computer, stop all the downloading.
+
+Programs are compiled into parallel arrays of integer opcodes and operands
+before they run, so each step dispatches on a small int instead of comparing
+strings.
+"""
 from __future__ import annotations
 
+from array import array
 from pathlib import Path
-from typing import List, NamedTuple, Set, Union
+import sys
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from advent.io import read_lines
+
+NOP: int = 0
+ACC: int = 1
+JMP: int = 2
+OPCODES: Dict[str, int] = {"nop": NOP, "acc": ACC, "jmp": JMP}
+
+
+class StepLimitExceeded(RuntimeError):
+    """Raised when a program runs for more steps than its budget allows."""
 
 
 class Instruction(NamedTuple):
@@ -14,12 +32,12 @@ class Instruction(NamedTuple):
     @staticmethod
     def parse(line: str) -> Instruction:
         """Turn a line of text into an Instruction.
-        
+
         Parameters
         ----------
         line: str
             An instruction in string form
-        
+
         Returns
         -------
         Instruction
@@ -36,65 +54,237 @@ def instructions_from_file(file: Union[Path, str]) -> List[Instruction]:
     ----------
     file: Path, str
         The file to load
-    
+
     Returns
     -------
     List[Instructions]
         All the instructions in the file
     """
-    with open(file, "r") as f:
-        return [Instruction.parse(line) for line in f.readlines()]
+    return [Instruction.parse(line) for line in read_lines(file) if line.strip()]
+
+
+class Program(NamedTuple):
+    """A compiled program, with an opcode and operand for each instruction."""
+
+    opcodes: array
+    operands: array
+
+    def __len__(self) -> int:
+        """Count the instructions.
+
+        Returns
+        -------
+        int
+            The number of instructions in the program
+        """
+        return len(self.opcodes)
+
+
+def compile_program(instructions: Sequence[Instruction]) -> Program:
+    """Compile instructions into integer opcode and operand arrays.
+
+    Parameters
+    ----------
+    instructions: Sequence[Instruction]
+        The program to compile
+
+    Returns
+    -------
+    Program
+        The opcodes and operands
+
+    Raises
+    ------
+    ValueError
+        If an instruction isn't one the computer supports
+    """
+    opcodes: array = array("b")
+    operands: array = array("q")
+    for instruction in instructions:
+        opcode: Optional[int] = OPCODES.get(instruction.cmd)
+        if opcode is None:
+            raise ValueError(f"Unsupported instruction: {instruction.cmd}")
+        opcodes.append(opcode)
+        operands.append(instruction.num)
+    return Program(opcodes, operands)
 
 
 class Compy:
     """I'm a computer."""
 
-    def __init__(self, instructions: List[Instruction]) -> None:
+    def __init__(
+        self,
+        instructions: List[Instruction],
+        max_steps: Optional[int] = None,
+        trace: bool = False,
+    ) -> None:
         """Instantiate with index and accumulator at 0.
-        
+
         Parameters
         ----------
         instructions: List[Instruction]
-            The program to run
+            The program to run, compiled once here
+        max_steps: int, optional
+            Most instructions full_run may execute before raising
+            StepLimitExceeded, by default there's no limit
+        trace: bool
+            Record the index and accumulator before every instruction executed
+            in the trace attribute
         """
         self.index: int = 0
         self.accumulator: int = 0
         self.instructions: List[Instruction] = instructions
+        self.program: Program = compile_program(instructions)
         self.run_complete: bool = False
+        self.max_steps: Optional[int] = max_steps
+        self.trace: Optional[List[Tuple[int, int]]] = [] if trace else None
 
-    def _exec_instruction(self, instruction: Instruction) -> None:
-        """Run an instruction.
-        
-        Parameters
-        ----------
-        instruction: Instruction
-            The instruction to run
+    def reset(self) -> None:
+        """Go back to the start of the program with the accumulator at 0."""
+        self.index = 0
+        self.accumulator = 0
+        self.run_complete = False
+
+    def step(self) -> None:
+        """Execute the next instruction.
+
+        Raises
+        ------
+        IndexError
+            If the instruction jumps outside the program
         """
-        if instruction.cmd == "nop":
-            pass
-            self.index += 1
-        elif instruction.cmd == "acc":
-            self.accumulator += instruction.num
-            self.index += 1
-        elif instruction.cmd == "jmp":
-            if 0 <= self.index + instruction.num <= len(self.instructions):
-                self.index += instruction.num
-            else:
+        index: int = self.index
+        opcode: int = self.program.opcodes[index]
+        if self.trace is not None:
+            self.trace.append((index, self.accumulator))
+        if opcode == ACC:
+            self.accumulator += self.program.operands[index]
+            index += 1
+        elif opcode == JMP:
+            index += self.program.operands[index]
+            if not 0 <= index <= len(self.program):
                 raise IndexError("Jumped out of instruction set")
         else:
-            raise ValueError(f"Unsupported instruction: {instruction.cmd}")
-        if self.index == len(self.instructions):
+            index += 1
+        self.index = index
+        if index == len(self.program):
             self.run_complete = True
 
-    def step(self) -> None:
-        """Execute the next instruction."""
-        instruction: Instruction = self.instructions[self.index]
-        self._exec_instruction(instruction)
-
     def full_run(self) -> None:
-        """Execute the program all the way through."""
-        while not self.run_complete:
-            self.step()
+        """Execute the program all the way through.
+
+        If max_steps is set and the program runs longer, StepLimitExceeded is
+        raised with the computer left where it stopped.
+
+        Raises
+        ------
+        IndexError
+            If an instruction jumps outside the program
+        """
+        if self.trace is not None or self.max_steps is not None:
+            self._checked_run()
+            return
+        # Nothing to check per step, so keep the loop as lean as possible
+        opcodes: array = self.program.opcodes
+        operands: array = self.program.operands
+        end: int = len(opcodes)
+        index: int = self.index
+        accumulator: int = self.accumulator
+        while index != end:
+            opcode: int = opcodes[index]
+            if opcode == ACC:
+                accumulator += operands[index]
+                index += 1
+            elif opcode == JMP:
+                if not 0 <= index + operands[index] <= end:
+                    self.index, self.accumulator = index, accumulator
+                    raise IndexError("Jumped out of instruction set")
+                index += operands[index]
+            else:
+                index += 1
+        self.index, self.accumulator = index, accumulator
+        self.run_complete = True
+
+    def _checked_run(self) -> None:
+        """Execute the program all the way through, tracing and counting steps.
+
+        Raises
+        ------
+        IndexError
+            If an instruction jumps outside the program
+        StepLimitExceeded
+            If the program runs for more than max_steps instructions
+        """
+        opcodes: array = self.program.opcodes
+        operands: array = self.program.operands
+        end: int = len(opcodes)
+        limit: int = sys.maxsize if self.max_steps is None else self.max_steps
+        record = None if self.trace is None else self.trace.append
+        index: int = self.index
+        accumulator: int = self.accumulator
+        steps: int = 0
+        while index != end:
+            if steps == limit:
+                self.index, self.accumulator = index, accumulator
+                raise StepLimitExceeded(f"Still running after {limit} steps")
+            steps += 1
+            if record is not None:
+                record((index, accumulator))
+            opcode: int = opcodes[index]
+            if opcode == ACC:
+                accumulator += operands[index]
+                index += 1
+            elif opcode == JMP:
+                if not 0 <= index + operands[index] <= end:
+                    self.index, self.accumulator = index, accumulator
+                    raise IndexError("Jumped out of instruction set")
+                index += operands[index]
+            else:
+                index += 1
+        self.index, self.accumulator = index, accumulator
+        self.run_complete = True
+
+    def run_until_loop(self) -> bool:
+        """Run until the program finishes or is about to repeat an instruction.
+
+        The computer is left where it stopped, so the accumulator holds its
+        value from right before the repeat.
+
+        Returns
+        -------
+        bool:
+            Whether the program stopped because it was about to repeat
+
+        Raises
+        ------
+        IndexError
+            If an instruction jumps outside the program
+        """
+        opcodes: array = self.program.opcodes
+        operands: array = self.program.operands
+        end: int = len(opcodes)
+        record = None if self.trace is None else self.trace.append
+        visited: bytearray = bytearray(end)
+        index: int = self.index
+        accumulator: int = self.accumulator
+        while index != end and not visited[index]:
+            visited[index] = 1
+            if record is not None:
+                record((index, accumulator))
+            opcode: int = opcodes[index]
+            if opcode == ACC:
+                accumulator += operands[index]
+                index += 1
+            elif opcode == JMP:
+                if not 0 <= index + operands[index] <= end:
+                    self.index, self.accumulator = index, accumulator
+                    raise IndexError("Jumped out of instruction set")
+                index += operands[index]
+            else:
+                index += 1
+        self.index, self.accumulator = index, accumulator
+        self.run_complete = index == end
+        return not self.run_complete
 
     def loops_forever(self) -> bool:
         """Check if a program is an infinite loop.
@@ -104,20 +294,7 @@ class Compy:
         bool:
             Whether the program will loop forever or not
         """
-        indices: Set[int] = set()
-        while True:
-            if self.index in indices:
-                # Reset before returning
-                self.index = 0
-                self.accumulator = 0
-                self.run_complete = False
-                return True
-            elif self.run_complete:
-                # Reset before returning
-                self.index = 0
-                self.accumulator = 0
-                self.run_complete = False
-                return False
-            else:
-                indices.add(self.index)
-                self.step()
+        looped: bool = self.run_until_loop()
+        # Reset before returning
+        self.reset()
+        return looped
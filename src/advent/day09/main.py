@@ -1,12 +1,15 @@
 """Day 09 of the advent of code challenge."""
 from __future__ import annotations
 
+from collections import Counter, deque
 from pathlib import Path
-from typing import List, Set
+from typing import Deque, Iterable, Iterator
 
+from advent.io import iter_ints
 
-def read_inputs(filename: str = "input.txt") -> List[int]:
-    """Read in and parse a text file of inputs.
+
+def read_inputs(filename: str = "input.txt") -> Iterator[int]:
+    """Stream a text file of inputs.
 
     Parameters
     ----------
@@ -15,12 +18,164 @@ def read_inputs(filename: str = "input.txt") -> List[int]:
 
     Returns
     -------
-    list[int]
-        The numbers in the series
+    Iterator[int]
+        The numbers in the series, parsed a chunk at a time
     """
     in_path: Path = Path(__file__).resolve().parent / filename
-    with open(in_path, "r") as f:
-        return [int(line.strip()) for line in f.readlines()]
+    return iter_ints(in_path)
+
+
+class XmasWindow:
+    """The last few numbers of a series, checked against each new number.
+
+    Values are kept in arrival order to know which one leaves next, and
+    counted by value so each check is a lookup per distinct value instead of
+    rebuilding anything as the window slides.
+    """
+
+    def __init__(self, preamble_length: int = 25) -> None:
+        """Start with an empty window.
+
+        Parameters
+        ----------
+        preamble_length: int
+            How many earlier numbers to consider
+        """
+        self.preamble_length: int = preamble_length
+        self.order: Deque[int] = deque()
+        self.counts: Counter = Counter()
+
+    def is_full(self) -> bool:
+        """Check if the preamble has been read.
+
+        Returns
+        -------
+        bool
+            Whether the window holds preamble_length numbers
+        """
+        return len(self.order) == self.preamble_length
+
+    def is_sum(self, target: int) -> bool:
+        """Check if two different numbers in the window add to the target.
+
+        Parameters
+        ----------
+        target: int
+            The number to check
+
+        Returns
+        -------
+        bool
+            Whether the number follows the pattern
+        """
+        counts: Counter = self.counts
+        for value in counts:
+            other: int = target - value
+            if other != value and other in counts:
+                return True
+        return False
+
+    def push(self, value: int) -> None:
+        """Slide the window on by one number.
+
+        Parameters
+        ----------
+        value: int
+            The newest number in the series
+        """
+        self.order.append(value)
+        self.counts[value] += 1
+        if len(self.order) > self.preamble_length:
+            oldest: int = self.order.popleft()
+            if self.counts[oldest] == 1:
+                del self.counts[oldest]
+            else:
+                self.counts[oldest] -= 1
+
+
+def invalid_numbers(numbers: Iterable[int], preamble_length: int = 25) -> Iterator[int]:
+    """Find every number that isn't the sum of two of the ones before it.
+
+    Only the window is kept in memory, so the series can be endless.
+
+    Parameters
+    ----------
+    numbers: Iterable[int]
+        The series, e.g. from read_inputs
+    preamble_length: int
+        How many earlier numbers to consider
+
+    Yields
+    ------
+    int
+        Each number that doesn't match the pattern, in order
+    """
+    window: XmasWindow = XmasWindow(preamble_length)
+    for value in numbers:
+        if window.is_full() and not window.is_sum(value):
+            yield value
+        window.push(value)
+
+
+def first_invalid(numbers: Iterable[int], preamble_length: int = 25) -> int:
+    """Find the first number that isn't the sum of two of the ones before it.
+
+    Parameters
+    ----------
+    numbers: Iterable[int]
+        The series, e.g. from read_inputs
+    preamble_length: int
+        How many earlier numbers to consider
+
+    Returns
+    -------
+    int:
+        The number that doesn't match the pattern
+
+    Raises
+    ------
+    RuntimeError
+        If every number matches the pattern
+    """
+    for value in invalid_numbers(numbers, preamble_length):
+        return value
+    raise RuntimeError("Went through the whole list without solving part 1")
+
+
+def encryption_weakness(numbers: Iterable[int], target: int) -> int:
+    """Find a contiguous run of at least two numbers that adds to the target.
+
+    The run is grown at the back and shrunk from the front while keeping its
+    sum, so every number is added and removed at most once. Numbers are
+    assumed not to be negative, like the puzzle's.
+
+    Parameters
+    ----------
+    numbers: Iterable[int]
+        The series, e.g. from read_inputs
+    target: int
+        The invalid number found in part 1
+
+    Returns
+    -------
+    int:
+        The sum of the smallest and largest numbers in the run
+
+    Raises
+    ------
+    RuntimeError
+        If no run adds to the target
+    """
+    run: Deque[int] = deque()
+    run_sum: int = 0
+    for value in numbers:
+        run.append(value)
+        run_sum += value
+        while run_sum > target and run:
+            run_sum -= run.popleft()
+        if run_sum == target and len(run) > 1:
+            return min(run) + max(run)
+    raise RuntimeError("Went through the whole list without solving part 2")
 
 
 def part1(filename: str = "input.txt", preamble_length: int = 25) -> int:
@@ -38,16 +193,7 @@ def part1(filename: str = "input.txt", preamble_length: int = 25) -> int:
     int:
         The number that doesn't match the pattern
     """
-    num_list: List[int] = read_inputs(filename)
-    for index in range(preamble_length, len(num_list)):
-        target: int = num_list[index]
-        has: Set = {num_list[i] for i in range(index - preamble_length, index)}
-        wants: Set = {
-            target - num_list[i] for i in range(index - preamble_length, index)
-        }
-        if len(has.intersection(wants)) < 2:
-            return target
-    raise RuntimeError("Went through the whole list without solving part 1")
+    return first_invalid(read_inputs(filename), preamble_length)
 
 
 def part2(filename: str = "input.txt", preamble_length: int = 25) -> int:
@@ -65,17 +211,5 @@ def part2(filename: str = "input.txt", preamble_length: int = 25) -> int:
     int:
         The answer to part 2
     """
-    num_list: List[int] = read_inputs(filename)
-    target: int = part1(filename, preamble_length)
-    low_index: int = 0
-    high_index: int = 1
-    while high_index < len(num_list):
-        test_range: List[int] = num_list[low_index:high_index]
-        range_sum: int = sum(test_range)
-        if range_sum < target:
-            high_index += 1
-        elif range_sum > target:
-            low_index += 1
-        else:
-            return min(test_range) + max(test_range)
-    raise RuntimeError("Went through the whole list without solving part 2")
+    target: int = first_invalid(read_inputs(filename), preamble_length)
+    return encryption_weakness(read_inputs(filename), target)
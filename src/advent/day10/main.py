@@ -1,11 +1,19 @@
 """Day 10 of the advent of code challenge."""
 from __future__ import annotations
 
+from array import array
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Iterable, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 
-def read_inputs(filename: str = "input.txt") -> List[int]:
+from advent.io import read_ints
+
+# Sorted adapters turned into Python ints at a time by chain_stats
+SLICE_SIZE: int = 1 << 16
+
+
+def read_inputs(filename: str = "input.txt") -> array:
     """Read in and parse a text file of inputs.
 
     Parameters
@@ -15,12 +23,73 @@ def read_inputs(filename: str = "input.txt") -> List[int]:
 
     Returns
     -------
-    list[int]
+    array
         The numbers in the series
     """
     in_path: Path = Path(__file__).resolve().parent / filename
-    with open(in_path, "r") as f:
-        return [int(line.strip()) for line in f.readlines()]
+    return read_ints(in_path)
+
+
+class ChainStats(NamedTuple):
+    """What one pass over the sorted adapters finds out about the chain."""
+
+    # How many steps of 1, 2 and 3 jolts the full chain takes
+    differences: Tuple[int, int, int]
+    arrangements: int
+
+
+def chain_stats(adapters: Iterable[int], modulus: Optional[int] = None) -> ChainStats:
+    """Work out both parts in a single pass over the sorted adapters.
+
+    The ways to reach an adapter are the sum of the ways to reach the adapters
+    up to 3 jolts below it, and sorted those can only be the last three, so
+    only they are kept.
+
+    Parameters
+    ----------
+    adapters: Iterable[int]
+        The adapter ratings, e.g. from read_inputs
+    modulus: int, optional
+        Count arrangements modulo this, to keep the count small for chains so
+        long it has millions of digits
+
+    Returns
+    -------
+    ChainStats
+        The jolt difference histogram and the number of arrangements,
+        including the wall port and the device
+
+    Raises
+    ------
+    ValueError
+        If two adapters are rated the same or more than 3 jolts apart
+    """
+    ordered: np.ndarray = np.fromiter(adapters, dtype=np.int64)
+    ordered.sort()
+    histogram: List[int] = [0, 0, 0, 0]
+    # The last three joltages and ways to reach them, oldest first, with the
+    # wall port at 0 and nothing before it
+    jolt_a, jolt_b, jolt_c = -3, -3, 0
+    ways_a, ways_b, ways_c = 0, 0, 1
+    # Only a slice of the sorted adapters is boxed into Python ints at a time
+    for start in range(0, len(ordered), SLICE_SIZE):
+        for jolt in ordered[start : start + SLICE_SIZE].tolist():
+            diff: int = jolt - jolt_c
+            if not 1 <= diff <= 3:
+                raise ValueError(f"Diff of {diff} is invalid")
+            histogram[diff] += 1
+            reach: int = ways_c
+            if jolt - jolt_b <= 3:
+                reach += ways_b
+                if jolt - jolt_a <= 3:
+                    reach += ways_a
+            if modulus is not None:
+                reach %= modulus
+            jolt_a, jolt_b, jolt_c = jolt_b, jolt_c, jolt
+            ways_a, ways_b, ways_c = ways_b, ways_c, reach
+    # The device is always 3 jolts above the highest adapter
+    histogram[3] += 1
+    return ChainStats((histogram[1], histogram[2], histogram[3]), ways_c)
 
 
 def part1(filename: str = "input.txt") -> int:
@@ -36,68 +105,24 @@ def part1(filename: str = "input.txt") -> int:
     int:
         The answer to part 1
     """
-    sorted_inputs: List[int] = sorted(read_inputs(filename))
-    current_jolts: int = 0
-    jolt_1: int = 0
-    jolt_3: int = 0
-    for jolt in sorted_inputs:
-        diff: int = jolt - current_jolts
-        if diff == 1:
-            jolt_1 += 1
-        elif diff == 3:
-            jolt_3 += 1
-        else:
-            raise ValueError(f"Diff of {diff} is invalid")
-        current_jolts = jolt
-    # Add in the device itself
-    jolt_3 += 1
-    return jolt_1 * jolt_3
-
-
-class Node(object):
-    """I'm a node in a graph."""
-
-    def __init__(self, value: int) -> None:
-        """Create a Node.
-
-        Parameters
-        ----------
-        value: int
-            The value of the node.
-        """
-        self.value = value
-        self.children: List[Node] = []
-        self.n_forks: Optional[int] = None
-
-    def __repr__(self) -> str:
-        """Show a string of the node for easier debugging.
-
-        Returns
-        -------
-        str
-            The string value of the node
-        """
-        return str(self.value)
-
-    def forks(self) -> int:
-        """Show how many paths there are from this node.
-
-        Use memoization so this doesn't take a literal eternity.
-
-        Returns
-        -------
-        int
-            The number of paths from this node
-        """
-        if self.n_forks is None:
-            if not self.children:
-                self.n_forks = 1
-            else:
-                self.n_forks = sum([child.forks() for child in self.children])
-        # Need the assert to make mypy happy, but then I have to noqa the assert
-        # to make flake8 happy. Gross.
-        assert self.n_forks is not None  # noqa S101
-        return self.n_forks
+    return joltage_product(read_inputs(filename))
+
+
+def joltage_product(adapters: Iterable[int]) -> int:
+    """Multiply the count of 1 jolt differences by the count of 3 jolt ones.
+
+    Parameters
+    ----------
+    adapters: Iterable[int]
+        The adapter ratings, a list or a buffer from read_inputs
+
+    Returns
+    -------
+    int:
+        The answer to part 1
+    """
+    ones, _, threes = chain_stats(adapters).differences
+    return ones * threes
 
 
 def part2(filename: str = "input.txt") -> int:
@@ -113,21 +138,25 @@ def part2(filename: str = "input.txt") -> int:
     int:
         The answer to part 2
     """
-    num_list: List[int] = sorted(read_inputs(filename))
-    num_list.append(max(num_list) + 3)  # add the actual device
-    num_list.insert(0, 0)  # add the wall port
-    top_node: int = num_list[-1]
-    node_dict: Dict[int, Node] = dict()
-    while num_list:
-        next_num: int = num_list.pop()
-        if next_num not in node_dict:
-            node_dict[next_num] = Node(next_num)
-        children: List[int] = [item for item in num_list[-3:] if next_num - item <= 3]
-        for child in children:
-            if child not in node_dict:
-                node_dict[child] = Node(child)
-            node_dict[next_num].children.append(node_dict[child])
-    return node_dict[top_node].forks()
+    return count_arrangements(read_inputs(filename))
+
+
+def count_arrangements(adapters: Iterable[int], modulus: Optional[int] = None) -> int:
+    """Count the ways the adapters can connect the wall to the device.
+
+    Parameters
+    ----------
+    adapters: Iterable[int]
+        The adapter ratings, a list or a buffer from read_inputs
+    modulus: int, optional
+        Count modulo this instead of exactly
+
+    Returns
+    -------
+    int:
+        The answer to part 2
+    """
+    return chain_stats(adapters, modulus).arrangements
 
 
 if __name__ == "__main__":
@@ -1,144 +1,436 @@
 """Day 11 of the advent of code challenge."""
 from __future__ import annotations
 
-import copy
 from pathlib import Path
-from typing import Callable, Counter, Dict, List, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from advent.io import read_lines
+
+
+# Tiles are stored one byte each
+FLOOR: int = 0
+EMPTY: int = 1
+OCCUPIED: int = 2
+SYMBOLS: str = ".L#"
+
+# Byte value of each symbol to its tile code
+CODES: np.ndarray = np.zeros(256, dtype=np.uint8)
+CODES[np.frombuffer(SYMBOLS.encode("ascii"), dtype=np.uint8)] = range(len(SYMBOLS))
+
+
+def encode(state: Sequence[Sequence[str]]) -> np.ndarray:
+    """Turn a layout into a grid of tile codes.
+
+    Parameters
+    ----------
+    state: Sequence[Sequence[str]]
+        The layout as rows of ``.``, ``L`` and ``#``
+
+    Returns
+    -------
+    np.ndarray
+        A rows by columns uint8 array of FLOOR, EMPTY and OCCUPIED
+    """
+    raw: bytes = "".join("".join(row) for row in state).encode("ascii")
+    return CODES[np.frombuffer(raw, dtype=np.uint8)].reshape(len(state), -1)
+
+
+def decode(grid: np.ndarray) -> List[List[str]]:
+    """Turn a grid of tile codes back into a layout.
+
+    Parameters
+    ----------
+    grid: np.ndarray
+        The tile codes
+
+    Returns
+    -------
+    List[List[str]]
+        The layout as rows of ``.``, ``L`` and ``#``
+    """
+    return [[SYMBOLS[code] for code in row] for row in grid.tolist()]
+
+
+def occupied_neighbours(grid: np.ndarray) -> np.ndarray:
+    """Count the occupied seats next to every tile.
+
+    The occupied seats are padded with a ring of floor and the eight shifted
+    views of that are added together, so the whole grid is counted at once.
+
+    Parameters
+    ----------
+    grid: np.ndarray
+        The tile codes
+
+    Returns
+    -------
+    np.ndarray
+        How many of the 8 adjacent tiles are occupied, for every tile
+    """
+    rows, cols = grid.shape
+    padded: np.ndarray = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = grid == OCCUPIED
+    counts: np.ndarray = np.zeros((rows, cols), dtype=np.uint8)
+    for row_vec in (-1, 0, 1):
+        for col_vec in (-1, 0, 1):
+            if row_vec or col_vec:
+                counts += padded[
+                    1 + row_vec : 1 + row_vec + rows, 1 + col_vec : 1 + col_vec + cols
+                ]
+    return counts
+
+
+class SeatIndex(NamedTuple):
+    """Which seats each seat can see, in compressed sparse row form.
+
+    The seats visible from seat i are ``indices[indptr[i]:indptr[i + 1]]``,
+    where seats are numbered in the order they appear in the grid.
+    """
+
+    # Flat grid position of each seat
+    seats: np.ndarray
+    indptr: np.ndarray
+    indices: np.ndarray
+
+
+# Finds the neighbouring seat in one direction from every tile
+SeatFinder = Callable[[np.ndarray, np.ndarray, int, int], np.ndarray]
+
+
+def _nearest_seats(
+    is_seat: np.ndarray, flat: np.ndarray, row_vec: int, col_vec: int
+) -> np.ndarray:
+    """Find the first seat in one direction from every tile.
+
+    Each row only depends on the row next to it in that direction, so the
+    grid is swept a row at a time with each row handled in bulk.
+
+    Parameters
+    ----------
+    is_seat: np.ndarray
+        True for every tile that isn't floor
+    flat: np.ndarray
+        The flat grid position of every tile
+    row_vec: int
+        Row step of the direction
+    col_vec: int
+        Column step of the direction
+
+    Returns
+    -------
+    np.ndarray
+        The flat position of the first seat in that direction, or -1 if
+        there isn't one before the edge
+    """
+    if row_vec == 0:
+        # Sweep columns instead by working on the transpose
+        return _nearest_seats(is_seat.T, flat.T, col_vec, 0).T
+    rows, cols = is_seat.shape
+    nearest: np.ndarray = np.full((rows, cols), -1, dtype=np.int64)
+    # Columns that see into the next row, and the columns they see
+    dst: slice = slice(max(0, -col_vec), cols - max(0, col_vec))
+    src: slice = slice(max(0, col_vec), cols - max(0, -col_vec))
+    order: range = range(rows - 2, -1, -1) if row_vec > 0 else range(1, rows)
+    for row in order:
+        seen: int = row + row_vec
+        nearest[row, dst] = np.where(
+            is_seat[seen, src], flat[seen, src], nearest[seen, src]
+        )
+    return nearest
+
+
+def _adjacent_seats(
+    is_seat: np.ndarray, flat: np.ndarray, row_vec: int, col_vec: int
+) -> np.ndarray:
+    """Find the seat right next to every tile in one direction.
+
+    Parameters
+    ----------
+    is_seat: np.ndarray
+        True for every tile that isn't floor
+    flat: np.ndarray
+        The flat grid position of every tile
+    row_vec: int
+        Row step of the direction
+    col_vec: int
+        Column step of the direction
+
+    Returns
+    -------
+    np.ndarray
+        The flat position of the adjacent tile in that direction, or -1 if
+        it's floor or off the edge
+    """
+    rows, cols = is_seat.shape
+    adjacent: np.ndarray = np.full((rows, cols), -1, dtype=np.int64)
+    dst: Tuple[slice, slice] = (
+        slice(max(0, -row_vec), rows - max(0, row_vec)),
+        slice(max(0, -col_vec), cols - max(0, col_vec)),
+    )
+    src: Tuple[slice, slice] = (
+        slice(max(0, row_vec), rows - max(0, -row_vec)),
+        slice(max(0, col_vec), cols - max(0, -col_vec)),
+    )
+    adjacent[dst] = np.where(is_seat[src], flat[src], -1)
+    return adjacent
+
+
+def _build_index(grid: np.ndarray, find: SeatFinder) -> SeatIndex:
+    """Collect the seats found in all 8 directions from every seat.
+
+    Parameters
+    ----------
+    grid: np.ndarray
+        The tile codes
+    find: SeatFinder
+        Finds the neighbouring seat in one direction for the whole grid
+
+    Returns
+    -------
+    SeatIndex
+        The neighbours of every seat
+    """
+    is_seat: np.ndarray = grid != FLOOR
+    flat: np.ndarray = np.arange(grid.size, dtype=np.int64).reshape(grid.shape)
+    seats: np.ndarray = np.flatnonzero(is_seat)
+    # Seat number of each flat grid position that's a seat
+    seat_number: np.ndarray = np.full(grid.size, -1, dtype=np.int64)
+    seat_number[seats] = np.arange(len(seats))
+    visible: np.ndarray = np.stack(
+        [
+            find(is_seat, flat, row_vec, col_vec).ravel()[seats]
+            for row_vec in (-1, 0, 1)
+            for col_vec in (-1, 0, 1)
+            if row_vec or col_vec
+        ],
+        axis=1,
+    )
+    found: np.ndarray = visible >= 0
+    indptr: np.ndarray = np.zeros(len(seats) + 1, dtype=np.int64)
+    np.cumsum(found.sum(axis=1), out=indptr[1:])
+    return SeatIndex(seats, indptr, seat_number[visible[found]])
+
+
+def adjacent_index(grid: np.ndarray) -> SeatIndex:
+    """Work out which seats are next to each seat.
+
+    Parameters
+    ----------
+    grid: np.ndarray
+        The tile codes
+
+    Returns
+    -------
+    SeatIndex
+        The seats among the 8 tiles around every seat
+    """
+    return _build_index(grid, _adjacent_seats)
+
+
+def line_of_sight_index(grid: np.ndarray) -> SeatIndex:
+    """Work out which seats each seat can see.
+
+    Floor never changes, so this only has to be done once per layout.
+
+    Parameters
+    ----------
+    grid: np.ndarray
+        The tile codes
+
+    Returns
+    -------
+    SeatIndex
+        The first seat in each of the 8 directions from every seat
+    """
+    return _build_index(grid, _nearest_seats)
+
+
+# Incremental runs recount every seat once more than 1 in this many change
+RECOUNT_SHARE: int = 8
+
+# How to find each seat's neighbours and how many occupied ones make it leave
+RULES: Dict[str, Tuple[Callable[[np.ndarray], SeatIndex], int]] = {
+    "original": (adjacent_index, 4),
+    "enhanced": (line_of_sight_index, 5),
+}
+
+
+def count_occupied(index: SeatIndex, occupied: np.ndarray) -> np.ndarray:
+    """Count every seat's occupied neighbours.
+
+    Parameters
+    ----------
+    index: SeatIndex
+        The neighbours of every seat
+    occupied: np.ndarray
+        True for each occupied seat, by seat number
+
+    Returns
+    -------
+    np.ndarray
+        How many of each seat's neighbours are occupied
+    """
+    # Per seat sums from differences of a running total over all neighbours
+    totals: np.ndarray = np.zeros(len(index.indices) + 1, dtype=np.int64)
+    np.cumsum(occupied[index.indices], out=totals[1:])
+    return totals[index.indptr[1:]] - totals[index.indptr[:-1]]
+
+
+def neighbours_of(index: SeatIndex, seats: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Look up the neighbours of some of the seats.
+
+    Parameters
+    ----------
+    index: SeatIndex
+        The neighbours of every seat
+    seats: np.ndarray
+        The seat numbers to look up
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        All of their neighbours one after the other, and how many each of the
+        seats has
+    """
+    starts: np.ndarray = index.indptr[seats]
+    lengths: np.ndarray = index.indptr[seats + 1] - starts
+    # Position of each entry within its seat's run of neighbours
+    offsets: np.ndarray = np.arange(lengths.sum()) - np.repeat(
+        np.cumsum(lengths) - lengths, lengths
+    )
+    return index.indices[np.repeat(starts, lengths) + offsets], lengths
+
+
+def _check_generations(generation: int, max_generations: Optional[int]) -> None:
+    """Stop a run that's gone on for too long.
+
+    Parameters
+    ----------
+    generation: int
+        How many generations have changed the layout so far
+    max_generations: int, optional
+        The most allowed, or None for no limit
+
+    Raises
+    ------
+    RuntimeError
+        If there have been more than max_generations
+    """
+    if max_generations is not None and generation > max_generations:
+        raise RuntimeError(f"Still changing after {max_generations} generations")
 
 
 class Lobby:
     """Waiting area for the ferry."""
 
-    def __init__(self, state: List[List[str]]) -> None:
+    def __init__(self, state: Sequence[Sequence[str]]) -> None:
         """Set the initial state of the waiting area.
 
         Parameters
         ----------
-        state: List[List[str]]
+        state: Sequence[Sequence[str]]
             the layout of the lobby
         """
-        self.state: List[List[str]] = state
-        self.rows = len(self.state)
-        self.cols = len(self.state[0])
+        self.grid: np.ndarray = encode(state)
+        self.rows, self.cols = self.grid.shape
+        # Floor never changes between generations, so these are kept
+        self._indexes: Dict[str, SeatIndex] = {}
+
+    @property
+    def state(self) -> List[List[str]]:
+        """Get the layout of the lobby.
+
+        Returns
+        -------
+        List[List[str]]
+            The layout as rows of ``.``, ``L`` and ``#``
+        """
+        return decode(self.grid)
 
-    def _adjacent_values(self, row: int, col: int) -> Counter[str]:
-        """Count how many of each type of tile are adjacent to a tile.
+    @state.setter
+    def state(self, state: Sequence[Sequence[str]]) -> None:
+        """Replace the layout of the lobby.
 
         Parameters
         ----------
-        row: int
-            row coordinate for the value
-        col: int
-            col coordinate for the value
+        state: Sequence[Sequence[str]]
+            The layout as rows of ``.``, ``L`` and ``#``
+        """
+        self.grid = encode(state)
+        self.rows, self.cols = self.grid.shape
+        self._indexes = {}
+
+    def _next_original(self) -> np.ndarray:
+        """Apply the adjacent seat rules to the whole grid at once.
 
         Returns
         -------
-        Counter
-            How many of each type of tile is in the adjacent tiles
+        np.ndarray
+            The next grid
         """
-        min_row: int = max(0, row - 1)
-        max_row: int = min(row + 1, len(self.state) - 1)
-        min_col: int = max(0, col - 1)
-        max_col: int = min(col + 1, len(self.state[0]) - 1)
-        adj_values: Counter[str] = Counter()
-        for adj_row in range(min_row, max_row + 1):
-            for adj_col in range(min_col, max_col + 1):
-                if (row == adj_row) & (col == adj_col):
-                    pass
-                else:
-                    value: str = self.state[adj_row][adj_col]
-                    adj_values[value] += 1
-        return adj_values
-
-    def _enhanced_adjacent_values(self, row: int, col: int) -> Counter[str]:
-        """Count how many of each type of tile are adjacent to a tile by line of sight.
+        grid: np.ndarray = self.grid
+        counts: np.ndarray = occupied_neighbours(grid)
+        new_grid: np.ndarray = grid.copy()
+        new_grid[(grid == EMPTY) & (counts == 0)] = OCCUPIED
+        new_grid[(grid == OCCUPIED) & (counts >= 4)] = EMPTY
+        return new_grid
+
+    def neighbour_index(self, update_func: str = "original") -> SeatIndex:
+        """Get the neighbours of every seat, working them out the first time.
 
         Parameters
         ----------
-        row: int
-            row coordinate for the value
-        col: int
-            col coordinate for the value
+        update_func: str
+            Which rules' neighbours to get, "original" or "enhanced"
 
         Returns
         -------
-        Counter
-            How many of each type of tile is in the adjacent tiles
+        SeatIndex
+            The adjacent seats for the original rules, or the line of sight
+            ones for the enhanced rules
         """
-        adj_values: Counter[str] = Counter()
-        vectors: Tuple[int, int, int] = (-1, 0, 1)
-        # Don't worry about empty tiles
-        for row_vec in vectors:
-            for col_vec in vectors:
-                if row_vec == 0 == col_vec:
-                    pass
-                else:
-                    check_row: int = row
-                    check_col: int = col
-                    check_val: str = "."
-                    while check_val == ".":
-                        check_row += row_vec
-                        check_col += col_vec
-                        row_in_bounds: bool = 0 <= check_row < self.rows
-                        col_in_bounds: bool = 0 <= check_col < self.cols
-                        if row_in_bounds & col_in_bounds:
-                            check_val = self.state[check_row][check_col]
-                        else:
-                            check_val = "B"
-                    adj_values[check_val] += 1
-        return adj_values
-
-    def _update_value(self, row: int, col: int) -> str:
-        """Calculate the next state of a point based on the rules.
+        if update_func not in self._indexes:
+            self._indexes[update_func] = RULES[update_func][0](self.grid)
+        return self._indexes[update_func]
 
-        Parameters
-        ----------
-        row: int
-            The row index of the value
-        col: int
-            The column index of the value
+    def _next_enhanced(self) -> np.ndarray:
+        """Apply the line of sight rules to every seat at once.
 
         Returns
         -------
-        str
-            What the value should be updated to.
+        np.ndarray
+            The next grid
         """
-        current_val: str = self.state[row][col]
-        if current_val == ".":
-            return current_val
-        adjacent_vals: Counter[str] = self._adjacent_values(row, col)
-        if (current_val == "L") & (adjacent_vals["#"] == 0):
-            return "#"
-        elif (current_val == "#") & (adjacent_vals["#"] >= 4):
-            return "L"
-        else:
-            return current_val
-
-    def _enhanced_update_value(self, row: int, col: int) -> str:
-        """Calculate the next state of a point based on the rules.
+        index: SeatIndex = self.neighbour_index("enhanced")
+        current: np.ndarray = self.grid.ravel()[index.seats]
+        counts: np.ndarray = count_occupied(index, current == OCCUPIED)
+        updated: np.ndarray = current.copy()
+        updated[(current == EMPTY) & (counts == 0)] = OCCUPIED
+        updated[(current == OCCUPIED) & (counts >= 5)] = EMPTY
+        new_grid: np.ndarray = self.grid.copy()
+        new_grid.ravel()[index.seats] = updated
+        return new_grid
+
+    def _next_grid(self, update_func: str) -> np.ndarray:
+        """Calculate the next grid with the chosen rules.
 
         Parameters
         ----------
-        row: int
-            The row index of the value
-        col: int
-            The column index of the value
+        update_func: str
+            Update function to call, "original" or "enhanced"
 
         Returns
         -------
-        str
-            What the value should be updated to.
+        np.ndarray
+            The next grid
         """
-        current_val: str = self.state[row][col]
-        if current_val == ".":
-            return current_val
-        adjacent_vals: Counter[str] = self._enhanced_adjacent_values(row, col)
-        if (current_val == "L") & (adjacent_vals["#"] == 0):
-            return "#"
-        elif (current_val == "#") & (adjacent_vals["#"] >= 5):
-            return "L"
-        else:
-            return current_val
+        func_dict: Dict[str, Callable[[], np.ndarray]] = {
+            "original": self._next_original,
+            "enhanced": self._next_enhanced,
+        }
+        return func_dict[update_func]()
 
     def get_next_state(self, update_func: str = "original") -> List[List[str]]:
         """Calculate what the next state would be.
@@ -153,23 +445,14 @@ class Lobby:
         List[List[str]]
             The next state of the lobby
         """
-        func_dict: Dict[str, Callable[[int, int], str]] = {
-            "original": self._update_value,
-            "enhanced": self._enhanced_update_value,
-        }
-        updater: Callable[[int, int], str] = func_dict[update_func]
-        new_state: List[List[str]] = copy.deepcopy(self.state)
-        for row in range(self.rows):
-            for col in range(self.cols):
-                new_state[row][col] = updater(row, col)
-        return new_state
-
-    def is_stabilized(self, new_layout: List[List[str]]) -> bool:
+        return decode(self._next_grid(update_func))
+
+    def is_stabilized(self, new_layout: Sequence[Sequence[str]]) -> bool:
         """Check if we've reached equilibrium.
 
         Parameters
         ----------
-        new_layout: List[List[str]]
+        new_layout: Sequence[Sequence[str]]
             The updated layout to compare to the current state
 
         Returns
@@ -177,30 +460,113 @@ class Lobby:
         bool:
             Whether all tiles are identical
         """
-        if len(self.state) != len(new_layout):
-            return False
-        if len(self.state[0]) != len(new_layout[0]):
-            return False
-        for row in range(len(self.state)):
-            for col in range(len(self.state[0])):
-                if self.state[row][col] != new_layout[row][col]:
-                    return False
-        return True
-
-    def run_to_equilibrium(self, update_func: str = "original") -> None:
+        return bool(np.array_equal(self.grid, encode(new_layout)))
+
+    def run_to_equilibrium(
+        self,
+        update_func: str = "original",
+        incremental: bool = False,
+        max_generations: Optional[int] = None,
+    ) -> None:
         """Keep updating until we stabilize.
 
+        Some layouts never settle and flip between two states forever, so the
+        state two generations back is checked too.
+
         Parameters
         ----------
         update_func: str
             Update function to call, "original" or "enhanced"
+        incremental: bool
+            Only recheck seats next to ones that changed in the generation
+            before, rather than the whole grid every generation
+        max_generations: int, optional
+            Give up after this many generations, by default there's no limit
+
+        Raises
+        ------
+        RuntimeError
+            If the layout starts repeating without settling, or is still
+            changing after max_generations
         """
+        if incremental:
+            self._run_incremental(update_func, max_generations)
+            return
+        previous: Optional[np.ndarray] = None
+        generation: int = 0
         while True:
-            next_state: List[List[str]] = self.get_next_state(update_func)
-            if self.is_stabilized(next_state):
+            next_grid: np.ndarray = self._next_grid(update_func)
+            if np.array_equal(self.grid, next_grid):
                 break
-            else:
-                self.state = next_state
+            if previous is not None and np.array_equal(previous, next_grid):
+                raise RuntimeError("Layout flips back and forth instead of settling")
+            generation += 1
+            _check_generations(generation, max_generations)
+            previous, self.grid = self.grid, next_grid
+
+    def _run_incremental(
+        self, update_func: str, max_generations: Optional[int] = None
+    ) -> None:
+        """Update only the frontier of seats that might change until it's empty.
+
+        A seat can only change if it or one of its neighbours changed in the
+        generation before, so those are all that's checked. Occupied
+        neighbour counts are adjusted as seats change instead of recounted,
+        unless so many change that recounting is cheaper. Flipping the same
+        seats two generations running gets back to where they started, so
+        that's how a repeating layout is spotted.
+
+        Parameters
+        ----------
+        update_func: str
+            Which rules to follow, "original" or "enhanced"
+        max_generations: int, optional
+            Give up after this many generations, by default there's no limit
+
+        Raises
+        ------
+        RuntimeError
+            If the layout starts repeating without settling, or is still
+            changing after max_generations
+        """
+        index: SeatIndex = self.neighbour_index(update_func)
+        crowded: int = RULES[update_func][1]
+        occupied: np.ndarray = self.grid.ravel()[index.seats] == OCCUPIED
+        counts: np.ndarray = count_occupied(index, occupied)
+        every_seat: np.ndarray = np.arange(len(index.seats))
+        frontier: np.ndarray = every_seat
+        # Scratch space to drop repeated seats from the frontier
+        slot: np.ndarray = np.zeros(len(index.seats), dtype=np.int64)
+        last_changed: np.ndarray = every_seat[:0]
+        generation: int = 0
+        while len(frontier):
+            flips: np.ndarray = np.where(
+                occupied[frontier], counts[frontier] >= crowded, counts[frontier] == 0
+            )
+            changed: np.ndarray = np.sort(frontier[flips])
+            if len(changed) and np.array_equal(changed, last_changed):
+                raise RuntimeError("Layout flips back and forth instead of settling")
+            last_changed = changed
+            if len(changed):
+                generation += 1
+                _check_generations(generation, max_generations)
+            occupied[changed] ^= True
+            if len(changed) * RECOUNT_SHARE > len(every_seat):
+                # Most seats are near a change, so it's cheaper to redo them all
+                counts = count_occupied(index, occupied)
+                frontier = every_seat
+                continue
+            neighbours, lengths = neighbours_of(index, changed)
+            deltas: np.ndarray = np.repeat(np.where(occupied[changed], 1, -1), lengths)
+            np.add.at(counts, neighbours, deltas)
+            candidates: np.ndarray = np.concatenate((changed, neighbours))
+            # Exactly one copy of each seat finds its own position still there
+            positions: np.ndarray = np.arange(len(candidates))
+            slot[candidates] = positions
+            frontier = candidates[slot[candidates] == positions]
+        new_grid: np.ndarray = self.grid.copy()
+        new_grid.ravel()[index.seats] = np.where(occupied, OCCUPIED, EMPTY)
+        self.grid = new_grid
 
     def calc_occupied_seats(self) -> int:
         """Count the number of currently occupied seats.
@@ -210,12 +576,7 @@ class Lobby:
         int
             The number of occupied seats.
         """
-        occupied_seats: int = 0
-        for row in range(len(self.state)):
-            for col in range(len(self.state[0])):
-                if self.state[row][col] == "#":
-                    occupied_seats += 1
-        return occupied_seats
+        return int(np.count_nonzero(self.grid == OCCUPIED))
 
 
 def read_inputs(filename: str = "input.txt") -> List[List[str]]:
@@ -232,8 +593,7 @@ def read_inputs(filename: str = "input.txt") -> List[List[str]]:
         The layout
     """
     in_path: Path = Path(__file__).resolve().parent / filename
-    with open(in_path, "r") as f:
-        return [[char for char in line.strip()] for line in f.readlines()]
+    return [list(line.strip()) for line in read_lines(in_path) if line.strip()]
 
 
 def part1(filename: str = "input.txt") -> int:
@@ -250,7 +610,7 @@ def part1(filename: str = "input.txt") -> int:
         The answer to part 1
     """
     lobby: Lobby = Lobby(read_inputs(filename))
-    lobby.run_to_equilibrium()
+    lobby.run_to_equilibrium(incremental=True)
     return lobby.calc_occupied_seats()
 
 
@@ -268,7 +628,7 @@ def part2(filename: str = "input.txt") -> int:
         The answer to part 2
     """
     lobby: Lobby = Lobby(read_inputs(filename))
-    lobby.run_to_equilibrium("enhanced")
+    lobby.run_to_equilibrium("enhanced", incremental=True)
     return lobby.calc_occupied_seats()
 
 
@@ -1,9 +1,61 @@
-"""Day 11 of the advent of code challenge."""
+"""Day 12 of the advent of code challenge.
+
+Routes are compiled into parallel arrays of integer opcodes and operands, and
+then folded over a handful of ints. Turns are quarter turn rotation matrices,
+so no objects are created per step.
+"""
 from __future__ import annotations
 
-import itertools
+from array import array
+from concurrent.futures import as_completed, Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, NamedTuple, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from advent.io import read_lines
+
+# Opcodes 0-3 move in a compass direction, in anticlockwise order from east
+EAST: int = 0
+NORTH: int = 1
+WEST: int = 2
+SOUTH: int = 3
+TURN: int = 4
+FORWARD: int = 5
+
+COMPASS: str = "ENWS"
+OPCODES: Dict[str, int] = {
+    "E": EAST,
+    "N": NORTH,
+    "W": WEST,
+    "S": SOUTH,
+    "L": TURN,
+    "R": TURN,
+    "F": FORWARD,
+}
+# Unit vector for each compass opcode
+UNIT: Tuple[Tuple[int, int], ...] = ((1, 0), (0, 1), (-1, 0), (0, -1))
+# (a, b, c, d) for [[a, b], [c, d]], turning anticlockwise by that many quarters
+ROTATIONS: Tuple[Tuple[int, int, int, int], ...] = (
+    (1, 0, 0, 1),
+    (0, -1, 1, 0),
+    (-1, 0, 0, -1),
+    (0, 1, -1, 0),
+)
+
+
+def read_directions(path: Union[str, Path]) -> List[Tuple[str, int]]:
+    """Read in and parse a file of directions.
+
+    Parameters
+    ----------
+    path: str or Path
+        The file to load
+
+    Returns
+    -------
+    list[Tuple[str, int]]
+        The directions
+    """
+    return [(line[0], int(line[1:])) for line in read_lines(path) if line.strip()]
 
 
 def read_inputs(filename: str = "input.txt") -> List[Tuple[str, int]]:
@@ -19,9 +71,133 @@ def read_inputs(filename: str = "input.txt") -> List[Tuple[str, int]]:
     list[Tuple[str, int]]
         The directions
     """
-    in_path: Path = Path(__file__).resolve().parent / filename
-    with open(in_path, "r") as f:
-        return [(line[0], int(line[1:])) for line in f.readlines()]
+    return read_directions(Path(__file__).resolve().parent / filename)
+
+
+def quarter_turns(direction: str, degrees: int) -> int:
+    """Work out how many quarter turns anticlockwise a turn is.
+
+    Parameters
+    ----------
+    direction: str
+        L or R
+    degrees: int
+        Multiple of 90 to turn
+
+    Returns
+    -------
+    int
+        The turn as 0 to 3 quarter turns to the left
+
+    Raises
+    ------
+    ValueError
+        If the direction isn't L or R or the angle isn't a multiple of 90
+    """
+    if direction not in ("L", "R"):
+        raise ValueError(f"Invalid turn direction: {direction}")
+    if degrees % 90 != 0:
+        raise ValueError(f"Must turn multiple of 90 degrees, got {degrees}")
+    quarters: int = degrees // 90
+    return quarters % 4 if direction == "L" else -quarters % 4
+
+
+class Route(NamedTuple):
+    """A compiled route, with an opcode and operand for each instruction."""
+
+    opcodes: array
+    operands: array
+
+    def __len__(self) -> int:
+        """Count the instructions.
+
+        Returns
+        -------
+        int
+            The number of instructions in the route
+        """
+        return len(self.opcodes)
+
+
+def compile_route(directions: Iterable[Tuple[str, int]]) -> Route:
+    """Compile directions into integer opcode and operand arrays.
+
+    Turns are stored as quarter turns anticlockwise, everything else keeps its
+    amount.
+
+    Parameters
+    ----------
+    directions: Iterable[Tuple[str, int]]
+        Which way to move or turn and by how much
+
+    Returns
+    -------
+    Route
+        The opcodes and operands
+
+    Raises
+    ------
+    ValueError
+        If an instruction isn't one the ship understands
+    """
+    opcodes: array = array("b")
+    operands: array = array("q")
+    for action, amount in directions:
+        opcode: int = OPCODES.get(action, -1)
+        if opcode < 0:
+            raise ValueError(f"Invalid instruction {(action, amount)}")
+        opcodes.append(opcode)
+        operands.append(quarter_turns(action, amount) if opcode == TURN else amount)
+    return Route(opcodes, operands)
+
+
+def navigate(
+    route: Route,
+    location: Tuple[int, int] = (0, 0),
+    heading: Tuple[int, int] = (1, 0),
+    steer_waypoint: bool = False,
+) -> Tuple[int, int, int, int]:
+    """Follow a compiled route.
+
+    Both sets of rules keep a vector the ship moves along when it goes
+    forward and turn it on L and R. The old rules start it as a unit vector
+    for the way the ship faces and move the ship on N, S, E and W. The new
+    rules start it at the waypoint and move that instead.
+
+    Parameters
+    ----------
+    route: Route
+        The compiled route
+    location: Tuple[int, int]
+        Where the ship starts
+    heading: Tuple[int, int]
+        The vector the ship moves along going forward
+    steer_waypoint: bool
+        Move the heading on N, S, E and W rather than the ship
+
+    Returns
+    -------
+    Tuple[int, int, int, int]
+        Where the ship ends up and the heading vector at the end
+    """
+    x, y = location
+    dx, dy = heading
+    for opcode, operand in zip(route.opcodes, route.operands):
+        if opcode == FORWARD:
+            x += dx * operand
+            y += dy * operand
+        elif opcode == TURN:
+            a, b, c, d = ROTATIONS[operand]
+            dx, dy = a * dx + b * dy, c * dx + d * dy
+        else:
+            unit_x, unit_y = UNIT[opcode]
+            if steer_waypoint:
+                dx += unit_x * operand
+                dy += unit_y * operand
+            else:
+                x += unit_x * operand
+                y += unit_y * operand
+    return x, y, dx, dy
 
 
 class Vector(NamedTuple):
@@ -60,16 +236,16 @@ class Ship:
         -------
         Vector
             The associated vector
+
+        Raises
+        ------
+        IndexError
+            If the compass direction isn't one of NSEW
         """
-        compass_dict: Dict[str, Vector] = {
-            "N": Vector(0, 1),
-            "S": Vector(0, -1),
-            "E": Vector(1, 0),
-            "W": Vector(-1, 0),
-        }
-        if compass not in compass_dict:
+        opcode: int = COMPASS.find(compass)
+        if opcode < 0 or len(compass) != 1:
             raise IndexError(f"{compass} is not a valid orientation")
-        return compass_dict[compass]
+        return Vector(*UNIT[opcode])
 
     @property
     def manhattan_dist(self) -> int:
@@ -92,32 +268,12 @@ class Ship:
         degrees: int
             Multiple of 90 to turn
         """
-        if direction not in ("L", "R"):
-            raise ValueError(f"Invalid turn direction: {direction}")
-        if degrees % 90 != 0:
-            raise ValueError(f"Must turn multiple of 90 degrees, got {degrees}")
-        num_turns: int = degrees // 90
-        compass_seq_right: List[str] = ["N", "E", "S", "W"]
-        compass_seq_left: List[str] = list(reversed(compass_seq_right))
-        rotate_seq: Iterable[str]
-        if direction == "R":
-            rotate_seq = itertools.cycle(compass_seq_right)
-        else:
-            rotate_seq = itertools.cycle(compass_seq_left)
-        # Get set up to our current direction
-        new_dir: str = next(rotate_seq)
-        while new_dir != self.facing:
-            new_dir = next(rotate_seq)
-        # Now turn the correct number of times
-        for _ in range(num_turns):
-            new_dir = next(rotate_seq)
-        self.facing = new_dir
+        quarters: int = quarter_turns(direction, degrees)
+        self.facing = COMPASS[(COMPASS.index(self.facing) + quarters) % 4]
 
     def rotate_waypoint(self, direction: str, degrees: int) -> None:
         """Rotate the waypoint around the ship.
 
-        https://stackoverflow.com/questions/34372480/rotate-point-about-another-point-in-degrees-python  # noqaB950
-
         Parameters
         ----------
         direction: str
@@ -125,23 +281,9 @@ class Ship:
         degrees: int
             Multiple of 90 to turn
         """
-
-        if direction not in ("L", "R"):
-            raise ValueError(f"Invalid turn direction: {direction}")
-        if direction == "R":
-            if degrees == 90:
-                self.waypoint = Vector(self.waypoint.y, -self.waypoint.x)
-            elif degrees == 180:
-                self.waypoint = Vector(-self.waypoint.x, -self.waypoint.y)
-            elif degrees == 270:
-                self.waypoint = Vector(-self.waypoint.y, self.waypoint.x)
-        else:
-            if degrees == 90:
-                self.waypoint = Vector(-self.waypoint.y, self.waypoint.x)
-            elif degrees == 180:
-                self.waypoint = Vector(-self.waypoint.x, -self.waypoint.y)
-            elif degrees == 270:
-                self.waypoint = Vector(self.waypoint.y, -self.waypoint.x)
+        a, b, c, d = ROTATIONS[quarter_turns(direction, degrees)]
+        x, y = self.waypoint
+        self.waypoint = Vector(a * x + b * y, c * x + d * y)
 
     def move(self, direction: str, amount: int, ship: bool = True) -> None:
         """Move the ship or waypoint.
@@ -156,14 +298,13 @@ class Ship:
             Move the ship (default) or waypoint
         """
         vec: Vector = self._compass_to_vec(direction)
-        scaled_vec: Vector = Vector(vec.x * amount, vec.y * amount)
         if ship:
             self.location = Point(
-                self.location.x + scaled_vec.x, self.location.y + scaled_vec.y
+                self.location.x + vec.x * amount, self.location.y + vec.y * amount
             )
         else:
             self.waypoint = Vector(
-                self.waypoint.x + scaled_vec.x, self.waypoint.y + scaled_vec.y
+                self.waypoint.x + vec.x * amount, self.waypoint.y + vec.y * amount
             )
 
     def move_to_waypoint(self, amount: int) -> None:
@@ -174,9 +315,9 @@ class Ship:
         amount: int
             Number of times to move along the waypoint vector
         """
-        scaled_vec: Vector = Vector(self.waypoint.x * amount, self.waypoint.y * amount)
         self.location = Point(
-            self.location.x + scaled_vec.x, self.location.y + scaled_vec.y
+            self.location.x + self.waypoint.x * amount,
+            self.location.y + self.waypoint.y * amount,
         )
 
     def take_direction_deprecated(self, direction: Tuple[str, int]) -> None:
@@ -186,6 +327,11 @@ class Ship:
         ----------
         direction: Tuple[str, int]
             which way to move or turn and by how much
+
+        Raises
+        ------
+        ValueError
+            If the instruction isn't one the ship understands
         """
         if direction[0] == "F":
             self.move(self.facing, direction[1])
@@ -203,6 +349,11 @@ class Ship:
         ----------
         direction: Tuple[str, int]
             which way to move or turn and by how much
+
+        Raises
+        ------
+        ValueError
+            If the instruction isn't one the ship understands
         """
         if direction[0] == "F":
             self.move_to_waypoint(direction[1])
@@ -213,6 +364,91 @@ class Ship:
         else:
             raise ValueError(f"Invalid instruction f{direction}")
 
+    def follow_route_deprecated(self, route: Route) -> None:
+        """Follow a whole compiled route, like take_direction_deprecated.
+
+        Parameters
+        ----------
+        route: Route
+            The compiled route
+        """
+        x, y, dx, dy = navigate(route, self.location, UNIT[COMPASS.index(self.facing)])
+        self.location = Point(x, y)
+        self.facing = COMPASS[UNIT.index((dx, dy))]
+
+    def follow_route_updated(self, route: Route) -> None:
+        """Follow a whole compiled route, like take_direction_updated.
+
+        Parameters
+        ----------
+        route: Route
+            The compiled route
+        """
+        x, y, dx, dy = navigate(route, self.location, self.waypoint, True)
+        self.location = Point(x, y)
+        self.waypoint = Vector(dx, dy)
+
+
+class Voyage(NamedTuple):
+    """Where one ship of a fleet ends up under each set of rules."""
+
+    # Position of the route in the fleet and the file it came from
+    number: int
+    source: str
+    deprecated: int
+    updated: int
+
+
+def evaluate_route(number: int, source: Union[str, Path]) -> Voyage:
+    """Follow one ship's route under both sets of rules.
+
+    Parameters
+    ----------
+    number: int
+        Position of the route in the fleet
+    source: str or Path
+        The file of directions
+
+    Returns
+    -------
+    Voyage
+        The Manhattan distance the ship ends up at under each set of rules
+    """
+    route: Route = compile_route(read_directions(source))
+    x, y, _, _ = navigate(route)
+    deprecated: int = abs(x) + abs(y)
+    x, y, _, _ = navigate(route, heading=(10, 1), steer_waypoint=True)
+    return Voyage(number, str(source), deprecated, abs(x) + abs(y))
+
+
+def evaluate_fleet(
+    sources: Iterable[Union[str, Path]], workers: Optional[int] = None
+) -> Iterator[Voyage]:
+    """Follow every ship's route across a pool of processes.
+
+    Each worker reads and compiles its own route, so only file names and
+    distances cross between processes.
+
+    Parameters
+    ----------
+    sources: Iterable[str or Path]
+        A file of directions per ship
+    workers: int, optional
+        Number of worker processes, defaults to the number of CPUs
+
+    Yields
+    ------
+    Voyage
+        Each ship's distances, in the order they finish
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: List[Future] = [
+            executor.submit(evaluate_route, number, source)
+            for number, source in enumerate(sources)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
 
 def part1(filename: str = "input.txt") -> int:
     """Solve part 1 of the puzzle.
@@ -227,10 +463,8 @@ def part1(filename: str = "input.txt") -> int:
     int:
         The answer to part 1
     """
-    directions: List[Tuple[str, int]] = read_inputs(filename)
     boaty_mc_boatface = Ship()
-    for direction in directions:
-        boaty_mc_boatface.take_direction_deprecated(direction)
+    boaty_mc_boatface.follow_route_deprecated(compile_route(read_inputs(filename)))
     return boaty_mc_boatface.manhattan_dist
 
 
@@ -247,10 +481,8 @@ def part2(filename: str = "input.txt") -> int:
     int:
         The answer to part 2
     """
-    directions: List[Tuple[str, int]] = read_inputs(filename)
     boaty_mc_boatface = Ship()
-    for direction in directions:
-        boaty_mc_boatface.take_direction_updated(direction)
+    boaty_mc_boatface.follow_route_updated(compile_route(read_inputs(filename)))
     return boaty_mc_boatface.manhattan_dist
 
 
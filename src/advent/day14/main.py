@@ -6,6 +6,8 @@ from pathlib import Path
 import re
 from typing import List, NamedTuple, Optional
 
+from advent.io import read_lines
+
 
 def int_to_bits(num: int, nbits: int = 36) -> str:
     """Turn an integer into a 32 bit unsigned int.
@@ -166,15 +168,14 @@ def part1(filename: str = "input.txt") -> int:
     bitmask: str = ""
     addresses: Counter = Counter()
     in_path: Path = Path(__file__).resolve().parent / filename
-    with open(in_path, "r") as f:
-        for line in f.readlines():
-            if line.startswith("mask"):
-                bitmask = parse_bitmasks(line)
-            elif line.startswith("mem"):
-                address: Address = parse_address(line)
-                addresses[address.location] = apply_bitmasks(bitmask, address.value)
-            else:
-                raise ValueError(f"unrecognized line: {line}")
+    for line in read_lines(in_path):
+        if line.startswith("mask"):
+            bitmask = parse_bitmasks(line)
+        elif line.startswith("mem"):
+            address: Address = parse_address(line)
+            addresses[address.location] = apply_bitmasks(bitmask, address.value)
+        else:
+            raise ValueError(f"unrecognized line: {line}")
     return sum(addresses.values())
 
 
@@ -194,14 +195,13 @@ def part2(filename: str = "input.txt") -> int:
     bitmask: str = ""
     addresses: Counter = Counter()
     in_path: Path = Path(__file__).resolve().parent / filename
-    with open(in_path, "r") as f:
-        for line in f.readlines():
-            if line.startswith("mask"):
-                bitmask = parse_bitmasks(line)
-            elif line.startswith("mem"):
-                address: Address = parse_address(line)
-                for index in apply_bitmasks2(bitmask, address.location):
-                    addresses[index] = address.value
-            else:
-                raise ValueError(f"unrecognized line: {line}")
+    for line in read_lines(in_path):
+        if line.startswith("mask"):
+            bitmask = parse_bitmasks(line)
+        elif line.startswith("mem"):
+            address: Address = parse_address(line)
+            for index in apply_bitmasks2(bitmask, address.location):
+                addresses[index] = address.value
+        else:
+            raise ValueError(f"unrecognized line: {line}")
     return sum(addresses.values())
@@ -6,6 +6,8 @@ from pathlib import Path
 import re
 from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
 
+from advent.io import read_records
+
 
 class Rule(NamedTuple):
     """I define a ticket field's valid numbers."""
@@ -60,21 +62,19 @@ def read_inputs(
         The directions
     """
     in_path: Path = Path(__file__).resolve().parent / filename
-    with open(in_path, "r") as f:
-        puzzle = f.read()
-    rules: str
-    mine: str
-    others: str
-    rules, mine, others = puzzle.split("\n\n")
-    rule_list: List[Rule] = [parse_rule(line) for line in rules.split("\n")]
-    for line in mine.split("\n"):
+    rules: List[str]
+    mine: List[str]
+    others: List[str]
+    rules, mine, others = read_records(in_path)
+    rule_list: List[Rule] = [parse_rule(line) for line in rules]
+    for line in mine:
         if line.startswith("your"):
             pass
         else:
             my_nums: List[int] = [int(char) for char in line.split(",")]
     other_nums: List[List[int]] = [
         [int(char) for char in line.split(",")]
-        for line in others.split("\n")
+        for line in others
         if not line.startswith("nearby")
     ]
     return rule_list, my_nums, other_nums
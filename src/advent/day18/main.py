@@ -5,6 +5,8 @@ import math
 from pathlib import Path
 from typing import Generator, List
 
+from advent.io import read_lines
+
 
 def read_inputs(filename: str) -> Generator[str, None, None]:
     """Read in a text file of inputs.
@@ -22,9 +24,7 @@ def read_inputs(filename: str) -> Generator[str, None, None]:
     """
     here: Path = Path(__file__).resolve().parent
     in_path: Path = here / filename
-    with open(in_path, "r") as f:
-        for line in f.readlines():
-            yield line
+    yield from read_lines(in_path)
 
 
 def matching_brace_index(line: str) -> int:
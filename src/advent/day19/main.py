@@ -5,6 +5,8 @@ from collections import deque
 from pathlib import Path
 from typing import Dict, List, NamedTuple, Optional, Tuple
 
+from advent.io import read_records
+
 
 class Rule(NamedTuple):
     """I'm  a message rule."""
@@ -52,15 +54,12 @@ def read_inputs(filename: str) -> Tuple[Dict[int, Rule], List[str]]:
     """
     here: Path = Path(__file__).resolve().parent
     in_path: Path = here / filename
-    with open(in_path, "r") as f:
-        rules_str: str
-        messages_str: str
-        rules_str, messages_str = f.read().split("\n\n")
+    rule_lines: List[str]
+    messages: List[str]
+    rule_lines, messages = read_records(in_path)
     rules_dict: Dict[int, Rule] = {
-        rule.id: rule
-        for rule in (parse_rule(ruleline) for ruleline in rules_str.split("\n"))
+        rule.id: rule for rule in (parse_rule(ruleline) for ruleline in rule_lines)
     }
-    messages: List[str] = [message for message in messages_str.split("\n")]
     return rules_dict, messages
 
 
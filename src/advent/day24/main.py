@@ -6,6 +6,8 @@ import itertools
 from pathlib import Path
 from typing import Dict, List, NamedTuple
 
+from advent.io import read_lines
+
 
 class Vector(NamedTuple):
     """Movement through 2D space."""
@@ -158,8 +160,7 @@ def read_inputs(filename: str = "input.txt") -> List[Tile]:
         The tile positions
     """
     in_path: Path = Path(__file__).resolve().parent / filename
-    with open(in_path, "r") as f:
-        return [parse_line(line.strip()) for line in f.readlines()]
+    return [parse_line(line.strip()) for line in read_lines(in_path)]
 
 
 class Lobby:
@@ -0,0 +1,194 @@
+"""Stream puzzle inputs without loading whole files into memory.
+
+Lines are read one at a time from the open file, so memory use stays flat no
+matter how big the input is. Files of integers can instead be parsed in bulk
+from a memory map into a compact array.
+"""
+from array import array
+import mmap
+import os
+from pathlib import Path
+from typing import Iterator, List, Union
+
+import numpy as np
+
+# Bytes of a memory mapped file read at a time by read_chunks
+CHUNK_SIZE: int = 1 << 24
+# Any number with up to this many digits fits in an int64
+MAX_DIGITS: int = 18
+
+
+def read_lines(path: Union[str, Path]) -> Iterator[str]:
+    """Read a text file line by line.
+
+    Parameters
+    ----------
+    path: str or Path
+        The file to read
+
+    Yields
+    ------
+    str
+        The next line, without its trailing newline
+    """
+    with open(path, "r") as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+def read_records(path: Union[str, Path]) -> Iterator[List[str]]:
+    """Read a text file as records separated by blank lines.
+
+    Runs of several blank lines, or blank lines at the start or end of the
+    file, don't produce empty records.
+
+    Parameters
+    ----------
+    path: str or Path
+        The file to read
+
+    Yields
+    ------
+    List[str]
+        The lines of the next record, without their trailing newlines
+    """
+    record: List[str] = []
+    for line in read_lines(path):
+        if line.strip():
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+def parse_ints(raw: np.ndarray) -> np.ndarray:
+    """Parse every integer out of a buffer of ASCII text.
+
+    Numbers are runs of digits, optionally preceded by a minus sign. Anything
+    else separates them. Numbers longer than MAX_DIGITS could overflow int64,
+    so if there are any the result holds exact Python ints instead.
+
+    Parameters
+    ----------
+    raw: np.ndarray
+        The text as an array of uint8
+
+    Returns
+    -------
+    np.ndarray
+        The numbers in the order they appear, as int64, or as object if any
+        number has more than MAX_DIGITS digits
+    """
+    is_digit: np.ndarray = (raw >= ord("0")) & (raw <= ord("9"))
+    padded: np.ndarray = np.concatenate(([False], is_digit, [False]))
+    edges: np.ndarray = np.flatnonzero(padded[1:] != padded[:-1])
+    starts: np.ndarray = edges[::2]
+    lengths: np.ndarray = edges[1::2] - starts
+    totals: np.ndarray = np.zeros(len(starts), dtype=np.int64)
+    # Horner's method a column at a time, so the work scales with the count of
+    # numbers times the longest one rather than with every byte
+    for place in range(int(lengths.max(initial=0))):
+        longer: np.ndarray = lengths > place
+        digits: np.ndarray = raw[starts + np.where(longer, place, 0)] - ord("0")
+        totals = np.where(longer, totals * 10 + digits, totals)
+    if len(lengths) and lengths.max() > MAX_DIGITS:
+        totals = totals.astype(object)
+        for number in np.flatnonzero(lengths > MAX_DIGITS):
+            start: int = starts[number]
+            totals[number] = int(raw[start : start + lengths[number]].tobytes())
+    negative: np.ndarray = raw[np.maximum(starts - 1, 0)] == ord("-")
+    negative &= starts > 0
+    return np.where(negative, -totals, totals)
+
+
+def read_chunks(
+    path: Union[str, Path], chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Read a memory mapped file in blocks of whole lines.
+
+    Parameters
+    ----------
+    path: str or Path
+        The file to read
+    chunk_size: int
+        Roughly how many bytes to read at a time. A block only runs past this
+        to finish a line longer than the whole block.
+
+    Yields
+    ------
+    bytes
+        The next block of the file, ending at a line break or the end of file
+    """
+    with open(path, "rb") as f:
+        size: int = os.fstat(f.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start: int = 0
+            while start < size:
+                end: int = min(start + chunk_size, size)
+                if end < size:
+                    newline: int = mm.rfind(b"\n", start, end)
+                    if newline < 0:
+                        newline = mm.find(b"\n", end)
+                    end = size if newline < 0 else newline + 1
+                yield mm[start:end]
+                start = end
+
+
+def read_ints(path: Union[str, Path], chunk_size: int = CHUNK_SIZE) -> array:
+    """Read a text file of integers into a compact array.
+
+    The file is memory mapped and parsed a chunk at a time, so no string or
+    int object is created per number and only the result has to fit in memory.
+
+    Parameters
+    ----------
+    path: str or Path
+        The file to read
+    chunk_size: int
+        Roughly how many bytes to parse at a time
+
+    Returns
+    -------
+    array
+        The numbers in the file as a signed 64 bit array('q')
+
+    Raises
+    ------
+    ValueError
+        If a number doesn't fit in 64 bits
+    """
+    numbers: array = array("q")
+    for chunk in read_chunks(path, chunk_size):
+        parsed: np.ndarray = parse_ints(np.frombuffer(chunk, dtype=np.uint8))
+        try:
+            parsed = parsed.astype(np.int64)
+        except OverflowError as error:
+            raise ValueError(f"{path} has numbers that don't fit in 64 bits") from error
+        numbers.frombytes(parsed.tobytes())
+    return numbers
+
+
+def iter_ints(path: Union[str, Path], chunk_size: int = CHUNK_SIZE) -> Iterator[int]:
+    """Stream the integers in a text file one at a time.
+
+    Like read_ints, but only one chunk is held at a time, so the file can be
+    any length.
+
+    Parameters
+    ----------
+    path: str or Path
+        The file to read
+    chunk_size: int
+        Roughly how many bytes to parse at a time
+
+    Yields
+    ------
+    int
+        The next number in the file
+    """
+    for chunk in read_chunks(path, chunk_size):
+        yield from parse_ints(np.frombuffer(chunk, dtype=np.uint8)).tolist()
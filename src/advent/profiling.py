@@ -0,0 +1,175 @@
+"""Profile a solver's run time or memory use.
+
+Reports are limited to code in the solver's own day package so the hot spots in
+the puzzle code aren't buried under the standard library.
+"""
+import cProfile
+import importlib
+import io
+from pathlib import Path
+import pstats
+import re
+import threading
+import tracemalloc
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+Solver = Callable[[], Any]
+
+
+def package_dir(scope: str) -> Path:
+    """Find the folder a package lives in.
+
+    Parameters
+    ----------
+    scope: str
+        Dotted package name, e.g. advent.day17
+
+    Returns
+    -------
+    Path
+        The package's folder
+    """
+    module = importlib.import_module(scope)
+    return Path(str(module.__file__)).resolve().parent
+
+
+def profile(
+    solver: Solver,
+    scope: str,
+    output: Optional[Union[str, Path]] = None,
+    top: int = 25,
+) -> Tuple[Any, str]:
+    """Run a solver under cProfile.
+
+    Parameters
+    ----------
+    solver: Solver
+        The function to run, called with no arguments
+    scope: str
+        Package to limit the report to, e.g. advent.day17
+    output: str or Path, optional
+        Where to dump the raw pstats data, e.g. for snakeviz or flameprof
+    top: int
+        How many functions to include in the report
+
+    Returns
+    -------
+    Tuple[Any, str]
+        The solver's answer and a report sorted by cumulative time
+    """
+    profiler: cProfile.Profile = cProfile.Profile()
+    result: Any = profiler.runcall(solver)
+    if output is not None:
+        profiler.dump_stats(str(output))
+    stream: io.StringIO = io.StringIO()
+    stats: pstats.Stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    stats.print_stats(re.escape(str(package_dir(scope))), top)
+    return result, stream.getvalue()
+
+
+class _PeakSampler(threading.Thread):
+    """Keep a tracemalloc snapshot from close to the peak of traced memory.
+
+    Traced memory is polled, and a snapshot is only taken when the peak has
+    gone up since the last poll, so steady phases of the run cost a counter
+    read. A peak that comes and goes between two polls is only seen through
+    the peak counter, not in a snapshot.
+    """
+
+    def __init__(self, interval: float) -> None:
+        """Set up the sampler thread.
+
+        Parameters
+        ----------
+        interval: float
+            Seconds between checks of the traced memory
+        """
+        super().__init__(daemon=True)
+        self.interval: float = interval
+        self.stopped: threading.Event = threading.Event()
+        self.peak: int = -1
+        self.snapshot_size: int = -1
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def sample(self) -> None:
+        """Take a snapshot if the peak has grown, keeping the largest one."""
+        current, peak = tracemalloc.get_traced_memory()
+        if peak <= self.peak and self.snapshot is not None:
+            return
+        self.peak = peak
+        if current > self.snapshot_size:
+            self.snapshot_size = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def run(self) -> None:
+        """Sample until told to stop."""
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+
+def trace_allocations(
+    solver: Solver,
+    scope: str,
+    output: Optional[Union[str, Path]] = None,
+    top: int = 25,
+    interval: float = 0.005,
+) -> Tuple[Any, str]:
+    """Run a solver under tracemalloc.
+
+    Memory is sampled while the solver runs and a snapshot is taken each time
+    the peak grows, keeping the one with the most traced memory, since most of
+    it has been freed by the time the solver returns. The report gives both
+    the true peak and the size of the kept snapshot, which can fall short of
+    the peak if it was over within one interval.
+
+    Parameters
+    ----------
+    solver: Solver
+        The function to run, called with no arguments
+    scope: str
+        Package to limit the report to, e.g. advent.day17
+    output: str or Path, optional
+        Where to dump the kept snapshot, load it with tracemalloc.Snapshot.load
+    top: int
+        How many lines to include in the report
+    interval: float
+        Seconds between memory samples
+
+    Returns
+    -------
+    Tuple[Any, str]
+        The solver's answer and a report of the lines holding the most memory
+        in the kept snapshot
+    """
+    sampler: _PeakSampler = _PeakSampler(interval)
+    tracemalloc.start()
+    try:
+        sampler.start()
+        result: Any = solver()
+        sampler.stopped.set()
+        sampler.join()
+        sampler.sample()
+        peak: int = tracemalloc.get_traced_memory()[1]
+    finally:
+        sampler.stopped.set()
+        tracemalloc.stop()
+    snapshot: tracemalloc.Snapshot = sampler.snapshot  # type: ignore
+    if output is not None:
+        snapshot.dump(str(output))
+    pattern: str = str(package_dir(scope) / "*")
+    scoped: tracemalloc.Snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(True, pattern)]
+    )
+    lines: List[str] = [
+        f"Peak traced memory: {peak / 1024:.1f} KiB",
+        f"Largest sample: {sampler.snapshot_size / 1024:.1f} KiB "
+        f"(polled every {interval * 1000:g} ms, so shorter peaks are missed)",
+    ]
+    for stat in scoped.statistics("lineno")[:top]:
+        frame: tracemalloc.Frame = stat.traceback[0]
+        lines.append(
+            f"{frame.filename}:{frame.lineno}: "
+            f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+        )
+    return result, "\n".join(lines)
@@ -0,0 +1,207 @@
+"""Look up and call the solver for a given day and part.
+
+Solvers are found by convention: part ``n`` of day ``d`` is the ``partn``
+function in ``advent.dayDD.main``. A day's module is only imported the first time
+one of its solvers is requested, and the resolved function is cached after that.
+"""
+import importlib
+import inspect
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+Solver = Callable[..., Any]
+SolverKey = Tuple[int, int]
+
+
+class SolverRegistry:
+    """Map (day, part) pairs to the functions that solve them."""
+
+    def __init__(self, package: str = "advent") -> None:
+        """Start with an empty cache of solvers.
+
+        Parameters
+        ----------
+        package: str
+            The package the day modules live in
+        """
+        self.package: str = package
+        self._solvers: Dict[SolverKey, Solver] = {}
+
+    def register(self, day: int, part: int, solver: Solver) -> None:
+        """Explicitly set the solver for a day and part.
+
+        Parameters
+        ----------
+        day: int
+            Challenge day
+        part: int
+            Challenge part
+        solver: Solver
+            The function to call for that day and part
+        """
+        self._solvers[(day, part)] = solver
+
+    def _import_day(self, day: int) -> ModuleType:
+        """Import the main module for a day.
+
+        Parameters
+        ----------
+        day: int
+            Challenge day
+
+        Returns
+        -------
+        ModuleType
+            The imported advent.dayDD.main module
+        """
+        return importlib.import_module(f"{self.package}.day{day:02}.main")
+
+    def get(self, day: int, part: int) -> Solver:
+        """Find the solver for a day and part, importing its module if needed.
+
+        Parameters
+        ----------
+        day: int
+            Challenge day
+        part: int
+            Challenge part
+
+        Returns
+        -------
+        Solver
+            The function that solves that day and part
+
+        Raises
+        ------
+        ImportError
+            If the day's module or its part function don't exist
+        """
+        key: SolverKey = (day, part)
+        if key not in self._solvers:
+            module: ModuleType = self._import_day(day)
+            solver: Optional[Solver] = getattr(module, f"part{part}", None)
+            if solver is None:
+                raise ImportError(f"Couldn't import part{part} from {module.__name__}")
+            self._solvers[key] = solver
+        return self._solvers[key]
+
+    def __contains__(self, key: SolverKey) -> bool:
+        """Check if a solver exists for a (day, part) pair.
+
+        Parameters
+        ----------
+        key: SolverKey
+            The (day, part) pair to look up
+
+        Returns
+        -------
+        bool
+            Whether there is a solver for that pair
+        """
+        try:
+            self.get(*key)
+        except ImportError:
+            return False
+        return True
+
+    def reads_input(self, day: int, part: int) -> bool:
+        """Check if the solver for a day and part takes an input file.
+
+        Some days have their puzzle input built into the solver's arguments
+        instead, so there's no file to pass.
+
+        Parameters
+        ----------
+        day: int
+            Challenge day
+        part: int
+            Challenge part
+
+        Returns
+        -------
+        bool
+            Whether the solver has a filename parameter
+        """
+        return "filename" in inspect.signature(self.get(day, part)).parameters
+
+    def runs_alone(self, day: int, part: int) -> bool:
+        """Check if the solver for a day and part can be called with no arguments.
+
+        Parameters
+        ----------
+        day: int
+            Challenge day
+        part: int
+            Challenge part
+
+        Returns
+        -------
+        bool
+            Whether every parameter of the solver has a default
+        """
+        parameters = inspect.signature(self.get(day, part)).parameters.values()
+        return all(
+            param.default is not param.empty
+            or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+            for param in parameters
+        )
+
+    def solve(
+        self, day: int, part: int, input_path: Optional[Union[str, Path]] = None
+    ) -> Any:
+        """Run the solver for a day and part.
+
+        Parameters
+        ----------
+        day: int
+            Challenge day
+        part: int
+            Challenge part
+        input_path: str or Path, optional
+            Input file to solve, relative to the day's folder or absolute.
+            If not provided the solver's default input is used.
+
+        Returns
+        -------
+        Any
+            Whatever the solver returns
+
+        Raises
+        ------
+        ValueError
+            If an input file is given to a solver that doesn't read one
+        """
+        solver: Solver = self.get(day, part)
+        if input_path is None:
+            return solver()
+        if not self.reads_input(day, part):
+            raise ValueError(
+                f"day{day:02} part{part} doesn't read an input file, "
+                f"so {input_path} can't be solved"
+            )
+        return solver(str(input_path))
+
+
+registry: SolverRegistry = SolverRegistry()
+
+
+def solve(day: int, part: int, input_path: Optional[Union[str, Path]] = None) -> Any:
+    """Run the solver for a day and part using the default registry.
+
+    Parameters
+    ----------
+    day: int
+        Challenge day
+    part: int
+        Challenge part
+    input_path: str or Path, optional
+        Input file to solve, relative to the day's folder or absolute.
+        If not provided the solver's default input is used.
+
+    Returns
+    -------
+    Any
+        Whatever the solver returns
+    """
+    return registry.solve(day, part, input_path)
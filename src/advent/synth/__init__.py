@@ -0,0 +1,71 @@
+"""Generate synthetic puzzle inputs of any size.
+
+Each day has a module ``advent.synth.dayNN`` with a ``generate(size, seed)`` function
+that yields the lines of a valid puzzle input for that day. What ``size`` means is
+up to the day, e.g. number of entries for day 1 or tiles per side for day 20.
+The same size and seed always give the same input.
+"""
+import importlib
+from pathlib import Path
+from types import ModuleType
+from typing import Iterator, Union
+
+
+def _import_day(day: int) -> ModuleType:
+    """Import the generator module for a day.
+
+    Parameters
+    ----------
+    day: int
+        Challenge day
+
+    Returns
+    -------
+    ModuleType
+        The advent.synth.dayDD module
+    """
+    return importlib.import_module(f"{__name__}.day{day:02}")
+
+
+def generate(day: int, size: int, seed: int = 0) -> Iterator[str]:
+    """Generate the lines of a puzzle input for a day.
+
+    Parameters
+    ----------
+    day: int
+        Challenge day
+    size: int
+        How big an input to make
+    seed: int
+        Random seed
+
+    Returns
+    -------
+    Iterator[str]
+        Lines of the input, without line endings
+    """
+    return _import_day(day).generate(size, seed)
+
+
+def write_input(day: int, path: Union[str, Path], size: int, seed: int = 0) -> None:
+    """Generate a puzzle input for a day and write it to a file.
+
+    Parameters
+    ----------
+    day: int
+        Challenge day
+    path: str or Path
+        File to write the input to
+    size: int
+        How big an input to make
+    seed: int
+        Random seed
+    """
+    module: ModuleType = _import_day(day)
+    with open(path, "w") as f:
+        for i, line in enumerate(module.generate(size, seed)):
+            if i:
+                f.write("\n")
+            f.write(line)
+        if getattr(module, "TRAILING_NEWLINE", False):
+            f.write("\n")
@@ -0,0 +1,79 @@
+"""Helpers shared by the input generators."""
+import random
+import string
+from typing import List, Set
+
+CONSONANTS: str = "bcdfghjklmnprstvwxz"
+VOWELS: str = "aeiouy"
+
+
+def random_word(rng: random.Random, min_length: int = 3, max_length: int = 8) -> str:
+    """Make up a lowercase word.
+
+    Parameters
+    ----------
+    rng: random.Random
+        Source of randomness
+    min_length: int
+        Shortest word to make
+    max_length: int
+        Longest word to make
+
+    Returns
+    -------
+    str
+        A word made of alternating consonants and vowels
+    """
+    length: int = rng.randint(min_length, max_length)
+    return "".join(
+        rng.choice(CONSONANTS if i % 2 == 0 else VOWELS) for i in range(length)
+    )
+
+
+def unique_words(
+    rng: random.Random, count: int, min_length: int = 3, max_length: int = 8
+) -> List[str]:
+    """Make up a list of distinct lowercase words.
+
+    Parameters
+    ----------
+    rng: random.Random
+        Source of randomness
+    count: int
+        How many words to make
+    min_length: int
+        Shortest word to make
+    max_length: int
+        Longest word to make
+
+    Returns
+    -------
+    List[str]
+        The words, in the order they were made up
+    """
+    seen: Set[str] = set()
+    words: List[str] = []
+    while len(words) < count:
+        word: str = random_word(rng, min_length, max_length)
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def random_letters(rng: random.Random, length: int) -> str:
+    """Make a string of random lowercase letters.
+
+    Parameters
+    ----------
+    rng: random.Random
+        Source of randomness
+    length: int
+        How many letters
+
+    Returns
+    -------
+    str
+        The letters
+    """
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
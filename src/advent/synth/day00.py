@@ -0,0 +1,23 @@
+"""Generate inputs for day 00: one module mass per line."""
+import random
+from typing import Iterator
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate module masses.
+
+    Parameters
+    ----------
+    size: int
+        Number of modules
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        A module mass
+    """
+    rng: random.Random = random.Random(seed)
+    for _ in range(size):
+        yield str(rng.randint(50_000, 150_000))
@@ -0,0 +1,72 @@
+"""Generate inputs for day 01: an expense report.
+
+Exactly one pair and one trio of entries sum to 2020. Every other entry is over
+half of 2020 and chosen so it can't complete a pair or trio with the planted
+entries, so the answers stay unique however big the report gets.
+"""
+import itertools
+import random
+from typing import Iterator, List, Set
+
+TARGET: int = 2020
+
+
+def _planted(rng: random.Random) -> List[int]:
+    """Pick the pair and trio that sum to the target.
+
+    Parameters
+    ----------
+    rng: random.Random
+        Source of randomness
+
+    Returns
+    -------
+    List[int]
+        The pair followed by the trio
+    """
+    while True:
+        a: int = rng.randint(1, TARGET // 2 - 1)
+        b: int = rng.randint(1, TARGET // 4)
+        c: int = rng.randint(1, TARGET // 4)
+        planted: List[int] = [a, TARGET - a, b, c, TARGET - b - c]
+        if len(set(planted)) != len(planted):
+            continue
+        pairs: int = sum(
+            sum(combo) == TARGET for combo in itertools.combinations(planted, 2)
+        )
+        trios: int = sum(
+            sum(combo) == TARGET for combo in itertools.combinations(planted, 3)
+        )
+        if pairs == 1 and trios == 1:
+            return planted
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate expense report entries.
+
+    Parameters
+    ----------
+    size: int
+        Number of entries, at least 5
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        An expense entry
+    """
+    if size < 5:
+        raise ValueError("Need at least 5 entries to plant a pair and a trio")
+    rng: random.Random = random.Random(seed)
+    planted: List[int] = _planted(rng)
+    forbidden: Set[int] = {TARGET - x for x in planted}
+    forbidden.update(TARGET - x - y for x, y in itertools.combinations(planted, 2))
+    entries: List[int] = planted[:]
+    while len(entries) < size:
+        entry: int = rng.randint(TARGET // 2 + 1, TARGET - 1)
+        if entry not in forbidden:
+            entries.append(entry)
+    rng.shuffle(entries)
+    for entry in entries:
+        yield str(entry)
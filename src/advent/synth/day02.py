@@ -0,0 +1,33 @@
+"""Generate inputs for day 02: password policies and passwords."""
+import random
+from typing import Iterator
+
+from advent.synth.common import random_letters
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate password lines like ``1-3 a: abcde``.
+
+    Parameters
+    ----------
+    size: int
+        Number of passwords
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        A policy and password
+    """
+    rng: random.Random = random.Random(seed)
+    for _ in range(size):
+        lower: int = rng.randint(1, 10)
+        upper: int = rng.randint(lower + 1, 20)
+        character: str = random_letters(rng, 1)
+        length: int = rng.randint(upper, upper + 5)
+        password: str = "".join(
+            character if rng.random() < 0.4 else random_letters(rng, 1)
+            for _ in range(length)
+        )
+        yield f"{lower}-{upper} {character}: {password}"
@@ -0,0 +1,25 @@
+"""Generate inputs for day 03: a map of open squares and trees."""
+import random
+from typing import Iterator
+
+
+def generate(size: int, seed: int = 0, width: int = 31) -> Iterator[str]:
+    """Generate rows of the map.
+
+    Parameters
+    ----------
+    size: int
+        Number of rows
+    seed: int
+        Random seed
+    width: int
+        Number of columns before the pattern repeats
+
+    Yields
+    ------
+    str
+        A row of ``.`` and ``#``
+    """
+    rng: random.Random = random.Random(seed)
+    for _ in range(size):
+        yield "".join("#" if rng.random() < 0.2 else "." for _ in range(width))
@@ -0,0 +1,85 @@
+"""Generate inputs for day 04: batches of passports.
+
+Most passports are valid. The rest are missing a required field or have a value
+that fails the strict rules.
+"""
+import random
+from typing import Callable, Dict, Iterator, List, Tuple
+
+EYE_COLOURS: Tuple[str, ...] = ("amb", "blu", "brn", "gry", "grn", "hzl", "oth")
+
+
+def _height(rng: random.Random) -> str:
+    """Make a valid height.
+
+    Parameters
+    ----------
+    rng: random.Random
+        Source of randomness
+
+    Returns
+    -------
+    str
+        A height in cm or in
+    """
+    if rng.random() < 0.5:
+        return f"{rng.randint(150, 193)}cm"
+    return f"{rng.randint(59, 76)}in"
+
+
+VALID: Dict[str, Callable[[random.Random], str]] = {
+    "byr": lambda rng: str(rng.randint(1920, 2002)),
+    "iyr": lambda rng: str(rng.randint(2010, 2020)),
+    "eyr": lambda rng: str(rng.randint(2020, 2030)),
+    "hgt": _height,
+    "hcl": lambda rng: f"#{rng.randrange(16 ** 6):06x}",
+    "ecl": lambda rng: rng.choice(EYE_COLOURS),
+    "pid": lambda rng: f"{rng.randrange(10 ** 9):09}",
+    "cid": lambda rng: str(rng.randint(100, 350)),
+}
+
+INVALID: Dict[str, Callable[[random.Random], str]] = {
+    "byr": lambda rng: str(rng.randint(1900, 1919)),
+    "iyr": lambda rng: str(rng.randint(2021, 2030)),
+    "eyr": lambda rng: str(rng.randint(2031, 2040)),
+    "hgt": lambda rng: f"{rng.randint(194, 250)}cm",
+    "hcl": lambda rng: f"{rng.randrange(16 ** 6):06x}",
+    "ecl": lambda rng: rng.choice(("xry", "zzz", "blk")),
+    "pid": lambda rng: f"{rng.randrange(10 ** 8):08}",
+}
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate passport lines, with a blank line between passports.
+
+    Parameters
+    ----------
+    size: int
+        Number of passports
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        Some of the fields of a passport, or a blank separator
+    """
+    rng: random.Random = random.Random(seed)
+    for i in range(size):
+        fields: Dict[str, str] = {key: make(rng) for key, make in VALID.items()}
+        roll: float = rng.random()
+        if roll < 0.15:
+            del fields[rng.choice(list(INVALID.keys()))]
+        elif roll < 0.3:
+            key: str = rng.choice(list(INVALID.keys()))
+            fields[key] = INVALID[key](rng)
+        if rng.random() < 0.3:
+            del fields["cid"]
+        items: List[str] = [f"{key}:{value}" for key, value in fields.items()]
+        rng.shuffle(items)
+        if i:
+            yield ""
+        while items:
+            take: int = rng.randint(1, len(items))
+            yield " ".join(items[:take])
+            items = items[take:]
@@ -0,0 +1,52 @@
+"""Generate inputs for day 05: boarding passes for a full flight but one seat."""
+import random
+from typing import Iterator, List
+
+SEATS: int = 128 * 8
+
+
+def encode(seat_id: int) -> str:
+    """Turn a seat ID into its boarding pass code.
+
+    Parameters
+    ----------
+    seat_id: int
+        The seat ID, row * 8 + column
+
+    Returns
+    -------
+    str
+        The 10 character code, e.g. FBFBBFFRLR
+    """
+    row: str = f"{seat_id >> 3:07b}".translate(str.maketrans("01", "FB"))
+    col: str = f"{seat_id & 7:03b}".translate(str.maketrans("01", "LR"))
+    return row + col
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate boarding passes.
+
+    The passes cover a run of consecutive seat IDs with one missing from the
+    middle, which is the answer to part 2.
+
+    Parameters
+    ----------
+    size: int
+        Number of passes, between 2 and 1022
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        A boarding pass code
+    """
+    if not 2 <= size <= SEATS - 2:
+        raise ValueError(f"size must be between 2 and {SEATS - 2}")
+    rng: random.Random = random.Random(seed)
+    start: int = rng.randint(0, SEATS - size - 1)
+    seat_ids: List[int] = list(range(start, start + size + 1))
+    seat_ids.pop(rng.randint(1, size - 1))
+    rng.shuffle(seat_ids)
+    for seat_id in seat_ids:
+        yield encode(seat_id)
@@ -0,0 +1,30 @@
+"""Generate inputs for day 06: customs declaration answers by group."""
+import random
+import string
+from typing import Iterator, List
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate one line per person, with a blank line between groups.
+
+    Parameters
+    ----------
+    size: int
+        Number of groups
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        The questions a person answered yes to, or a blank separator
+    """
+    rng: random.Random = random.Random(seed)
+    letters: List[str] = list(string.ascii_lowercase)
+    for i in range(size):
+        if i:
+            yield ""
+        common: List[str] = rng.sample(letters, rng.randint(0, 8))
+        for _ in range(rng.randint(1, 5)):
+            extra: List[str] = rng.sample(letters, rng.randint(1, 6))
+            yield "".join(sorted(set(common + extra)))
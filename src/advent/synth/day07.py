@@ -0,0 +1,81 @@
+"""Generate inputs for day 07: rules about which bags contain which.
+
+Bags are numbered in a random order and may only contain bags with a higher
+number, which keeps the rules acyclic. Each bag picks its contents from the next
+``window`` bags, so a small window makes deep chains with lots of shared bags.
+"""
+import itertools
+import math
+import random
+from typing import Iterator, List, Tuple
+
+from advent.synth.common import unique_words
+
+TARGET: Tuple[str, str] = ("shiny", "gold")
+
+
+def _bag_names(rng: random.Random, count: int) -> List[Tuple[str, str]]:
+    """Make up distinct adjective and colour pairs.
+
+    Parameters
+    ----------
+    rng: random.Random
+        Source of randomness
+    count: int
+        How many names to make
+
+    Returns
+    -------
+    List[Tuple[str, str]]
+        The names, not including shiny gold
+    """
+    per_word: int = int(math.sqrt(count)) + 2
+    adjectives: List[str] = unique_words(rng, per_word, 4, 8)
+    colours: List[str] = unique_words(rng, per_word, 3, 7)
+    names: List[Tuple[str, str]] = [
+        name for name in itertools.product(adjectives, colours) if name != TARGET
+    ]
+    return rng.sample(names, count)
+
+
+def generate(size: int, seed: int = 0, window: int = 20) -> Iterator[str]:
+    """Generate bag rules.
+
+    Parameters
+    ----------
+    size: int
+        Number of bags, at least 2
+    seed: int
+        Random seed
+    window: int
+        How far down the order a bag can look for bags to contain
+
+    Yields
+    ------
+    str
+        A rule, e.g. ``light red bags contain 1 bright white bag.``
+    """
+    if size < 2:
+        raise ValueError("Need at least 2 bags")
+    rng: random.Random = random.Random(seed)
+    names: List[Tuple[str, str]] = _bag_names(rng, size)
+    target: int = max(1, size // 3)
+    names[target] = TARGET
+    rules: List[str] = []
+    for index, (adjective, colour) in enumerate(names):
+        options: range = range(index + 1, min(size, index + 1 + window))
+        children: List[int] = []
+        if options and (index == target or rng.random() < 0.9):
+            children = rng.sample(options, min(len(options), rng.randint(1, 4)))
+        # Make sure something holds shiny gold
+        if index == target - 1 and target not in children:
+            children.append(target)
+        contents: List[str] = []
+        for child in children:
+            count: int = rng.randint(1, 5)
+            plural: str = "s" if count > 1 else ""
+            contents.append(f"{count} {' '.join(names[child])} bag{plural}")
+        contains: str = ", ".join(contents) if contents else "no other bags"
+        rules.append(f"{adjective} {colour} bags contain {contains}.")
+    rng.shuffle(rules)
+    yield from rules
@@ -0,0 +1,66 @@
+"""Generate inputs for day 08: a boot program with one corrupted instruction.
+
+The program only jumps forwards except for a single backwards ``jmp`` which
+causes the infinite loop. No jump before that instruction can skip past it, so
+changing it to ``nop`` is the only single fix.
+"""
+import random
+from typing import Iterator, List, Tuple
+
+
+def _argument(num: int) -> str:
+    """Format an instruction argument with its sign.
+
+    Parameters
+    ----------
+    num: int
+        The argument
+
+    Returns
+    -------
+    str
+        e.g. +3 or -7
+    """
+    return f"{num:+d}"
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate program instructions.
+
+    Parameters
+    ----------
+    size: int
+        Number of instructions, at least 2
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        An instruction, e.g. ``acc +3``
+    """
+    if size < 2:
+        raise ValueError("Need at least 2 instructions")
+    rng: random.Random = random.Random(seed)
+    corrupt: int = rng.randint(size // 2, size - 1)
+    program: List[Tuple[str, int]] = []
+    for index in range(size):
+        # Nothing before the corrupt instruction can jump past it
+        limit: int = corrupt if index < corrupt else size
+        roll: float = rng.random()
+        if roll < 0.5:
+            program.append(("acc", rng.choice((-1, 1)) * rng.randint(1, 50)))
+        elif roll < 0.7:
+            program.append(("nop", rng.randint(-index, limit - index)))
+        else:
+            program.append(("jmp", rng.randint(1, min(20, limit - index))))
+    visited: List[int] = []
+    index = 0
+    while index < corrupt:
+        visited.append(index)
+        cmd, num = program[index]
+        index += num if cmd == "jmp" else 1
+    target: int = rng.choice(visited)
+    program[corrupt] = ("jmp", target - corrupt)
+    for cmd, num in program:
+        yield f"{cmd} {_argument(num)}"
@@ -0,0 +1,114 @@
+"""Generate inputs for day 09: an XMAS encrypted number series.
+
+Every number after the preamble is the sum of two different numbers in the
+window before it, up to the first invalid number which is the sum of a
+contiguous run of earlier numbers. Since each number is the sum of two earlier
+positive numbers the series grows exponentially, roughly doubling every
+``preamble`` numbers, so a series that would pass LIMIT starts over from a new
+low preamble instead. The first series is followed by the invalid number and
+any later ones are only there to make the input longer, so every number fits
+in 64 bits whatever the size.
+"""
+import random
+from typing import Iterator, List, Set
+
+# Series start over before passing this, so a run of them still fits in 64 bits
+LIMIT: int = 1 << 53
+# Longest contiguous run summed for the invalid number
+MAX_RUN: int = 20
+
+
+def _is_valid(window: List[int], target: int) -> bool:
+    """Check if two different numbers in the window sum to the target.
+
+    Parameters
+    ----------
+    window: List[int]
+        The previous numbers
+    target: int
+        The number to check
+
+    Returns
+    -------
+    bool
+        Whether the target is valid
+    """
+    has: Set[int] = set(window)
+    return any(target - num in has and target - num != num for num in has)
+
+
+def _series(rng: random.Random, preamble: int) -> Iterator[int]:
+    """Generate a valid series from a low preamble until it reaches LIMIT.
+
+    Parameters
+    ----------
+    rng: random.Random
+        Source of randomness
+    preamble: int
+        Length of the preamble and the window checked for each number
+
+    Yields
+    ------
+    int
+        The next number in the series
+    """
+    nums: List[int] = rng.sample(range(1, 2 * preamble + 1), preamble)
+    yield from nums
+    while True:
+        # Sum small numbers from the window to slow the growth down
+        smallest: List[int] = sorted(set(nums[-preamble:]))[:5]
+        a, b = rng.sample(smallest, 2)
+        if a + b >= LIMIT:
+            return
+        nums.append(a + b)
+        del nums[0]
+        yield a + b
+
+
+def generate(size: int, seed: int = 0, preamble: int = 25) -> Iterator[str]:
+    """Generate the number series.
+
+    Parameters
+    ----------
+    size: int
+        Number of numbers, more than the preamble
+    seed: int
+        Random seed
+    preamble: int
+        Length of the preamble and the window checked for each number
+
+    Yields
+    ------
+    str
+        A number in the series
+
+    Raises
+    ------
+    ValueError
+        If there aren't enough numbers for a preamble and an invalid number
+    """
+    if size <= preamble + 2:
+        raise ValueError(f"Need more than {preamble + 2} numbers")
+    rng: random.Random = random.Random(seed)
+    nums: List[int] = []
+    for num in _series(rng, preamble):
+        nums.append(num)
+        if len(nums) == size - 1:
+            break
+    window: List[int] = nums[-preamble:]
+    while True:
+        start: int = rng.randrange(0, len(nums) - 2)
+        stop: int = rng.randint(start + 2, min(len(nums), start + MAX_RUN))
+        target: int = sum(nums[start:stop])
+        if not _is_valid(window, target) and target not in nums:
+            break
+    nums.append(target)
+    for num in nums:
+        yield str(num)
+    remaining: int = size - len(nums)
+    while remaining > 0:
+        for num in _series(rng, preamble):
+            yield str(num)
+            remaining -= 1
+            if not remaining:
+                break
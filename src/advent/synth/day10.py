@@ -0,0 +1,33 @@
+"""Generate inputs for day 10: a bag of joltage adapters.
+
+The adapters form a single chain where every step is 1 or 3 jolts, like the
+puzzle inputs.
+"""
+import random
+from typing import Iterator, List
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate adapter joltages in a random order.
+
+    Parameters
+    ----------
+    size: int
+        Number of adapters
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        An adapter joltage
+    """
+    rng: random.Random = random.Random(seed)
+    jolts: List[int] = []
+    jolt: int = 0
+    for _ in range(size):
+        jolt += rng.choice((1, 1, 1, 3))
+        jolts.append(jolt)
+    rng.shuffle(jolts)
+    for jolt in jolts:
+        yield str(jolt)
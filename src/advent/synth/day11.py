@@ -0,0 +1,124 @@
+"""Generate inputs for day 11: a square seat layout.
+
+Random layouts often never settle and flip between two states forever, so the
+layout is built from tiles separated by aisles of floor. Under the original
+rules a seat only counts the 8 squares around it, so tiles can't affect each
+other and each one is drawn again until it settles on its own. Seats see
+across aisles under the enhanced rules, so layouts small enough to simulate
+are also checked as a whole.
+"""
+import random
+from typing import Iterator, List
+
+from advent.day11.main import Lobby
+
+# Seats per side of a tile, not counting the aisle after it
+TILE: int = 24
+# Whole layouts up to this size are checked under the enhanced rules too
+VERIFY_SIZE: int = 400
+
+
+def settles(layout: List[str]) -> bool:
+    """Check a layout reaches equilibrium under both sets of rules.
+
+    Parameters
+    ----------
+    layout: List[str]
+        Rows of ``L`` and ``.``
+
+    Returns
+    -------
+    bool
+        Whether both parts of the puzzle finish on the layout
+    """
+    for update_func in ("original", "enhanced"):
+        try:
+            Lobby(layout).run_to_equilibrium(update_func, incremental=True)
+        except RuntimeError:
+            return False
+    return True
+
+
+def _tile(rng: random.Random, rows: int, cols: int, seat_density: float) -> List[str]:
+    """Draw a tile that settles on its own.
+
+    Parameters
+    ----------
+    rng: random.Random
+        Source of randomness
+    rows: int
+        Height of the tile
+    cols: int
+        Width of the tile
+    seat_density: float
+        Fraction of tiles that are seats rather than floor
+
+    Returns
+    -------
+    List[str]
+        Rows of ``L`` and ``.``
+    """
+    while True:
+        tile: List[str] = [
+            "".join("L" if rng.random() < seat_density else "." for _ in range(cols))
+            for _ in range(rows)
+        ]
+        if settles(tile):
+            return tile
+
+
+def _layout(rng: random.Random, size: int, seat_density: float) -> Iterator[str]:
+    """Lay out tiles and aisles to fill the square.
+
+    Parameters
+    ----------
+    rng: random.Random
+        Source of randomness
+    size: int
+        Number of rows and columns
+    seat_density: float
+        Fraction of tiles that are seats rather than floor
+
+    Yields
+    ------
+    str
+        A row of ``L`` and ``.``
+    """
+    for top in range(0, size, TILE + 1):
+        height: int = min(TILE, size - top)
+        band: List[List[str]] = [
+            _tile(rng, height, min(TILE, size - left), seat_density)
+            for left in range(0, size, TILE + 1)
+        ]
+        for row in range(height):
+            yield ".".join(tile[row] for tile in band).ljust(size, ".")
+        if top + height < size:
+            yield "." * size
+
+
+def generate(size: int, seed: int = 0, seat_density: float = 0.75) -> Iterator[str]:
+    """Generate rows of the seat layout.
+
+    Parameters
+    ----------
+    size: int
+        Number of rows and columns
+    seed: int
+        Random seed
+    seat_density: float
+        Fraction of tiles that are seats rather than floor
+
+    Yields
+    ------
+    str
+        A row of ``L`` and ``.``
+    """
+    rng: random.Random = random.Random(seed)
+    if size > VERIFY_SIZE:
+        yield from _layout(rng, size, seat_density)
+        return
+    while True:
+        layout: List[str] = list(_layout(rng, size, seat_density))
+        if settles(layout):
+            yield from layout
+            return
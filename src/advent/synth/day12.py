@@ -0,0 +1,29 @@
+"""Generate inputs for day 12: navigation instructions."""
+import random
+from typing import Iterator, Tuple
+
+ACTIONS: Tuple[str, ...] = ("N", "S", "E", "W", "L", "R", "F", "F")
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate navigation instructions.
+
+    Parameters
+    ----------
+    size: int
+        Number of instructions
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        An instruction, e.g. ``F10`` or ``R90``
+    """
+    rng: random.Random = random.Random(seed)
+    for _ in range(size):
+        action: str = rng.choice(ACTIONS)
+        if action in ("L", "R"):
+            yield f"{action}{rng.choice((90, 180, 270))}"
+        else:
+            yield f"{action}{rng.randint(1, 100)}"
@@ -0,0 +1,57 @@
+"""Generate inputs for day 13: a timestamp and bus schedule.
+
+Bus IDs are distinct primes so the part 2 timestamp always exists.
+"""
+import random
+from typing import Iterator, List
+
+
+def primes(count: int, start: int = 7) -> List[int]:
+    """Find the first primes at or above a starting point.
+
+    Parameters
+    ----------
+    count: int
+        How many primes to find
+    start: int
+        Smallest number to consider
+
+    Returns
+    -------
+    List[int]
+        The primes in increasing order
+    """
+    found: List[int] = []
+    candidate: int = max(start, 2)
+    while len(found) < count:
+        if all(candidate % p for p in range(2, int(candidate ** 0.5) + 1)):
+            found.append(candidate)
+        candidate += 1
+    return found
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate the earliest departure time and the bus list.
+
+    Parameters
+    ----------
+    size: int
+        Number of buses in service
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        The timestamp, then the comma separated bus IDs with ``x`` gaps
+    """
+    rng: random.Random = random.Random(seed)
+    buses: List[int] = primes(size, 11)
+    rng.shuffle(buses)
+    slots: List[str] = []
+    for index, bus in enumerate(buses):
+        if index:
+            slots.extend("x" for _ in range(rng.randint(0, 8)))
+        slots.append(str(bus))
+    yield str(rng.randint(1_000_000, 9_999_999))
+    yield ",".join(slots)
@@ -0,0 +1,32 @@
+"""Generate inputs for day 14: bitmasks and memory writes."""
+import random
+from typing import Iterator, List
+
+
+def generate(size: int, seed: int = 0, max_floating: int = 9) -> Iterator[str]:
+    """Generate mask and memory write lines.
+
+    Parameters
+    ----------
+    size: int
+        Number of memory writes
+    seed: int
+        Random seed
+    max_floating: int
+        Most ``X`` bits in a mask, part 2 writes 2 ** X addresses per write
+
+    Yields
+    ------
+    str
+        A ``mask = ...`` or ``mem[...] = ...`` line
+    """
+    rng: random.Random = random.Random(seed)
+    writes: int = 0
+    while writes < size:
+        mask: List[str] = [rng.choice("01") for _ in range(36)]
+        for bit in rng.sample(range(36), rng.randint(0, max_floating)):
+            mask[bit] = "X"
+        yield f"mask = {''.join(mask)}"
+        for _ in range(min(rng.randint(1, 6), size - writes)):
+            yield f"mem[{rng.randrange(65536)}] = {rng.randrange(2 ** 30)}"
+            writes += 1
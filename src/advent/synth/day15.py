@@ -0,0 +1,22 @@
+"""Generate inputs for day 15: starting numbers for the memory game."""
+import random
+from typing import Iterator
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate the starting numbers.
+
+    Parameters
+    ----------
+    size: int
+        How many starting numbers
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        The comma separated starting numbers
+    """
+    rng: random.Random = random.Random(seed)
+    yield ",".join(str(num) for num in rng.sample(range(3 * size + 20), size))
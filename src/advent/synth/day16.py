@@ -0,0 +1,110 @@
+"""Generate inputs for day 16: ticket rules, your ticket and nearby tickets.
+
+Rules are nested so that each field's range contains the next one's. Every
+column holds a value only its own rule and the wider ones accept, so the fields
+can be worked out one at a time like in the puzzle.
+"""
+import random
+from typing import Iterator, List, Set, Tuple
+
+FIELDS: Tuple[str, ...] = (
+    "departure location",
+    "departure station",
+    "departure platform",
+    "departure track",
+    "departure date",
+    "departure time",
+    "arrival location",
+    "arrival station",
+    "arrival platform",
+    "arrival track",
+    "class",
+    "duration",
+    "price",
+    "route",
+    "row",
+    "seat",
+    "train",
+    "type",
+    "wagon",
+    "zone",
+)
+
+
+def _upper(rank: int) -> int:
+    """Get the top of the valid range for the rule of a given rank.
+
+    Parameters
+    ----------
+    rank: int
+        0 for the widest rule
+
+    Returns
+    -------
+    int
+        The largest valid value
+    """
+    return 100 + 40 * (len(FIELDS) - rank)
+
+
+def _gap(rank: int) -> Tuple[int, int]:
+    """Get the values excluded between the two ranges of a rule.
+
+    Parameters
+    ----------
+    rank: int
+        0 for the widest rule
+
+    Returns
+    -------
+    Tuple[int, int]
+        The first and last excluded values
+    """
+    return 20 + 3 * rank, 21 + 3 * rank
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate the rules and tickets.
+
+    Parameters
+    ----------
+    size: int
+        Number of nearby tickets
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        A line of the notes
+    """
+    rng: random.Random = random.Random(seed)
+    n_fields: int = len(FIELDS)
+    names: List[str] = list(FIELDS)
+    rng.shuffle(names)
+    # column_ranks[i] is the rank of the rule for ticket column i
+    column_ranks: List[int] = list(range(n_fields))
+    rng.shuffle(column_ranks)
+    gaps: Set[int] = {value for rank in range(n_fields) for value in _gap(rank)}
+    pools: List[List[int]] = [
+        [value for value in range(6, _upper(rank) + 1) if value not in gaps]
+        for rank in range(n_fields)
+    ]
+
+    for rank, name in enumerate(names):
+        low: int = rng.randint(1, 5)
+        gap_low, gap_high = _gap(rank)
+        yield f"{name}: {low}-{gap_low - 1} or {gap_high + 1}-{_upper(rank)}"
+    yield ""
+    yield "your ticket:"
+    # Only this column's rule and wider ones accept the values on your ticket
+    yield ",".join(
+        str(rng.randint(_upper(rank + 1) + 1, _upper(rank))) for rank in column_ranks
+    )
+    yield ""
+    yield "nearby tickets:"
+    for _ in range(size):
+        ticket: List[int] = [rng.choice(pools[rank]) for rank in column_ranks]
+        if rng.random() < 0.25:
+            ticket[rng.randrange(n_fields)] = rng.randint(_upper(0) + 1, 999)
+        yield ",".join(str(value) for value in ticket)
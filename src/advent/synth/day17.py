@@ -0,0 +1,23 @@
+"""Generate inputs for day 17: the initial slice of active cubes."""
+import random
+from typing import Iterator
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate rows of the starting slice.
+
+    Parameters
+    ----------
+    size: int
+        Number of rows and columns
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        A row of ``#`` and ``.``
+    """
+    rng: random.Random = random.Random(seed)
+    for _ in range(size):
+        yield "".join(rng.choice("#.") for _ in range(size))
@@ -0,0 +1,50 @@
+"""Generate inputs for day 18: arithmetic homework."""
+import random
+from typing import Iterator, List
+
+
+def expression(rng: random.Random, depth: int = 2) -> str:
+    """Make up an expression of single digits, +, * and brackets.
+
+    Parameters
+    ----------
+    rng: random.Random
+        Source of randomness
+    depth: int
+        How many more levels of brackets are allowed
+
+    Returns
+    -------
+    str
+        The expression, e.g. ``2 * (3 + 4)``
+    """
+    terms: List[str] = []
+    for _ in range(rng.randint(2, 6)):
+        if depth and rng.random() < 0.25:
+            terms.append(f"({expression(rng, depth - 1)})")
+        else:
+            terms.append(str(rng.randint(1, 9)))
+    text: str = terms[0]
+    for term in terms[1:]:
+        text += f" {rng.choice('+*')} {term}"
+    return text
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate homework problems.
+
+    Parameters
+    ----------
+    size: int
+        Number of expressions
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        An expression
+    """
+    rng: random.Random = random.Random(seed)
+    for _ in range(size):
+        yield expression(rng)
@@ -0,0 +1,111 @@
+"""Generate inputs for day 19: message rules and received messages.
+
+Rules 42 and 31 each match a disjoint set of fixed length strings, built as a
+binary trie of rules over ``a`` and ``b``. Rule 0 is ``8 11`` so the part 2 loop
+rules apply, and messages are made of runs of 42 and 31 matches, some of which
+only match once the loops are in place.
+"""
+import itertools
+import random
+from typing import Dict, Iterator, List
+
+A_RULE: int = 1
+B_RULE: int = 2
+FIXED_RULES: Dict[int, str] = {
+    0: "8 11",
+    8: "42",
+    11: "42 31",
+    A_RULE: '"a"',
+    B_RULE: '"b"',
+}
+
+
+class _RuleBuilder:
+    """Hand out rule IDs and collect rule text."""
+
+    def __init__(self) -> None:
+        self.rules: Dict[int, str] = dict(FIXED_RULES)
+        self.next_id: int = 3
+
+    def new_id(self) -> int:
+        """Get an unused rule ID.
+
+        Returns
+        -------
+        int
+            The ID
+        """
+        while self.next_id in self.rules or self.next_id in (42, 31):
+            self.next_id += 1
+        rule_id: int = self.next_id
+        self.next_id += 1
+        return rule_id
+
+    def trie(self, words: List[str], rule_id: int) -> None:
+        """Add rules that match exactly a set of same length words.
+
+        Parameters
+        ----------
+        words: List[str]
+            The words to match, all the same length
+        rule_id: int
+            The ID of the rule that matches the whole set
+        """
+        options: List[str] = []
+        for char, literal in (("a", A_RULE), ("b", B_RULE)):
+            suffixes: List[str] = [word[1:] for word in words if word[0] == char]
+            if not suffixes:
+                continue
+            if not suffixes[0]:
+                options.append(str(literal))
+            else:
+                child: int = self.new_id()
+                self.rules[child] = ""
+                self.trie(suffixes, child)
+                options.append(f"{literal} {child}")
+        self.rules[rule_id] = " | ".join(options)
+
+
+def generate(size: int, seed: int = 0, chunk: int = 5) -> Iterator[str]:
+    """Generate the rules and messages.
+
+    Parameters
+    ----------
+    size: int
+        Number of messages
+    seed: int
+        Random seed
+    chunk: int
+        Length of the strings matched by rules 42 and 31
+
+    Yields
+    ------
+    str
+        A rule, a blank separator or a message
+    """
+    rng: random.Random = random.Random(seed)
+    words: List[str] = ["".join(w) for w in itertools.product("ab", repeat=chunk)]
+    rng.shuffle(words)
+    split: int = rng.randint(len(words) // 3, 2 * len(words) // 3)
+    words_42: List[str] = words[:split]
+    words_31: List[str] = words[split:]
+    builder: _RuleBuilder = _RuleBuilder()
+    builder.trie(words_42, 42)
+    builder.trie(words_31, 31)
+    rule_ids: List[int] = list(builder.rules)
+    rng.shuffle(rule_ids)
+    for rule_id in rule_ids:
+        yield f"{rule_id}: {builder.rules[rule_id]}"
+    yield ""
+    for _ in range(size):
+        n_31: int = rng.randint(1, 3)
+        n_42: int = rng.randint(n_31 + 1, n_31 + 3)
+        if rng.random() < 0.3:
+            # Too many 31s to match either way
+            n_42, n_31 = n_31, n_42
+        parts: List[str] = [rng.choice(words_42) for _ in range(n_42)]
+        parts.extend(rng.choice(words_31) for _ in range(n_31))
+        message: str = "".join(parts)
+        if rng.random() < 0.1:
+            message = message[:-1]
+        yield message
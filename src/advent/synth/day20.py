@@ -0,0 +1,279 @@
+"""Generate inputs for day 20: scrambled image tiles with sea monsters.
+
+A random image is cut into square tiles that share their border pixels with
+their neighbours, sea monsters are drawn into the part of the image left after
+the borders are removed, and then every tile is rotated and flipped at random.
+Border pixels are redrawn until every edge is unique and not a palindrome, so
+there is only one way to put the image back together.
+"""
+import random
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+SEA_MONSTER: Tuple[str, ...] = (
+    "                  # ",
+    "#    ##    ##    ###",
+    " #  #  #  #  #  #   ",
+)
+MONSTER_PIXELS: List[Tuple[int, int]] = [
+    (i, j) for i, row in enumerate(SEA_MONSTER) for j, c in enumerate(row) if c == "#"
+]
+
+Grid = List[List[str]]
+
+
+def _fits_monster(size: int, tile_size: int) -> bool:
+    """Check if the final image is big enough to hold a sea monster.
+
+    Parameters
+    ----------
+    size: int
+        Tiles per side
+    tile_size: int
+        Pixels per side of a tile
+
+    Returns
+    -------
+    bool
+        Whether a sea monster fits in the image once the borders are removed
+    """
+    return size * (tile_size - 2) >= len(SEA_MONSTER[0])
+
+
+def _default_tile_size(size: int) -> int:
+    """Pick a tile size with enough edge patterns for a mosaic.
+
+    Parameters
+    ----------
+    size: int
+        Tiles per side
+
+    Returns
+    -------
+    int
+        The smallest tile size of at least 10 with room for unique edges
+    """
+    edges: int = 2 * size * (size + 1)
+    tile_size: int = 10
+    while 2 ** (tile_size - 3) < edges or not _fits_monster(size, tile_size):
+        tile_size += 1
+    return tile_size
+
+
+def _edge_segments(size: int, step: int) -> Iterator[List[Tuple[int, int]]]:
+    """List the pixels on every tile edge of the full image.
+
+    Parameters
+    ----------
+    size: int
+        Tiles per side
+    step: int
+        Tile size minus the shared border
+
+    Yields
+    ------
+    List[Tuple[int, int]]
+        The pixel coordinates along one edge, corners included
+    """
+    for line in range(size + 1):
+        for tile in range(size):
+            start: int = tile * step
+            yield [(line * step, start + k) for k in range(step + 1)]
+            yield [(start + k, line * step) for k in range(step + 1)]
+
+
+def _fix_edges(
+    rng: random.Random, image: Grid, size: int, step: int, density: float
+) -> None:
+    """Redraw edges until they're all distinct and not palindromes.
+
+    Parameters
+    ----------
+    rng: random.Random
+        Source of randomness
+    image: Grid
+        The full image including borders, updated in place
+    size: int
+        Tiles per side
+    step: int
+        Tile size minus the shared border
+    density: float
+        Fraction of pixels that are ``#``
+    """
+    while True:
+        seen: Set[str] = set()
+        clashes: int = 0
+        for segment in _edge_segments(size, step):
+            edge: str = "".join(image[i][j] for i, j in segment)
+            key: str = min(edge, edge[::-1])
+            if key in seen or edge == edge[::-1]:
+                clashes += 1
+                # Corners are shared by four edges so leave them alone
+                for i, j in segment[1:-1]:
+                    image[i][j] = "#" if rng.random() < density else "."
+            seen.add(key)
+        if not clashes:
+            return
+
+
+def _monster_shapes() -> List[List[Tuple[int, int]]]:
+    """Get the pixels of a sea monster in each orientation but the original.
+
+    Returns
+    -------
+    List[List[Tuple[int, int]]]
+        Pixel offsets from the top left for each distinct rotation and flip
+    """
+    shapes: Set[Tuple[Tuple[int, int], ...]] = set()
+    pixels: List[Tuple[int, int]] = MONSTER_PIXELS
+    for flip in (False, True):
+        for _ in range(4):
+            pixels = [(j, -i) for i, j in pixels]
+            oriented = [(i, -j) for i, j in pixels] if flip else pixels
+            top: int = min(i for i, _ in oriented)
+            left: int = min(j for _, j in oriented)
+            shapes.add(tuple(sorted((i - top, j - left) for i, j in oriented)))
+    shapes.discard(tuple(sorted(MONSTER_PIXELS)))
+    return [list(shape) for shape in shapes]
+
+
+def _draw_monsters(rng: random.Random, inner: Grid, count: int) -> Set[Tuple[int, int]]:
+    """Draw non overlapping sea monsters into the borderless image.
+
+    Parameters
+    ----------
+    rng: random.Random
+        Source of randomness
+    inner: Grid
+        The image with tile borders removed, updated in place
+    count: int
+        How many sea monsters to try to draw
+
+    Returns
+    -------
+    Set[Tuple[int, int]]
+        The pixels that belong to a sea monster
+    """
+    used: Set[Tuple[int, int]] = set()
+    height_room: int = len(inner) - len(SEA_MONSTER)
+    width_room: int = len(inner[0]) - len(SEA_MONSTER[0])
+    if height_room < 0 or width_room < 0:
+        return used
+    for _ in range(count):
+        top: int = rng.randint(0, height_room)
+        left: int = rng.randint(0, width_room)
+        pixels: List[Tuple[int, int]] = [(top + i, left + j) for i, j in MONSTER_PIXELS]
+        if used.intersection(pixels):
+            continue
+        used.update(pixels)
+        for row, col in pixels:
+            inner[row][col] = "#"
+    return used
+
+
+def _clear_false_monsters(inner: Grid, monsters: Set[Tuple[int, int]]) -> None:
+    """Break up any sea monster that shows up in another orientation.
+
+    Parameters
+    ----------
+    inner: Grid
+        The image with tile borders removed, updated in place
+    monsters: Set[Tuple[int, int]]
+        Pixels of the drawn sea monsters, which are left alone
+    """
+    for shape in _monster_shapes():
+        height: int = max(i for i, _ in shape) + 1
+        width: int = max(j for _, j in shape) + 1
+        for top in range(len(inner) - height + 1):
+            for left in range(len(inner[0]) - width + 1):
+                pixels = [(top + i, left + j) for i, j in shape]
+                if all(inner[i][j] == "#" for i, j in pixels):
+                    i, j = next(pixel for pixel in pixels if pixel not in monsters)
+                    inner[i][j] = "."
+
+
+def _orient(pixels: Grid, rng: random.Random) -> Grid:
+    """Randomly rotate and flip a tile.
+
+    Parameters
+    ----------
+    pixels: Grid
+        The tile
+    rng: random.Random
+        Source of randomness
+
+    Returns
+    -------
+    Grid
+        The tile in one of its 8 orientations
+    """
+    for _ in range(rng.randrange(4)):
+        pixels = [list(row) for row in zip(*reversed(pixels))]
+    if rng.random() < 0.5:
+        pixels = [row[::-1] for row in pixels]
+    return pixels
+
+
+def generate(
+    size: int, seed: int = 0, tile_size: Optional[int] = None, density: float = 0.3
+) -> Iterator[str]:
+    """Generate the scrambled tiles.
+
+    Parameters
+    ----------
+    size: int
+        Tiles per side of the square image, at least 2
+    seed: int
+        Random seed
+    tile_size: int, optional
+        Pixels per side of a tile, by default big enough for unique edges
+        and a sea monster
+    density: float
+        Fraction of pixels that are ``#``, kept low so noise doesn't look
+        like a sea monster
+
+    Yields
+    ------
+    str
+        A tile header, a row of pixels, or a blank separator
+    """
+    if size < 2:
+        raise ValueError("Need at least 2 tiles per side")
+    rng: random.Random = random.Random(seed)
+    if tile_size is None:
+        tile_size = _default_tile_size(size)
+    if not _fits_monster(size, tile_size):
+        raise ValueError("The image is too small to hold a sea monster")
+    step: int = tile_size - 1
+    full: int = size * step + 1
+    image: Grid = [
+        ["#" if rng.random() < density else "." for _ in range(full)]
+        for _ in range(full)
+    ]
+    _fix_edges(rng, image, size, step, density)
+    # Everything but the tile borders, which is what the final image is made of
+    keep: List[int] = [k for k in range(full) if k % step]
+    inner: Grid = [[image[i][j] for j in keep] for i in keep]
+    monsters: Set[Tuple[int, int]] = _draw_monsters(rng, inner, size * size // 4 + 1)
+    _clear_false_monsters(inner, monsters)
+    for row, i in enumerate(keep):
+        for col, j in enumerate(keep):
+            image[i][j] = inner[row][col]
+    tile_ids: List[int] = rng.sample(
+        range(1000, max(10_000, 4 * size * size)), size ** 2
+    )
+    tiles: Dict[int, Grid] = {}
+    for index, tile_id in enumerate(tile_ids):
+        top: int = (index // size) * step
+        left: int = (index % size) * step
+        tile: Grid = [
+            line[left : left + tile_size] for line in image[top : top + tile_size]
+        ]
+        tiles[tile_id] = _orient(tile, rng)
+    order: List[int] = list(tiles)
+    rng.shuffle(order)
+    for index, tile_id in enumerate(order):
+        if index:
+            yield ""
+        yield f"Tile {tile_id}:"
+        for pixels in tiles[tile_id]:
+            yield "".join(pixels)
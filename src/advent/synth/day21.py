@@ -0,0 +1,88 @@
+"""Generate inputs for day 21: foods with ingredients and some of their allergens.
+
+Each allergen is in exactly one ingredient. Two foods per allergen list only that
+allergen and share only its ingredient, which pins down every allergen. The
+remaining foods mix random allergens and safe ingredients.
+"""
+import random
+from typing import Dict, Iterator, List, Tuple
+
+from advent.synth.common import unique_words
+
+ALLERGENS: Tuple[str, ...] = (
+    "dairy",
+    "eggs",
+    "fish",
+    "nuts",
+    "peanuts",
+    "sesame",
+    "shellfish",
+    "soy",
+    "wheat",
+)
+
+
+def _food(ingredients: List[str], allergens: List[str]) -> str:
+    """Format a food line.
+
+    Parameters
+    ----------
+    ingredients: List[str]
+        The food's ingredients
+    allergens: List[str]
+        The allergens listed for the food
+
+    Returns
+    -------
+    str
+        e.g. ``mxmxvkd kfcds (contains dairy, fish)``
+    """
+    return f"{' '.join(ingredients)} (contains {', '.join(sorted(allergens))})"
+
+
+def generate(size: int, seed: int = 0, safe: int = 200) -> Iterator[str]:
+    """Generate the food list.
+
+    Parameters
+    ----------
+    size: int
+        Number of foods, at least 2
+    seed: int
+        Random seed
+    safe: int
+        Number of distinct ingredients without allergens
+
+    Yields
+    ------
+    str
+        A food
+    """
+    if size < 2:
+        raise ValueError("Need at least 2 foods")
+    rng: random.Random = random.Random(seed)
+    allergens: List[str] = sorted(rng.sample(ALLERGENS, min(len(ALLERGENS), size // 2)))
+    words: List[str] = unique_words(rng, len(allergens) + safe, 3, 8)
+    sources: Dict[str, str] = dict(zip(allergens, words))
+    safe_words: List[str] = words[len(allergens) :]
+    foods: List[str] = []
+    for allergen in allergens:
+        extras: List[str] = rng.sample(safe_words, 10)
+        for half in (extras[:5], extras[5:]):
+            ingredients: List[str] = [sources[allergen]] + half
+            rng.shuffle(ingredients)
+            foods.append(_food(ingredients, [allergen]))
+    while len(foods) < size:
+        listed: List[str] = rng.sample(
+            allergens, rng.randint(1, min(3, len(allergens)))
+        )
+        ingredients = [sources[allergen] for allergen in listed]
+        ingredients.extend(
+            source
+            for allergen, source in sources.items()
+            if allergen not in listed and rng.random() < 0.3
+        )
+        ingredients.extend(rng.sample(safe_words, rng.randint(5, 20)))
+        rng.shuffle(ingredients)
+        foods.append(_food(ingredients, listed))
+    rng.shuffle(foods)
+    yield from foods
@@ -0,0 +1,28 @@
+"""Generate inputs for day 22: two decks of space cards."""
+import random
+from typing import Iterator, List
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate both players' decks from a shuffled set of distinct cards.
+
+    Parameters
+    ----------
+    size: int
+        Number of cards in each deck
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        A player header, a card, or the blank separator
+    """
+    rng: random.Random = random.Random(seed)
+    cards: List[int] = list(range(1, 2 * size + 1))
+    rng.shuffle(cards)
+    yield "Player 1:"
+    yield from (str(card) for card in cards[:size])
+    yield ""
+    yield "Player 2:"
+    yield from (str(card) for card in cards[size:])
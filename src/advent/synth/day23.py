@@ -0,0 +1,26 @@
+"""Generate inputs for day 23: the crab's starting cup labels."""
+import random
+from typing import Iterator, List
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate a starting order for cups labelled 1 to size.
+
+    Parameters
+    ----------
+    size: int
+        Number of cups
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        The labels as one string of digits like the puzzle when there are nine
+        cups or fewer, otherwise comma separated
+    """
+    rng: random.Random = random.Random(seed)
+    cups: List[int] = list(range(1, size + 1))
+    rng.shuffle(cups)
+    separator: str = "" if size <= 9 else ","
+    yield separator.join(str(cup) for cup in cups)
@@ -0,0 +1,25 @@
+"""Generate inputs for day 24: paths to tiles that get flipped."""
+import random
+from typing import Iterator, Tuple
+
+DIRECTIONS: Tuple[str, ...] = ("e", "se", "sw", "w", "nw", "ne")
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate tile paths.
+
+    Parameters
+    ----------
+    size: int
+        Number of tiles to flip
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        Directions from the reference tile, e.g. ``esenee``
+    """
+    rng: random.Random = random.Random(seed)
+    for _ in range(size):
+        yield "".join(rng.choice(DIRECTIONS) for _ in range(rng.randint(10, 20)))
@@ -0,0 +1,33 @@
+"""Generate inputs for day 25: the card and door public keys."""
+import random
+from typing import Iterator
+
+MODULUS: int = 20201227
+SUBJECT: int = 7
+
+
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    """Generate two public keys.
+
+    Parameters
+    ----------
+    size: int
+        Largest loop size used to make either key, at least 2
+    seed: int
+        Random seed
+
+    Yields
+    ------
+    str
+        The card's public key, then the door's
+
+    Raises
+    ------
+    ValueError
+        If there aren't 2 different loop sizes to pick from
+    """
+    if size < 2:
+        raise ValueError("Need a loop size of at least 2 for two different keys")
+    rng: random.Random = random.Random(seed)
+    for loops in rng.sample(range(1, size + 1), 2):
+        yield str(pow(SUBJECT, loops, MODULUS))
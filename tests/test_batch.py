@@ -0,0 +1,57 @@
+"""Test running several days and parts in parallel."""
+from advent import batch
+
+
+def test_run_job():
+    """Check a single job reports its answer and timing."""
+    job = batch.run_job(1, 1)
+    assert job.ok
+    assert job.result == 1019571
+    assert job.seconds >= 0
+
+
+def test_run_job_error():
+    """Check a failing solver is reported rather than raised."""
+    job = batch.run_job(1, 3)
+    assert not job.ok
+    assert job.result is None
+    assert "part3" in job.error
+
+
+def test_available_jobs():
+    """Check only days and parts with solvers that run on their own are returned."""
+    assert list(batch.available_jobs([1, 25], [1, 2])) == [(1, 1), (1, 2)]
+
+
+def test_run_all():
+    """Check every job comes back from the pool with its answer."""
+    jobs = [(1, 1), (1, 2), (2, 1), (2, 2)]
+    results = {
+        (job.day, job.part): job.result for job in batch.run_all(jobs, max_workers=2)
+    }
+    assert results == {
+        (1, 1): 1019571,
+        (1, 2): 100655544,
+        (2, 1): 416,
+        (2, 2): 688,
+    }
+
+
+def test_run_all_one_worker():
+    """Check jobs still all run when each one needs a fresh worker."""
+    jobs = [(1, 1), (1, 2), (6, 1)]
+    results = {(job.day, job.part) for job in batch.run_all(jobs, max_workers=1)}
+    assert results == set(jobs)
+
+
+def test_run_all_generator():
+    """Check jobs found lazily are all run, even after a failing first job."""
+
+    def jobs():
+        yield 1, 3
+        yield from batch.available_jobs([25, 1], [1])
+
+    results = {
+        (job.day, job.part): job.ok for job in batch.run_all(jobs(), max_workers=1)
+    }
+    assert results == {(1, 3): False, (1, 1): True}
@@ -0,0 +1,50 @@
+"""Test the benchmark harness and baseline comparison."""
+from advent import bench
+
+
+def test_discover_cases():
+    """Check cases are found for existing solvers and files only."""
+    cases = list(bench.discover_cases([5, 9, 15, 23, 25]))
+    assert [case.key for case in cases] == [
+        "day05/part1/input.txt",
+        "day05/part2/input.txt",
+        "day09/part1/input.txt",
+        "day09/part2/input.txt",
+        "day15/part1/default",
+        "day15/part2/default",
+        "day23/part1/default",
+        "day23/part2/default",
+    ]
+
+
+def test_time_case():
+    """Check a case is timed the requested number of times."""
+    timing = bench.time_case(bench.BenchCase(1, 1, "example.txt"), repeat=3)
+    assert timing.runs == 3
+    assert timing.minimum <= timing.median <= timing.maximum
+    timing = bench.time_case(bench.BenchCase(15, 1, bench.DEFAULT_INPUT), repeat=2)
+    assert timing.runs == 2
+
+
+def test_baseline_round_trip(tmp_path):
+    """Check a saved baseline loads back unchanged."""
+    timings = bench.run_benchmarks(bench.discover_cases([1]), repeat=2)
+    path = tmp_path / "baseline.json"
+    bench.save_baseline(timings, path)
+    assert bench.load_baseline(path) == timings
+
+
+def test_find_regressions():
+    """Check only cases slower than the threshold are flagged."""
+    baseline = {
+        "fast": bench.Timing(1.0, 0.0, 1.0, 1.0, 1),
+        "slow": bench.Timing(1.0, 0.0, 1.0, 1.0, 1),
+        "gone": bench.Timing(1.0, 0.0, 1.0, 1.0, 1),
+    }
+    current = {
+        "fast": bench.Timing(1.1, 0.0, 1.1, 1.1, 1),
+        "slow": bench.Timing(1.5, 0.0, 1.5, 1.5, 1),
+    }
+    regressions = bench.find_regressions(baseline, current, threshold=0.2)
+    assert regressions == [bench.Regression("slow", 1.0, 1.5)]
+    assert regressions[0].ratio == 1.5
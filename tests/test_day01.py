@@ -24,3 +24,23 @@ def test_part_2_actual():
     """Check the actual for part 2."""
     test_result = main.part2()
     assert test_result == 100655544
+
+
+def test_buffer_input():
+    """Check the solver takes a parsed buffer directly."""
+    numbers = main.read_inputs("example.txt")
+    assert main.k_sum_product(numbers, 2020, 2) == 514579
+    assert main.k_sum_product(numbers, 2020, 3) == 241861950
+
+
+def test_find_k_sum():
+    """Check every strategy finds a combination using each entry at most once."""
+    values = [1, 9, 3, 3, 12, 40, 50]
+    assert main.find_k_sum(values, 12, 1) == (12,)
+    assert sorted(main.find_k_sum(values, 6, 2)) == [3, 3]
+    assert main.find_k_sum(values, 10, 2) == (1, 9)
+    assert sorted(main.find_k_sum(values, 7, 3)) == [1, 3, 3]
+    assert sorted(main.find_k_sum(values, 16, 4)) == [1, 3, 3, 9]
+    assert sorted(main.find_k_sum(values, 68, 6)) == [1, 3, 3, 9, 12, 40]
+    assert main.find_k_sum(values, 2, 2) is None
+    assert main.find_k_sum(values, 1000, 5) is None
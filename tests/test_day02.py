@@ -1,4 +1,8 @@
 """Test examples and solutions to day 02."""
+from pathlib import Path
+
+import pytest
+
 from advent.day02 import main
 
 
@@ -24,3 +28,43 @@ def test_part_2_actual():
     """Check the actual for part 2."""
     test_result = main.part2()
     assert test_result == 688
+
+
+def test_batch_matches_single():
+    """Check the batch policies agree with the one at a time versions."""
+    passwords = main.read_inputs("input.txt")
+    in_path = Path(main.__file__).resolve().parent / "input.txt"
+    batch = main.parse_batch(in_path.read_bytes())
+    assert main.validate_batch(batch).tolist() == [
+        main.validate_password(pwd) for pwd in passwords
+    ]
+    assert main.updated_validate_batch(batch).tolist() == [
+        main.updated_validate_password(pwd) for pwd in passwords
+    ]
+
+
+def test_count_valid_chunked_workers():
+    """Check small chunks split over worker processes give the same counts."""
+    assert main.count_valid("input.txt", workers=2, chunk_size=1000) == (416, 688)
+
+
+@pytest.mark.parametrize(
+    "line", [b"1-3 ab c\n", b"1-3 a c\n", b"1-3 :: abc\n", b"1-3 a pw\n2-4 :b: pw\n"]
+)
+def test_batch_rejects_bad_policy(line):
+    """Check lines the one at a time parser rejects aren't parsed in bulk."""
+    with pytest.raises(ValueError):
+        main.parse_batch(line)
+    with pytest.raises(ValueError):
+        for text in line.decode().splitlines():
+            main.parse_line(text)
+
+
+def test_batch_long_password():
+    """Check a long password is stored as it is rather than widening every row."""
+    text = b"1-2 a: ab\n2-3 b: " + b"b" * 5000 + b"\n1-9 a: ab\n"
+    batch = main.parse_batch(text)
+    assert len(batch.password) == 2 + 5000 + 2
+    assert batch.length.tolist() == [2, 5000, 2]
+    assert main.validate_batch(batch).tolist() == [True, False, True]
+    assert main.updated_validate_batch(batch).tolist() == [True, False, True]
@@ -1,4 +1,6 @@
 """Test examples and solutions to day 03."""
+from pathlib import Path
+
 from advent.day03 import main
 
 
@@ -24,3 +26,29 @@ def test_part_2_actual():
     """Check the actual for part 2."""
     test_result = main.Sledding().part2()
     assert test_result == 3064612320
+
+
+def test_count_trees_many_slopes():
+    """Check a single pass agrees with following each slope on its own."""
+    slopes = [(down, right) for down in range(1, 4) for right in range(0, 12)]
+    in_path = Path(main.__file__).resolve().parent / "input.txt"
+    lines = in_path.read_text().split()
+    expected = [
+        sum(
+            lines[y][(y // down * right) % len(lines[y])] == "#"
+            for y in range(0, len(lines), down)
+        )
+        for down, right in slopes
+    ]
+    assert main.count_trees(main.read_inputs("input.txt"), slopes, 100) == expected
+    # Repeating each row keeps the same pattern but is too wide for 64 bits
+    wide = [(main.pack_row(line * 3), len(line) * 3) for line in lines]
+    assert main.count_trees(wide, slopes, 100) == expected
+
+
+def test_parts_stream_rows():
+    """Check the streaming part functions agree with the in-memory API."""
+    assert main.part1("example.txt") == 7
+    assert main.part2("example.txt") == 336
+    assert main.part1() == 162
+    assert main.part2() == 3064612320
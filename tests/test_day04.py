@@ -18,3 +18,42 @@ def test_part_2_actual():
     """Check the actual answer to part 1."""
     test_result = main.part2("input.txt")
     assert test_result == 184
+
+
+def test_failure_counts():
+    """Check each invalid passport is counted against the first field it fails."""
+    validator = main.PassportValidator()
+    passports = list(main.read_inputs("input.txt"))
+    valid = validator.count_valid(passports)
+    assert valid == 184
+    assert sum(validator.failures.values()) == len(passports) - valid
+
+
+def test_strict_rules():
+    """Check the field examples from the puzzle."""
+    assert main.Passport(hgt="60in").is_valid_strict() is False
+    assert main.first_failure(main.Passport(byr="2003"), main.STRICT_RULES) == "byr"
+    checks = dict((field, check) for field, _, check in main.STRICT_RULES)
+    assert checks["byr"]("2002")
+    assert not checks["byr"]("2003")
+    assert checks["hgt"]("60in")
+    assert checks["hgt"]("190cm")
+    assert not checks["hgt"]("190in")
+    assert not checks["hgt"]("190")
+    assert checks["hcl"]("#123abc")
+    assert not checks["hcl"]("#123abz")
+    assert not checks["hcl"]("123abc")
+    assert checks["ecl"]("brn")
+    assert not checks["ecl"]("wat")
+    assert checks["pid"]("000000001")
+    assert not checks["pid"]("0123456789")
+
+
+def test_unknown_fields_ignored(tmp_path):
+    """Check fields that aren't passport fields are skipped, not an error."""
+    path = tmp_path / "input.txt"
+    path.write_text("ecl:gry pid:860033327 xyz:1\nbyr:1937 iyr:2017\n")
+    (passport,) = main.read_inputs(str(path))
+    assert passport["ecl"] == "gry"
+    assert passport["byr"] == "1937"
+    assert passport["eyr"] is None
@@ -1,4 +1,5 @@
 """Test examples and solutions to day 05."""
+import numpy as np
 import pytest
 
 from advent.day05 import main
@@ -31,3 +32,27 @@ def test_part_2_actual():
     """Check the actual answer to part 2."""
     test_result = main.part2()
     assert test_result == 711
+
+
+def test_batch_decoding():
+    """Check decoding a whole file at once agrees with one pass at a time."""
+    seat_ids = main.read_seat_ids()
+    assert seat_ids.tolist() == [p.seat_id for p in main.read_inputs()]
+    with pytest.raises(ValueError):
+        main.decode_batch(b"FBFBBFFRLR\nFBFBBFFRLX\n")
+
+
+def test_empty_seats():
+    """Check only gaps between the first and last taken seats are found."""
+    bitmap = main.seat_map(np.array([9, 10, 12, 15, 16, 17, 19]))
+    assert list(main.empty_seats(bitmap)) == [11, 13, 14, 18]
+    assert list(main.empty_seats(main.seat_map(np.array([], dtype=int)))) == []
+
+
+@pytest.mark.parametrize("code", [b"LRLRLRLFFB\n", b"FBFBBFRRLR\n", b"FBFBBFFRLB\n"])
+def test_batch_letters_in_place(code):
+    """Check row letters in seat columns, or the other way round, are rejected."""
+    with pytest.raises(ValueError):
+        main.decode_batch(code)
+    with pytest.raises(ValueError):
+        main.decode_seat_id(code.decode().strip())
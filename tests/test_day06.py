@@ -24,3 +24,12 @@ def test_part_2_actual():
     """Check the example for part 2."""
     test_result = main.part2()
     assert test_result == 3260
+
+
+def test_group_masks():
+    """Check a group's answers fold into anyone and everyone masks."""
+    anyone, everyone = main.group_masks(["abc", "bcd", "cb"])
+    assert anyone == 0b1111
+    assert everyone == 0b0110
+    assert main.popcount(anyone) == 4
+    assert main.count_answers("example.txt") == (11, 6)
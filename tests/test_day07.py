@@ -1,4 +1,8 @@
 """Test examples and solutions to day 03."""
+from pathlib import Path
+
+import pytest
+
 from advent.day07 import main
 
 
@@ -30,3 +34,72 @@ def test_part_2_actual():
     """Check the example for part 2."""
     test_result = main.part2()
     assert test_result == 3805
+
+
+def test_deep_graph():
+    """Check a chain deeper than the recursion limit is counted."""
+    graph = main.BagGraph()
+    depth = 20000
+    for i in range(depth):
+        graph.add_contents(f"bag_{i}", [(1, f"bag_{i + 1}")])
+    assert graph.contain_count("bag_0") == depth
+    assert len(graph.containers_of(f"bag_{depth}")) == depth
+
+
+def test_shared_bags_and_updates():
+    """Check shared bags are counted per path and new rules reset the counts."""
+    graph = main.BagGraph()
+    graph.add_contents("top", [(2, "left"), (3, "right")])
+    graph.add_contents("left", [(1, "shared")])
+    graph.add_contents("right", [(2, "shared")])
+    assert graph.contain_count("top") == 2 + 2 + 3 + 6
+    assert graph.containers_of("shared") == {"top", "left", "right"}
+    graph.add_contents("shared", [(1, "inner")])
+    assert graph.contain_count("top") == 2 + 2 + 3 + 6 + 8
+
+
+def test_cycle():
+    """Check a bag that has to contain itself is reported."""
+    graph = main.BagGraph()
+    graph.add_contents("a", [(1, "b")])
+    graph.add_contents("b", [(1, "a")])
+    with pytest.raises(ValueError):
+        graph.contain_count("a")
+
+
+def test_rule_updates():
+    """Check changing rules in place matches rebuilding from the changed rules."""
+    in_path = Path(main.__file__).resolve().parent / "example.txt"
+    rules = dict(main.parse_rule(line) for line in in_path.read_text().splitlines())
+    graph = main.read_inputs("example.txt")
+    assert graph.contain_count("shiny_gold") == 32
+    changes = [
+        "dark olive bags contain 2 vibrant plum bags.",
+        "bright white bags contain 1 shiny gold bag, 2 faded blue bags.",
+        "light red bags contain 4 muted yellow bags.",
+        "faded blue bags contain 3 dotted black bags.",
+    ]
+    for line in changes:
+        graph.update(line)
+        name, contents = main.parse_rule(line)
+        rules[name] = contents
+        rebuilt = main.BagGraph()
+        for rule in rules.items():
+            rebuilt.add_contents(*rule)
+        for bag in rules:
+            assert graph.contain_count(bag) == rebuilt.contain_count(bag)
+            assert graph.containers_of(bag) == rebuilt.containers_of(bag)
+    graph.remove_contents("shiny_gold")
+    assert graph.contain_count("shiny_gold") == 0
+    assert graph.contain_count("bright_white") == 1 + 2 * 4
+    assert graph.containers_of("dark_olive") == set()
+
+
+def test_update_keeps_unaffected_counts():
+    """Check only the changed bag and the bags holding it are recounted."""
+    graph = main.read_inputs("example.txt")
+    graph.contain_count("light_red")
+    graph.contain_count("dark_orange")
+    graph.update("vibrant plum bags contain 1 faded blue bag.")
+    cached = {graph.names[bag] for bag, n in enumerate(graph._counts) if n is not None}
+    assert cached == {"dark_olive", "faded_blue", "dotted_black"}
@@ -1,5 +1,12 @@
 """Test examples and solutions to day 08."""
-from advent.day08 import main
+from pathlib import Path
+
+import pytest
+
+from advent.day08 import analysis, compy, main
+from advent.synth import day08 as synth_day08
+
+EXAMPLE = Path(main.__file__).resolve().parent / "example.txt"
 
 
 def test_part_1_example():
@@ -24,3 +31,103 @@ def test_part_2_actual():
     """Check the example for part 2."""
     test_result = main.part2()
     assert test_result == 1375
+
+
+def test_compiled_program():
+    """Check instructions compile to opcode and operand arrays."""
+    program = compy.compile_program(
+        [compy.Instruction("nop", 0), compy.Instruction("acc", 5)]
+    )
+    assert list(program.opcodes) == [compy.NOP, compy.ACC]
+    assert list(program.operands) == [0, 5]
+    with pytest.raises(ValueError):
+        compy.compile_program([compy.Instruction("mul", 2)])
+
+
+def test_step_budget_and_trace():
+    """Check the step budget stops a looping program and the trace records it."""
+    computer = compy.Compy(
+        compy.instructions_from_file(EXAMPLE), max_steps=10, trace=True
+    )
+    with pytest.raises(compy.StepLimitExceeded):
+        computer.full_run()
+    assert len(computer.trace) == 10
+    assert computer.trace[:3] == [(0, 0), (1, 0), (2, 1)]
+    assert computer.loops_forever()
+    assert computer.index == 0
+
+
+def test_run_until_loop():
+    """Check the run stops right before the first repeated instruction."""
+    computer = compy.Compy(compy.instructions_from_file(EXAMPLE))
+    assert computer.run_until_loop()
+    assert computer.accumulator == 5
+    assert computer.index == 1
+
+
+def test_find_repair_example():
+    """Check the repair flips the jmp right before the loop closes."""
+    computer = compy.Compy(compy.instructions_from_file(EXAMPLE))
+    fix = analysis.repair(computer)
+    assert fix.address == 7
+    assert fix.instruction == compy.Instruction("nop", -4)
+    assert fix.accumulator == 8
+
+
+def test_find_repair_large():
+    """Check a long generated program is repaired without re-running it."""
+    instructions = [
+        compy.Instruction.parse(line) for line in synth_day08.generate(100_000, 3)
+    ]
+    fix = analysis.repair(compy.Compy(instructions))
+    assert instructions[fix.address].cmd != fix.instruction.cmd
+
+
+def test_find_repair_impossible():
+    """Check a program no single flip can fix is reported."""
+    program = compy.compile_program(
+        [
+            compy.Instruction("acc", 1),
+            compy.Instruction("jmp", -1),
+            compy.Instruction("acc", 1),
+            compy.Instruction("jmp", -2),
+        ]
+    )
+    assert not analysis.ControlFlowGraph(program).terminates_from(0)
+    with pytest.raises(ValueError):
+        analysis.find_repair(program)
+
+
+def test_control_flow_graph():
+    """Check loop, termination and accumulator queries on the example."""
+    graph = analysis.ControlFlowGraph(
+        compy.compile_program(compy.instructions_from_file(EXAMPLE))
+    )
+    assert list(graph.reachable()) == [1, 1, 1, 1, 1, 0, 1, 1, 0]
+    assert [index for index in range(9) if graph.in_loop(index)] == [1, 2, 3, 4, 6, 7]
+    assert not graph.terminates_from(0)
+    assert graph.terminates_from(8)
+    assert graph.accumulator_at_first_repeat() == 5
+    assert graph.accumulator_at_first_repeat(5) == -99 + 5
+    assert graph.accumulator_at_first_repeat(8) is None
+
+
+def test_control_flow_graph_matches_run():
+    """Check every start against actually running the program."""
+    instructions = [
+        compy.Instruction.parse(line) for line in synth_day08.generate(300, 5)
+    ]
+    computer = compy.Compy(instructions)
+    graph = analysis.ControlFlowGraph(computer.program)
+    for start in range(len(instructions)):
+        computer.reset()
+        computer.index = start
+        try:
+            looped = computer.run_until_loop()
+        except IndexError:
+            assert not graph.terminates_from(start)
+            assert graph.accumulator_at_first_repeat(start) is None
+            continue
+        assert graph.terminates_from(start) is not looped
+        expected = computer.accumulator if looped else None
+        assert graph.accumulator_at_first_repeat(start) == expected
@@ -1,4 +1,6 @@
-"""Test examples and solutions to day 08."""
+"""Test examples and solutions to day 09."""
+import itertools
+
 from advent.day09 import main
 
 
@@ -24,3 +26,25 @@ def test_part_2_actual():
     """Check the example for part 2."""
     test_result = main.part2()
     assert test_result == 4794981
+
+
+def test_window_counts_duplicates():
+    """Check a repeated value stays in the window until its last copy leaves."""
+    window = main.XmasWindow(3)
+    for value in (4, 4, 6, 4):
+        window.push(value)
+    assert list(window.order) == [4, 6, 4]
+    assert window.is_sum(10)
+    assert not window.is_sum(8)
+    window.push(1)
+    assert window.is_sum(10)
+    window.push(1)
+    assert not window.is_sum(10)
+
+
+def test_unbounded_stream():
+    """Check invalid numbers are found in a series with no end."""
+    invalid = main.invalid_numbers(itertools.count(1), 2)
+    # After 3 = 1 + 2, the two numbers before each one add to more than it
+    assert list(itertools.islice(invalid, 3)) == [4, 5, 6]
+    assert main.encryption_weakness(itertools.count(1), 15) == 1 + 5
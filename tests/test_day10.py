@@ -1,4 +1,6 @@
 """Test examples and solutions to day 10."""
+import pytest
+
 from advent.day10 import main
 
 
@@ -36,3 +38,36 @@ def test_part_2_actual():
     """Check the example for part 2."""
     test_result = main.part2()
     assert test_result == 3100448333024
+
+
+def test_chain_stats_example():
+    """Check both parts come out of one pass."""
+    stats = main.chain_stats(main.read_inputs("example1.txt"))
+    assert stats.differences == (7, 0, 5)
+    assert stats.arrangements == 8
+
+
+def test_long_chain():
+    """Check a chain far past the recursion limit, exactly and modulo."""
+    # Adapters 1 jolt apart can be reached from any of the three before, so
+    # the count follows the tribonacci numbers
+    ways = [0, 0, 1]
+    for _ in range(50_000):
+        ways.append(ways[-1] + ways[-2] + ways[-3])
+    adapters = list(range(50_000, 0, -1))
+    assert main.count_arrangements(adapters) == ways[-1]
+    assert main.count_arrangements(adapters, 1_000_003) == ways[-1] % 1_000_003
+
+
+def test_gap_too_wide():
+    """Check a chain with a missing step is rejected."""
+    with pytest.raises(ValueError):
+        main.chain_stats([1, 5])
+
+
+def test_chain_across_slices(monkeypatch):
+    """Check the chain carries on correctly from one slice to the next."""
+    adapters = main.read_inputs("example2.txt")
+    expected = main.chain_stats(adapters)
+    monkeypatch.setattr(main, "SLICE_SIZE", 4)
+    assert main.chain_stats(adapters) == expected
@@ -1,5 +1,8 @@
 """Test examples and solutions to day 11."""
+import pytest
+
 from advent.day11 import main
+from advent.synth import day11 as synth_day11
 
 
 def test_part_1_example1():
@@ -8,10 +11,10 @@ def test_part_1_example1():
     assert test_result == 37
 
 
-# def test_part_1_actual():
-#     """Check the example for part 1."""
-#     test_result = main.part1()
-#     assert test_result == 2476
+def test_part_1_actual():
+    """Check the example for part 1."""
+    test_result = main.part1()
+    assert test_result == 2476
 
 
 def test_part_2_example1():
@@ -20,7 +23,81 @@ def test_part_2_example1():
     assert test_result == 26
 
 
-# def test_part_2_actual():
-#     """Check the example for part 2."""
-#     test_result = main.part2()
-#     assert test_result == 2257
+def test_part_2_actual():
+    """Check the example for part 2."""
+    test_result = main.part2()
+    assert test_result == 2257
+
+
+def test_encode_round_trip():
+    """Check layouts survive being packed into a grid."""
+    layout = main.read_inputs("example.txt")
+    lobby = main.Lobby(layout)
+    assert lobby.grid.shape == (10, 10)
+    assert lobby.state == layout
+
+
+def test_original_generations():
+    """Check the whole grid updates at once, matching the puzzle's steps."""
+    lobby = main.Lobby(main.read_inputs("example.txt"))
+    lobby.state = lobby.get_next_state()
+    assert lobby.calc_occupied_seats() == 71
+    second = lobby.get_next_state()
+    assert "".join(second[0]) == "#.LL.L#.##"
+    assert not lobby.is_stabilized(second)
+    lobby.run_to_equilibrium()
+    assert lobby.is_stabilized(lobby.get_next_state())
+
+
+def test_line_of_sight_index():
+    """Check the precomputed neighbours match walking out along each ray."""
+    layout = list(synth_day11.generate(30, seed=4, seat_density=0.3))
+    lobby = main.Lobby(layout)
+    index = lobby.neighbour_index("enhanced")
+    seats = [divmod(int(flat), 30) for flat in index.seats]
+    for number, (row, col) in enumerate(seats):
+        expected = set()
+        for row_vec in (-1, 0, 1):
+            for col_vec in (-1, 0, 1):
+                if row_vec == 0 == col_vec:
+                    continue
+                check_row, check_col = row + row_vec, col + col_vec
+                while 0 <= check_row < 30 and 0 <= check_col < 30:
+                    if layout[check_row][check_col] != ".":
+                        expected.add((check_row, check_col))
+                        break
+                    check_row += row_vec
+                    check_col += col_vec
+        visible = index.indices[index.indptr[number] : index.indptr[number + 1]]
+        assert {seats[seat] for seat in visible} == expected
+
+
+@pytest.mark.parametrize("update_func", ["original", "enhanced"])
+def test_incremental_matches_full(update_func):
+    """Check only updating the frontier settles in the same place."""
+    layout = list(synth_day11.generate(60, seed=2, seat_density=0.5))
+    full = main.Lobby(layout)
+    full.run_to_equilibrium(update_func)
+    incremental = main.Lobby(layout)
+    incremental.run_to_equilibrium(update_func, incremental=True)
+    assert incremental.state == full.state
+    assert incremental.is_stabilized(incremental.get_next_state(update_func))
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_oscillating_layout(incremental):
+    """Check a layout that flips back and forth is reported, not run forever."""
+    lobby = main.Lobby([".LL.", "LLLL", "LLLL", ".LL."])
+    with pytest.raises(RuntimeError):
+        lobby.run_to_equilibrium(incremental=incremental)
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_generation_limit(incremental):
+    """Check a run gives up once it's past the generation limit."""
+    lobby = main.Lobby(main.read_inputs("example.txt"))
+    with pytest.raises(RuntimeError):
+        lobby.run_to_equilibrium(incremental=incremental, max_generations=2)
+    lobby = main.Lobby(main.read_inputs("example.txt"))
+    lobby.run_to_equilibrium(incremental=incremental, max_generations=5)
+    assert lobby.calc_occupied_seats() == 37
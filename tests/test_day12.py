@@ -1,5 +1,10 @@
 """Test examples and solutions to day 12."""
+from pathlib import Path
+
+import pytest
+
 from advent.day12 import main
+from advent.synth import day12 as synth_day12
 
 
 def test_part_1_example1():
@@ -24,3 +29,46 @@ def test_part_2_actual():
     """Check the example for part 2."""
     test_result = main.part2()
     assert test_result == 78883
+
+
+def test_compile_route():
+    """Check turns compile to anticlockwise quarter turns."""
+    route = main.compile_route([("F", 10), ("R", 90), ("L", 270), ("N", 3)])
+    assert list(route.opcodes) == [main.FORWARD, main.TURN, main.TURN, main.NORTH]
+    assert list(route.operands) == [10, 3, 3, 3]
+    with pytest.raises(ValueError):
+        main.compile_route([("B", 1)])
+    with pytest.raises(ValueError):
+        main.compile_route([("L", 45)])
+
+
+def test_fold_matches_single_steps():
+    """Check following a compiled route ends where stepping through it does."""
+    directions = [(line[0], int(line[1:])) for line in synth_day12.generate(500, 7)]
+    route = main.compile_route(directions)
+    stepped, folded = main.Ship(), main.Ship()
+    for direction in directions:
+        stepped.take_direction_deprecated(direction)
+    folded.follow_route_deprecated(route)
+    assert (folded.location, folded.facing) == (stepped.location, stepped.facing)
+    stepped, folded = main.Ship(), main.Ship()
+    for direction in directions:
+        stepped.take_direction_updated(direction)
+    folded.follow_route_updated(route)
+    assert (folded.location, folded.waypoint) == (stepped.location, stepped.waypoint)
+
+
+def test_evaluate_fleet(tmp_path):
+    """Check every ship's distances come back from the pool."""
+    here = Path(main.__file__).resolve().parent
+    sources = [here / "example.txt", here / "input.txt"]
+    for seed in range(3):
+        path = tmp_path / f"ship{seed}.txt"
+        path.write_text("\n".join(synth_day12.generate(200, seed)))
+        sources.append(path)
+    voyages = sorted(main.evaluate_fleet(sources, workers=2))
+    assert [voyage.number for voyage in voyages] == list(range(5))
+    assert voyages[0][2:] == (25, 286)
+    assert voyages[1][2:] == (1565, 78883)
+    for voyage in voyages[2:]:
+        assert voyage == main.evaluate_route(voyage.number, voyage.source)
@@ -0,0 +1,55 @@
+"""Test the streaming input readers."""
+import pytest
+
+from advent import io
+
+
+def test_read_lines(tmp_path):
+    """Check lines come back without their newlines."""
+    path = tmp_path / "lines.txt"
+    path.write_text("1\n2\n\n3")
+    assert list(io.read_lines(path)) == ["1", "2", "", "3"]
+
+
+def test_read_records(tmp_path):
+    """Check records are split on blank lines, ignoring extra ones."""
+    path = tmp_path / "records.txt"
+    path.write_text("\nabc\n\na\nb\n\n\nc\n\n")
+    assert list(io.read_records(path)) == [["abc"], ["a", "b"], ["c"]]
+
+
+def test_read_ints(tmp_path):
+    """Check integers are parsed across chunk boundaries and signs kept."""
+    numbers = [0, 7, -12, 1234567890123, -5, 42]
+    path = tmp_path / "ints.txt"
+    path.write_text("\n".join(str(n) for n in numbers) + "\n")
+    for chunk_size in (1, 5, io.CHUNK_SIZE):
+        assert io.read_ints(path, chunk_size).tolist() == numbers
+
+
+def test_read_ints_empty(tmp_path):
+    """Check an empty file gives an empty array."""
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    assert len(io.read_ints(path)) == 0
+
+
+def test_iter_ints(tmp_path):
+    """Check streamed integers match the ones read in bulk."""
+    numbers = [3, -1, 250, 0, 99]
+    path = tmp_path / "ints.txt"
+    path.write_text("\n".join(str(n) for n in numbers))
+    for chunk_size in (1, 4, io.CHUNK_SIZE):
+        assert list(io.iter_ints(path, chunk_size)) == numbers
+
+
+def test_long_ints(tmp_path):
+    """Check numbers too long for int64 are parsed exactly or rejected."""
+    numbers = [-(10**19) - 7, 12345678901234567890123, 9223372036854775807, 5]
+    path = tmp_path / "ints.txt"
+    path.write_text("\n".join(str(n) for n in numbers))
+    assert list(io.iter_ints(path)) == numbers
+    with pytest.raises(ValueError):
+        io.read_ints(path)
+    path.write_text("9223372036854775807 -9223372036854775807\n")
+    assert io.read_ints(path).tolist() == [2**63 - 1, 1 - 2**63]
@@ -0,0 +1,42 @@
+"""Test profiling solvers."""
+import pstats
+import re
+import time
+import tracemalloc
+
+from advent import profiling
+from advent.day01 import main as day01
+
+
+def test_profile_reports_day_code(tmp_path):
+    """Check the profile report covers the day's functions and dumps stats."""
+    out = tmp_path / "day01.pstats"
+    result, report = profiling.profile(day01.part1, "advent.day01", out)
+    assert result == 1019571
+    assert "part1" in report
+    assert "day01" in report
+    assert pstats.Stats(str(out)).total_calls > 0
+
+
+def test_trace_allocations(tmp_path):
+    """Check the allocation report and snapshot dump."""
+    out = tmp_path / "day01.tracemalloc"
+    result, report = profiling.trace_allocations(day01.part2, "advent.day01", out)
+    assert result == 100655544
+    assert report.startswith("Peak traced memory")
+    assert not tracemalloc.is_tracing()
+    assert isinstance(tracemalloc.Snapshot.load(str(out)), tracemalloc.Snapshot)
+
+
+def test_trace_allocations_keeps_peak():
+    """Check a short-lived peak is in the kept snapshot, not just the leftovers."""
+
+    def spike():
+        block = bytearray(4 << 20)
+        time.sleep(0.05)
+        del block
+        return 0
+
+    _, report = profiling.trace_allocations(spike, "advent.day01")
+    sample = re.search(r"Largest sample: ([\d.]+) KiB", report)
+    assert float(sample.group(1)) >= 4 << 10
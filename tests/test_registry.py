@@ -0,0 +1,67 @@
+"""Test looking up and running solvers through the registry."""
+from pathlib import Path
+
+import pytest
+
+from advent import registry
+from advent.day01 import main as day01
+
+
+def test_get_returns_part_function():
+    """Check the registry resolves to the day's part function."""
+    assert registry.registry.get(1, 2) is day01.part2
+
+
+def test_get_is_cached():
+    """Check repeated lookups return the same cached solver."""
+    reg = registry.SolverRegistry()
+    assert reg.get(2, 1) is reg.get(2, 1)
+
+
+def test_missing_solver_raises():
+    """Check asking for a solver that doesn't exist raises an ImportError."""
+    reg = registry.SolverRegistry()
+    with pytest.raises(ImportError):
+        reg.get(1, 3)
+    assert (1, 3) not in reg
+    assert (1, 1) in reg
+
+
+def test_solve_relative_input():
+    """Check solving against a file in the day's folder."""
+    assert registry.solve(1, 1, "example.txt") == 514579
+
+
+def test_solve_absolute_input():
+    """Check solving against a file given as an absolute path."""
+    in_path = Path(day01.__file__).resolve().parent / "example.txt"
+    assert registry.solve(1, 2, in_path) == 241861950
+
+
+def test_solve_default_input():
+    """Check solving against the solver's default input."""
+    assert registry.solve(3, 1) == 162
+
+
+def test_register_override():
+    """Check explicitly registered solvers take precedence."""
+    reg = registry.SolverRegistry()
+    reg.register(1, 1, lambda: 42)
+    assert reg.solve(1, 1) == 42
+
+
+def test_solver_arguments():
+    """Check which solvers read a file and which can run with no arguments."""
+    assert registry.registry.reads_input(1, 1)
+    assert registry.registry.runs_alone(1, 1)
+    assert not registry.registry.reads_input(15, 1)
+    assert registry.registry.runs_alone(15, 1)
+    assert not registry.registry.reads_input(25, 1)
+    assert not registry.registry.runs_alone(25, 1)
+
+
+@pytest.mark.parametrize("day", [15, 23, 25])
+def test_solve_input_without_file_parameter(day):
+    """Check an input file isn't passed to a solver that takes other arguments."""
+    with pytest.raises(ValueError, match="doesn't read an input file"):
+        registry.solve(day, 1, "/tmp/input.txt")
@@ -0,0 +1,101 @@
+"""Test that synthetic inputs are reproducible and solvable."""
+import pytest
+
+from advent import synth
+from advent.day09 import main as day09_main
+from advent.registry import solve
+from advent.synth import day05
+
+
+@pytest.mark.parametrize(
+    "day,size",
+    [
+        (1, 50),
+        (2, 50),
+        (3, 50),
+        (4, 50),
+        (5, 50),
+        (6, 50),
+        (7, 30),
+        (8, 50),
+        (9, 60),
+        (10, 50),
+        (11, 10),
+        (12, 50),
+        (13, 5),
+        (14, 50),
+        (16, 50),
+        (18, 20),
+        (19, 20),
+        (20, 3),
+        (21, 20),
+        (22, 8),
+    ],
+)
+def test_solvable(tmp_path, day, size):
+    """Check both parts solve a generated input without errors."""
+    path = tmp_path / "input.txt"
+    synth.write_input(day, path, size, seed=1)
+    assert solve(day, 1, path) is not None
+    assert solve(day, 2, path) is not None
+
+
+def test_reproducible():
+    """Check the same seed gives the same input and a new seed a different one."""
+    assert list(synth.generate(12, 20, 3)) == list(synth.generate(12, 20, 3))
+    assert list(synth.generate(12, 20, 3)) != list(synth.generate(12, 20, 4))
+
+
+def test_day01_answers(tmp_path):
+    """Check the planted pair and trio are found."""
+    path = tmp_path / "input.txt"
+    synth.write_input(1, path, 1000, seed=2)
+    entries = [int(line) for line in synth.generate(1, 1000, seed=2)]
+    pair = [x * (2020 - x) for x in entries if x < 1010 and 2020 - x in entries]
+    assert solve(1, 1, path) == pair[0]
+
+
+def test_day05_missing_seat(tmp_path):
+    """Check part 2 finds the one seat left out."""
+    path = tmp_path / "input.txt"
+    synth.write_input(5, path, 500, seed=3)
+    seat_ids = {solve(5, 2, path)}
+    seat_ids.update(
+        int(code.translate(str.maketrans("FBLR", "0101")), 2)
+        for code in synth.generate(5, 500, seed=3)
+    )
+    assert seat_ids == set(range(min(seat_ids), max(seat_ids) + 1))
+
+
+def test_day05_encode():
+    """Check seat IDs encode to the puzzle's examples."""
+    assert day05.encode(567) == "BFFFBBFRRR"
+    assert day05.encode(820) == "BBFFBBFRLL"
+
+
+def test_day09_stays_in_64_bits(tmp_path):
+    """Check long series start over instead of outgrowing 64 bit integers."""
+    path = tmp_path / "input.txt"
+    synth.write_input(9, path, 5000, seed=1)
+    numbers = [int(line) for line in synth.generate(9, 5000, seed=1)]
+    assert len(numbers) == 5000
+    assert max(numbers) < 1 << 63
+    target = day09_main.first_invalid(numbers)
+    assert solve(9, 1, path) == target
+    assert solve(9, 2, path) == day09_main.encryption_weakness(numbers, target)
+
+
+@pytest.mark.parametrize("seed", [0, 2, 4])
+def test_day11_settles(tmp_path, seed):
+    """Check both parts finish on layouts big enough to flip back and forth."""
+    path = tmp_path / "input.txt"
+    synth.write_input(11, path, 200, seed=seed)
+    assert solve(11, 1, path) > 0
+    assert solve(11, 2, path) > 0
+
+
+def test_day25_too_small():
+    """Check a size too small for two different keys is rejected clearly."""
+    with pytest.raises(ValueError, match="at least 2"):
+        list(synth.generate(25, 1))
+    assert len(list(synth.generate(25, 2))) == 2